@@ -0,0 +1,119 @@
+"""
+Benchmark korpusu mmap w porównaniu z pulą słów z bazy: czas budowy/importu, otwarcia (wczytania puli),
+losowania słowa i przejścia wszystkich słów, pamięć zajęta przez obiekty Pythona po otwarciu oraz koszt
+indeksów gry (trudności i podpowiedzi — nad korpusem ranking z pliku i grupy tylko odpytanej kategorii).
+Słownik jest syntetyczny (--words słów w --categories kategoriach).
+
+Użycie: python bench_corpus.py [--words 1000000] [--categories 50] [--repeat 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import corpus
+from database import Database
+from difficulty import DifficultyIndex
+from importer import import_files
+from solver import PatternIndex
+from wordpool import WordPool
+
+LETTERS = "aąbcćdeęfghijklłmnńoóprsśtuwyzźż"
+
+
+def write_words(path, count, categories, rng):
+    """
+    Zapisuje count różnych słów: losowy początek i numer słowa zapisany literami.
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        for i in range(count):
+            word = ''.join(rng.choices(LETTERS, k=rng.randint(3, 8)))
+            number = i
+            while True:
+                word += LETTERS[number % len(LETTERS)]
+                number //= len(LETTERS)
+                if not number:
+                    break
+            file.write(f"{word};Kategoria {i % categories}\n")
+
+
+def timed(action):
+    start = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - start
+
+
+def opened(label, action):
+    """
+    Otwiera źródło słów, podając czas i (w drugim otwarciu, spowolnionym przez tracemalloc) przyrost
+    pamięci zaalokowanej przez Pythona.
+    """
+    pool, elapsed = timed(action)
+    del pool
+    tracemalloc.start()
+    pool = action()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"  {label:<12} open {elapsed * 1000:9.2f} ms   python heap {memory / 2 ** 20:8.2f} MiB")
+    return pool
+
+
+def access(pool, repeat, rng):
+    _, elapsed = timed(lambda: [pool.sample(rng=rng) for _ in range(repeat)])
+    print(f"  {'':<12} sample {elapsed / repeat * 1e6:7.2f} us/word", end='')
+    count, elapsed = timed(lambda: sum(1 for _ in pool.texts))
+    print(f"   scan {count / elapsed / 1e6:6.2f} M words/s")
+
+
+def indexed(pool, build):
+    """
+    Buduje indeksy gry i odpytuje grupę podpowiedzi jednej kategorii, podając czas i przyrost pamięci.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    difficulty, hints = build(pool)
+    difficulty.sample_band('hard')
+    hints.bucket(6, "Kategoria 0")
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"  {'':<12} indexes {elapsed * 1000:6.0f} ms   python heap {memory / 2 ** 20:8.2f} MiB")
+
+
+def main(words, categories, repeat):
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'words.txt')
+        write_words(source, words, categories, rng)
+        path = os.path.join(directory, 'words.corpus')
+        stats, elapsed = timed(lambda: corpus.build([source], path))
+        print(f"corpus: build {elapsed:.2f} s, {stats.added} words, {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+        db = Database(os.path.join(directory, 'users.db'), os.path.join(directory, 'words.db'))
+        stats, elapsed = timed(lambda: import_files(db, [source]))
+        print(f"sqlite: import {elapsed:.2f} s, {stats.added} words, "
+              f"{os.path.getsize(os.path.join(directory, 'words.db')) / 2 ** 20:.1f} MiB")
+
+        pool = opened("WordPool", lambda: WordPool(db.conn))
+        access(pool, repeat, rng)
+        indexed(pool, lambda pool: (DifficultyIndex(pool), PatternIndex(pool.texts, pool.categories)))
+        del pool
+        with opened("Corpus", lambda: corpus.Corpus(path)) as words_corpus:
+            access(words_corpus, repeat, rng)
+            indexed(words_corpus, lambda pool: (pool.difficulty_index(),
+                                                PatternIndex(pool.texts, pool.categories, pool.by_category)))
+        db.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', type=int, default=1_000_000)
+    parser.add_argument('--categories', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.words, args.categories, args.repeat)
@@ -0,0 +1,81 @@
+"""
+Mikrobenchmark ścieżek zapytań: start aplikacji, logowanie, doczytanie słów, ranking.
+Dla każdej ścieżki podaje medianę i p95 czasu oraz liczbę zapytań SQL.
+
+Użycie: python bench_db.py [--single-file] [--repeat 200]
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from database import Database
+from history import HistoryStore
+from importer import import_files
+from passwords import legacy_hash
+from stats import StatsStore
+from wordpool import WordPool
+
+WORDS_FILE = Path(__file__).resolve().parents[2] / 'hasla.txt'
+
+
+def measure(name, repeat, action, conn):
+    """
+    Mierzy wykonanie action i liczy zapytania wysłane na połączeniu conn.
+    """
+    statements = []
+    conn.set_trace_callback(statements.append)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        times.append((time.perf_counter() - start) * 1e6)
+    conn.set_trace_callback(None)
+    times.sort()
+    print(f"{name:<12} median {statistics.median(times):9.1f} us  p95 {times[int(len(times) * 0.95) - 1]:9.1f} us  "
+          f"{len(statements) / repeat:.1f} queries")
+
+
+def main(single_file, repeat):
+    with tempfile.TemporaryDirectory() as directory:
+        users_path = str(Path(directory, 'users.db'))
+        words_path = None if single_file else str(Path(directory, 'words.db'))
+
+        def startup():
+            db = Database(users_path, words_path)
+            HistoryStore(db.conn)
+            StatsStore(db.conn)
+            WordPool(db.conn)
+            db.close()
+
+        startup()
+        db = Database(users_path, words_path)
+        import_files(db, [WORDS_FILE])
+        conn = db.conn
+        with conn:
+            conn.execute("INSERT INTO users (username, password) VALUES (?, ?)", ("bench", legacy_hash("Bench123")))
+        pool = WordPool(conn)
+        stats = StatsStore(conn)
+        stats.record_game('normal', {"bench": 3})
+
+        start = time.perf_counter()
+        startup()
+        print(f"{'startup':<12} {(time.perf_counter() - start) * 1e3:.2f} ms")
+        measure('login', repeat, lambda: conn.execute("SELECT password FROM users WHERE username=?",
+                                                      ("bench",)).fetchone(), conn)
+        measure('word fetch', repeat, pool.sample, conn)
+        measure('pool sync', repeat, pool.refresh, conn)
+        measure('leaderboard', repeat, lambda: stats.leaderboard('normal'), conn)
+        db.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--single-file', action='store_true')
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    main(args.single_file, args.repeat)
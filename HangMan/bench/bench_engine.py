@@ -0,0 +1,61 @@
+"""
+Benchmark silnika gry: symuluje rundy bez Tk i podaje liczbę rund na minutę.
+
+Użycie: python bench_engine.py [liczba_rund]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from engine import HangmanEngine, Word, WON, LOST
+
+WORDS_FILE = Path(__file__).resolve().parents[2] / 'hasla.txt'
+ALPHABET = "aeioznrwstcykdpmujlłbgęhąóżśćfńqźvx"
+
+
+def load_words(path=WORDS_FILE):
+    """
+    Wczytuje słowa z pliku w formacie słowo;kategoria.
+
+    Returns:
+        list: lista obiektów Word.
+    """
+    words = []
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            parts = line.strip().split(';')
+            if len(parts) == 2:
+                words.append(Word(parts[0].strip().lower(), parts[1].strip().capitalize()))
+    return words
+
+
+def run(rounds, words, seed=0):
+    """
+    Rozgrywa zadaną liczbę rund w trybie czasowym, zgadując litery według częstości.
+
+    Returns:
+        float: czas wykonania w sekundach.
+    """
+    rng = random.Random(seed)
+    choice = rng.choice
+    engine = HangmanEngine(lambda: choice(words))
+    engine.start_singleplayer(True)
+    guess = engine.guess
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for letter in ALPHABET:
+            result = guess(letter)
+            if result == WON or result == LOST:
+                break
+        engine.score += result == WON
+        engine.new_round()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    elapsed = run(rounds, load_words())
+    print(f"{rounds} rounds in {elapsed:.3f}s -> {rounds / elapsed * 60:,.0f} rounds/min")
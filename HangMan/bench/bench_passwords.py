@@ -0,0 +1,43 @@
+"""
+Benchmark logowania: ile weryfikacji haseł na sekundę przy zadanych parametrach scrypta i liczbie wątków.
+
+Użycie: python bench_passwords.py [--n 16384] [--r 8] [--p 1] [--workers 4] [--logins 200]
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import passwords
+
+
+def run(n, r, p, workers, logins):
+    """
+    Wykonuje zadaną liczbę weryfikacji hasła w puli wątków.
+
+    Returns:
+        float: czas wykonania w sekundach.
+    """
+    stored = passwords.hash_password("Secret123", n, r, p)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda _: passwords.verify_password("Secret123", stored), range(logins)))
+    elapsed = time.perf_counter() - start
+    assert all(results)
+    return elapsed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n', type=int, default=passwords.SCRYPT_N)
+    parser.add_argument('--r', type=int, default=passwords.SCRYPT_R)
+    parser.add_argument('--p', type=int, default=passwords.SCRYPT_P)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--logins', type=int, default=200)
+    args = parser.parse_args()
+    elapsed = run(args.n, args.r, args.p, args.workers, args.logins)
+    print(f"scrypt n={args.n} r={args.r} p={args.p}, {args.workers} workers: "
+          f"{args.logins / elapsed:.1f} logins/s ({elapsed / args.logins * 1000:.1f} ms each)")
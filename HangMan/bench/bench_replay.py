@@ -0,0 +1,124 @@
+"""
+Benchmark dziennika rozgrywek: koszt zapisu próby w ReplayLog (na ścieżce gorącej make_guess), rozmiar
+dziennika oraz szybkość odczytu i odtworzenia sesji przez replay.verify. Sesje są rozgrywane bez interfejsu
+tak jak w Game.py (wszystkie tryby, także wpisy niepoprawne, koniec czasu i wznowienie z zapisu).
+
+Użycie: python bench_replay.py [--size 100000] [--sessions 2000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import replay
+import snapshot
+from bench_suite import make_corpus, percentile
+from engine import HangmanEngine, Word, WON, LOST
+from importer import parse_line
+from strategies import FrequencyStrategy
+
+MODES = ('normal', 'timed', 'multiplayer')
+PLAYERS = ["Ala", "Ola", "Ela"]
+
+
+def play(log, engine, strategy, rng, latencies, max_rounds=50):
+    """
+    Rozgrywa sesję jak Game.py, zapisując wpisy do dziennika; czas trybu czasowego to liczba prób.
+    """
+    timed = engine.mode == 'timed'
+    for _ in range(max_rounds):
+        while True:
+            guess = strategy.next_letter(engine.round) if rng.random() > 0.05 else rng.choice(["1", "ab", "?!"])
+            start = time.perf_counter_ns()
+            log.guess(guess)
+            latencies.append(time.perf_counter_ns() - start)
+            result = engine.guess(guess)
+            if result == WON or result == LOST:
+                break
+        if result == LOST and timed:
+            break
+        if not engine.after_round(result == WON):
+            break
+        if timed and rng.random() < 0.1:
+            log.time_up()
+            break
+    log.end(engine)
+
+
+def record(path, texts, categories, sessions, rng):
+    """
+    Zapisuje sessions sesji do dziennika path.
+
+    Returns:
+        list: czasy zapisu pojedynczych prób (ns).
+    """
+    log = replay.ReplayLog(path)
+
+    def word_source():
+        index = rng.randrange(len(texts))
+        entry = Word(texts[index], categories[index], index + 1)
+        log.word(entry)
+        return entry
+
+    strategy = FrequencyStrategy(texts)
+    latencies = []
+    for number in range(sessions):
+        mode = MODES[number % len(MODES)]
+        engine = HangmanEngine(word_source, max_tries=rng.randint(4, 10), fold=rng.random() < 0.3)
+        if number % 10 == 9:
+            engine.start_singleplayer(False)
+            data = snapshot.encode(engine, "gracz")
+            engine = HangmanEngine(word_source, engine.max_tries, engine.fold)
+            saved = snapshot.decode(data)
+            snapshot.restore(saved, engine, Word(saved.word, saved.category, saved.word_id))
+            log.resume(data)
+        elif mode == 'multiplayer':
+            log.start(mode, engine.fold, engine.max_tries, 0, "gracz", PLAYERS)
+            engine.start_multiplayer(PLAYERS)
+        else:
+            log.start(mode, engine.fold, engine.max_tries, 60 if mode == 'timed' else 0, "gracz")
+            engine.start_singleplayer(mode == 'timed')
+        play(log, engine, strategy, rng, latencies)
+    return latencies
+
+
+def main(size, sessions):
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory, 'corpus.txt')
+        make_corpus(size, path)
+        with open(path, encoding='utf-8') as file:
+            rows = [row for row in map(parse_line, file) if row]
+        texts = [word for word, _ in rows]
+        categories = [category for _, category in rows]
+        log_path = os.path.join(directory, 'replay.log')
+        start = time.perf_counter()
+        latencies = record(log_path, texts, categories, sessions, random.Random(0))
+        recorded = time.perf_counter() - start
+        latencies.sort()
+        print(f"recorded {sessions} sessions, {len(latencies)} guesses in {recorded:.2f} s; "
+              f"{os.path.getsize(log_path) / 1024:.0f} KiB ({os.path.getsize(log_path) / len(latencies):.1f} B/guess)")
+        print(f"log.guess p50 {percentile(latencies, 0.5)} ns  p99 {percentile(latencies, 0.99)} ns  "
+              f"max {latencies[-1] / 1e3:.1f} us")
+        with open(log_path, 'rb') as file:
+            data = file.read()
+    start = time.perf_counter()
+    read = list(replay.read(data))
+    parsed = time.perf_counter() - start
+    start = time.perf_counter()
+    mismatches = sum(replay.verify(session) is not None for session in read)
+    verified = time.perf_counter() - start
+    print(f"read {len(read)} sessions in {parsed * 1000:.1f} ms; replayed {len(read) / verified:,.0f} sessions/s, "
+          f"{mismatches} mismatches")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=100_000)
+    parser.add_argument('--sessions', type=int, default=2000)
+    args = parser.parse_args()
+    main(args.size, args.sessions)
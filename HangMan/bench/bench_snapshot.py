@@ -0,0 +1,56 @@
+"""
+Benchmark zapisu sesji: rozmiar bloku oraz czas serializacji, atomowego zapisu, odczytu i przywrócenia stanu.
+
+Użycie: python bench_snapshot.py [--repeat 1000] [--players 4]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import snapshot
+from engine import HangmanEngine, Word
+
+WORD = Word("konstantynopolitańczykowianeczka", "Miasta", 123456)
+
+
+def measure(label, repeat, action):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    print(f"  {label:<10} {(time.perf_counter() - start) / repeat * 1e6:>9.1f} us")
+
+
+def main(repeat, players):
+    engine = HangmanEngine(lambda: WORD)
+    for mode in ('timed', 'multiplayer'):
+        if mode == 'timed':
+            engine.start_singleplayer(True)
+        else:
+            engine.start_multiplayer([f"Player {i + 1}" for i in range(players)])
+        for letter in "aoetxq":
+            engine.guess(letter)
+        data = snapshot.encode(engine, "Ala", 42.5, 120)
+        print(f"{mode}: {len(data)} bytes")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'session.snap')
+            measure("encode", repeat, lambda: snapshot.encode(engine, "Ala", 42.5, 120))
+            measure("save", repeat, lambda: snapshot.save(path, data))
+            measure("load", repeat, lambda: snapshot.load(path))
+            saved = snapshot.load(path)
+            restored = HangmanEngine(lambda: WORD)
+            measure("restore", repeat, lambda: snapshot.restore(saved, restored, WORD))
+        assert restored.round.display == engine.round.display and restored.round.guessed == engine.round.guessed
+        assert restored.round.remaining == engine.round.remaining and restored.scores == engine.scores
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=1000)
+    parser.add_argument('--players', type=int, default=4)
+    args = parser.parse_args()
+    main(args.repeat, args.players)
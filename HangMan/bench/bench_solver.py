@@ -0,0 +1,77 @@
+"""
+Benchmark podpowiedzi: czas budowy indeksu wzorców i opóźnienie PatternIndex.hint dla stanów rund
+w trakcie gry, z grupami według (długość, kategoria) oraz — przypadek najgorszy — tylko według długości.
+Korpus jak w bench_suite (hasla.txt uzupełnione słowami syntetycznymi).
+
+Użycie: python bench_solver.py [--size 1000000] [--rounds 2000]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from bench_suite import make_corpus, percentile
+from engine import HangmanEngine, Word, WON, LOST
+from importer import parse_line
+from solver import PatternIndex
+
+
+def states(texts, categories, rounds, rng):
+    """
+    Zwraca rundy w losowych momentach gry (kilka trafionych i nietrafionych liter).
+    """
+    result = []
+    for _ in range(rounds):
+        index = rng.randrange(len(texts))
+        engine = HangmanEngine(lambda: Word(texts[index], categories[index], index + 1), max_tries=20)
+        engine.start_singleplayer(False)
+        for letter in rng.sample("aeioznrwstcykdpmulj", rng.randint(0, 6)):
+            if engine.guess(letter) in (WON, LOST):
+                break
+        result.append(engine.round)
+    return result
+
+
+def measure(label, texts, categories, rounds):
+    start = time.perf_counter()
+    index = PatternIndex(texts, categories)
+    grouped = time.perf_counter() - start
+    start = time.perf_counter()
+    for state in rounds:
+        index.bucket(len(state.display), state.category)
+    built = time.perf_counter() - start
+    times = []
+    for state in rounds:
+        start = time.perf_counter_ns()
+        index.hint(state)
+        times.append(time.perf_counter_ns() - start)
+    times.sort()
+    print(f"{label:<22} groups {grouped:6.2f} s, buckets {len(index.buckets):>4} built in {built:6.2f} s;  hint "
+          f"p50 {percentile(times, 0.5) / 1e3:7.1f} us  p99 {percentile(times, 0.99) / 1e3:7.1f} us  "
+          f"max {times[-1] / 1e3:7.1f} us")
+
+
+def main(size, rounds):
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory, 'corpus.txt')
+        make_corpus(size, path)
+        with open(path, encoding='utf-8') as file:
+            rows = [row for row in map(parse_line, file) if row]
+    texts = [word for word, _ in rows]
+    categories = [category for _, category in rows]
+    sample = states(texts, categories, rounds, random.Random(0))
+    print(f"{len(texts):,} words, {rounds} rounds")
+    measure("(length, category)", texts, categories, sample)
+    measure("length only", texts, None, sample)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=1_000_000)
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+    main(args.size, args.rounds)
@@ -0,0 +1,99 @@
+"""
+Benchmark startu aplikacji: czas importu Game.py (raport jak python -X importtime) oraz czas do pierwszej
+klatki okna logowania, porównywany z budżetem zimnego startu kiosku. Każde uruchomienie to nowy proces
+w pustym katalogu (bez users.db i words.db).
+
+Użycie: python bench_startup.py [--runs 5] [--top 15] [--budget 300]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+BUDGET_MS = 300
+
+FRAME_SCRIPT = """
+import time
+start = time.perf_counter()
+import tkinter as tk
+import Game
+imported = time.perf_counter()
+root = tk.Tk()
+app = Game.HangmanGame(root)
+root.update()
+frame = time.perf_counter()
+import os
+print(imported - start, frame - start, sum(os.path.exists(name) for name in (Game.USERS_DB, Game.WORDS_DB)))
+root.destroy()
+"""
+
+
+def run_python(args, directory):
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, *args], cwd=directory, env=env, capture_output=True, text=True)
+    return result, time.perf_counter() - start
+
+
+def import_report(directory, top):
+    """
+    Importuje Game w nowym procesie z -X importtime i wypisuje moduły najdroższe łącznie z zależnościami.
+
+    Returns:
+        float: łączny czas importu Game w ms.
+    """
+    result, _ = run_python(['-X', 'importtime', '-c', 'import Game'], directory)
+    rows = []
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        self_us, cumulative_us = int(self_us), int(cumulative_us)
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        if name == 'Game':
+            total = cumulative_us / 1000
+        elif depth == 1:
+            rows.append((cumulative_us, self_us, name))
+    print(f"import Game: {total:.1f} ms; top direct imports (cumulative / self):")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {name:<28} {cumulative_us / 1000:>7.2f} ms  {self_us / 1000:>6.2f} ms")
+    return total
+
+
+def first_frame(directory, runs, budget):
+    """
+    Mierzy czas od początku skryptu do narysowania okna logowania (root.update) oraz czas całego procesu.
+    """
+    imports, frames, processes = [], [], []
+    for _ in range(runs):
+        result, elapsed = run_python(['-c', FRAME_SCRIPT], directory)
+        if result.returncode:
+            print("first frame: not measured (" + result.stderr.strip().splitlines()[-1] + ")")
+            return
+        imported, frame, databases = result.stdout.split()
+        imports.append(float(imported) * 1000)
+        frames.append(float(frame) * 1000)
+        processes.append(elapsed * 1000)
+    frame = statistics.median(frames)
+    print(f"first frame: imports {statistics.median(imports):.1f} ms, login window {frame:.1f} ms, "
+          f"whole process {statistics.median(processes):.1f} ms (median of {runs})")
+    print(f"database files created before first frame: {databases}")
+    print(f"budget {budget} ms: {'OK' if frame <= budget else 'OVER'}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--budget', type=float, default=BUDGET_MS, help="budżet czasu do pierwszej klatki (ms)")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        import_report(directory, args.top)
+        first_frame(directory, args.runs, args.budget)
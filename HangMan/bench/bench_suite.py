@@ -0,0 +1,112 @@
+"""
+Zestaw benchmarków: pełne sesje (normal, timed, multiplayer) rozgrywane bez Tk na korpusach różnej wielkości.
+
+Dla każdego rozmiaru korpusu i trybu raportuje rundy na sekundę, percentyle czasu pojedynczej próby,
+szczytowe zużycie pamięci oraz liczbę zapytań SQL. Korpus zaczyna się od hasla.txt i jest uzupełniany
+deterministycznie generowanymi słowami.
+
+Użycie: python bench_suite.py [--sizes 100 100000 1000000] [--strategy frequency] [--sessions 200] [--memory]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from database import Database
+from engine import HangmanEngine
+from importer import import_files, parse_line
+from simulation import play_session
+from strategies import STRATEGIES, letter_frequencies
+from wordpool import WordPool, ShuffleBag
+
+WORDS_FILE = Path(__file__).resolve().parents[2] / 'hasla.txt'
+PLAYERS = ["Ala", "Ola", "Ela", "Ula"]
+
+
+def make_corpus(size, path, seed=0):
+    """
+    Zapisuje korpus size słów w formacie słowo;kategoria: najpierw hasla.txt, potem słowa syntetyczne
+    o rozkładzie liter i długości zbliżonym do hasla.txt.
+    """
+    with open(WORDS_FILE, encoding='utf-8') as file:
+        base = [row for row in map(parse_line, file) if row]
+    rng = random.Random(seed)
+    counts = letter_frequencies(word for word, _ in base)
+    letters, weights = zip(*counts.items())
+    lengths = [len(word) for word, _ in base]
+    categories = sorted({category for _, category in base})
+    seen = set()
+    with open(path, 'w', encoding='utf-8') as file:
+        for word, category in base[:size]:
+            seen.add(word)
+            file.write(f"{word};{category}\n")
+        while len(seen) < size:
+            word = ''.join(rng.choices(letters, weights, k=rng.choice(lengths)))
+            if word not in seen:
+                seen.add(word)
+                file.write(f"{word};{rng.choice(categories)}\n")
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def run_mode(pool, strategy, mode, sessions, trace_memory, seed):
+    """
+    Rozgrywa sessions sesji w danym trybie i wypisuje wyniki.
+    """
+    bag = ShuffleBag(pool, rng=random.Random(seed))
+    engine = HangmanEngine(bag.draw)
+    latencies = []
+    rounds = 0
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(sessions):
+        result = play_session(engine, strategy, mode, players=PLAYERS, time_limit=120, latencies=latencies)
+        rounds += result.rounds
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    if trace_memory:
+        tracemalloc.stop()
+    latencies.sort()
+    print(f"  {mode:<12} {rounds / elapsed:>12,.0f} rounds/s  guess p50 {percentile(latencies, 0.5):>5} ns  "
+          f"p95 {percentile(latencies, 0.95):>5} ns  p99 {percentile(latencies, 0.99):>6} ns"
+          + (f"  peak {peak / 1024:,.0f} KiB" if trace_memory else ""))
+
+
+def main(sizes, strategy_name, sessions, trace_memory):
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            corpus = Path(directory, 'corpus.txt')
+            make_corpus(size, corpus)
+            db = Database(str(Path(directory, 'users.db')), str(Path(directory, 'words.db')))
+            start = time.perf_counter()
+            import_files(db, [corpus])
+            imported = time.perf_counter() - start
+            statements = []
+            db.conn.set_trace_callback(statements.append)
+            pool = WordPool(db.conn)
+            loaded = len(statements)
+            strategy = STRATEGIES[strategy_name](pool.texts, seed=0)
+            print(f"{size:,} words (import {imported:.2f}s), strategy {strategy_name}")
+            for mode in ('normal', 'timed', 'multiplayer'):
+                run_mode(pool, strategy, mode, sessions, trace_memory, seed=size)
+            print(f"  db queries: {loaded} to load the pool, {len(statements) - loaded} during sessions")
+            db.conn.set_trace_callback(None)
+            db.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 100_000, 1_000_000])
+    parser.add_argument('--strategy', choices=sorted(STRATEGIES), default='frequency')
+    parser.add_argument('--sessions', type=int, default=200)
+    parser.add_argument('--memory', action='store_true', help="mierz szczytową pamięć (tracemalloc, wolniej)")
+    args = parser.parse_args()
+    main(args.sizes, args.strategy, args.sessions, args.memory)
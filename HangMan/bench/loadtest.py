@@ -0,0 +1,115 @@
+"""
+Test obciążeniowy serwera multiplayer: wiele pokoi naraz, w każdym kilku graczy zgadujących litery
+według częstości. Raportuje liczbę prób na sekundę i percentyle opóźnienia (wysłanie próby -> stan pokoju).
+
+Użycie: python loadtest.py [--rooms 1000] [--players 2] [--host 127.0.0.1] [--port 8765] [--spawn]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from server import HangmanServer, file_word_source
+from strategies import ALPHABET
+
+WORDS_FILE = Path(__file__).resolve().parents[2] / 'hasla.txt'
+ORDER = "aoeizinrwstcykdpmujlłbgęhąóżśćfńqźvx" + ALPHABET
+
+
+async def send(writer, payload):
+    writer.write(json.dumps(payload).encode() + b'\n')
+    await writer.drain()
+
+
+async def receive(reader):
+    return json.loads(await reader.readline())
+
+
+async def play(reader, writer, name, latencies):
+    """
+    Jeden gracz: śledzi litery użyte w bieżącej rundzie i zgaduje, gdy przychodzi jego tura.
+    """
+    guessed = set()
+    sent_at = None
+    while True:
+        message = await receive(reader)
+        event = message["event"]
+        if event == "over":
+            return
+        if event != "state":
+            continue
+        if sent_at is not None:
+            latencies.append(time.perf_counter() - sent_at)
+            sent_at = None
+        if message.get("word") is not None:
+            guessed = set()
+        elif message.get("letter"):
+            guessed.add(message["letter"])
+        if message["turn"] == name:
+            letter = next(letter for letter in ORDER if letter not in guessed)
+            sent_at = time.perf_counter()
+            await send(writer, {"op": "guess", "letter": letter})
+
+
+async def run_room(host, port, players, ready, go, latencies):
+    """
+    Otwiera połączenia graczy, tworzy pokój, czeka na sygnał startu i rozgrywa jedną grę.
+    """
+    connections = [await asyncio.open_connection(host, port) for _ in range(players)]
+    reader, writer = connections[0]
+    await send(writer, {"op": "create"})
+    room_id = (await receive(reader))["room"]
+    for seat, (reader, writer) in enumerate(connections):
+        await send(writer, {"op": "join", "room": room_id, "name": f"p{seat}"})
+    for seat, (reader, _) in enumerate(connections):
+        for _ in range(players - seat):
+            await receive(reader)
+    ready.put_nowait(room_id)
+    await go.wait()
+    await send(connections[0][1], {"op": "start"})
+    await asyncio.gather(*(play(reader, writer, f"p{seat}", latencies)
+                           for seat, (reader, writer) in enumerate(connections)))
+    for _, writer in connections:
+        writer.close()
+
+
+async def main(host, port, rooms, players, spawn):
+    tcp = None
+    if spawn:
+        tcp = await HangmanServer(file_word_source(WORDS_FILE)).serve(host, port)
+    latencies = []
+    ready = asyncio.Queue()
+    go = asyncio.Event()
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(run_room(host, port, players, ready, go, latencies)) for _ in range(rooms)]
+    for _ in range(rooms):
+        await ready.get()
+    setup = time.perf_counter() - start
+    start = time.perf_counter()
+    go.set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    pick = lambda q: latencies[min(len(latencies) - 1, int(len(latencies) * q))] * 1000
+    print(f"{rooms} rooms x {players} players (setup {setup:.2f}s): {len(latencies)} guesses in {elapsed:.2f}s "
+          f"-> {len(latencies) / elapsed:,.0f} guesses/s")
+    print(f"latency p50 {pick(0.5):.2f} ms  p95 {pick(0.95):.2f} ms  p99 {pick(0.99):.2f} ms  "
+          f"max {latencies[-1] * 1000:.2f} ms")
+    if tcp is not None:
+        tcp.close()
+        await tcp.wait_closed()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rooms', type=int, default=1000)
+    parser.add_argument('--players', type=int, default=2)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--spawn', action='store_true', help="uruchom serwer w tym samym procesie")
+    args = parser.parse_args()
+    asyncio.run(main(args.host, args.port, args.rooms, args.players, args.spawn))
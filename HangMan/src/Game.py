@@ -1,78 +1,86 @@
 import os
+import sys
 import tkinter as tk
-from tkinter import messagebox, simpledialog, filedialog
-import time
-import sqlite3
-import hashlib
-import re
+from tkinter import messagebox
+import math
+
+from engine import HangmanEngine, Word, MAX_TRIES, INVALID, REPEATED, WON, LOST
+from database import Database
+from renderer import GallowsCanvas
+from scheduler import DeadlineTimer, TICK_RESOLUTION
+from metrics import Metrics
+from workers import IOExecutor
+
+# Moduły niepotrzebne do narysowania okna logowania (hashlib, json/csv, gzip, concurrent.futures, ...)
+# są importowane w metodach, które ich używają — patrz bench/bench_startup.py.
+
+USERS_DB = 'users.db'
+WORDS_DB = 'words.db'
+SNAPSHOT_FILE = 'session.snap'
+REPLAY_FILE = 'replay.log'
+METRICS_FILE = 'metrics.prom'
+PROFILE_FILE = 'hangman.prof'
+HOT_PATHS = ('login_user', 'finish_login', 'get_random_word', 'prefetch_word', 'display_game', 'show_round',
+             'draw_hangman', 'make_guess', 'show_hint', 'record_game', 'update_timer', 'time_up')
+ADAPTIVE_STEP = 3
+ADAPTIVE_RETRIES = 5
+RETRY_DELAY = 200
 
 
-MAX_TRIES = 6
-
 class HangmanGame:
-    def __init__(self, root):
+    def __init__(self, root, keep_words=False, metrics=False, profile=False, corpus=None):
         """
         Inicjalizuje grę i ustawia wartości domyślne, np. tryb gry, liczba graczy, słowo do zgadnięcia, historia, itp.
 
         Args:
             root (tkinter): instancja tk.Tk() — główne okno aplikacji.
+            keep_words (bool): zachowuje words.db po zamknięciu, żeby kolejne uruchomienie nie wymagało importu.
+            metrics (bool): mierzy czasy gorących ścieżek i liczbę zapytań SQL od startu (zrzut do METRICS_FILE).
+            profile (bool): profiluje całe uruchomienie cProfile i tracemalloc (zapis do PROFILE_FILE).
+            corpus (str): plik korpusu (corpus.py) używany zamiast słów z bazy.
         """
+        self.metrics = Metrics(metrics)
+        self.metrics.instrument(self, HOT_PATHS)
+        if profile:
+            self.metrics.start_profile()
         self.root = root
+        self.keep_words = keep_words
+        self.corpus = corpus
         self.root.title("Hangman Game")
         self.root.geometry("500x600")
-        self.mode = None
         self.players = 1
-        self.score = 0
-        self.scores = []
-        self.active_players = []
         self.time_limit = 0
-        self.end_time = 0
+        self.timer = None
         self.timer_label = None
-        self.timer_running = False
-        self.current_player = 0
-        self.word = ""
-        self.guessed = set()
-        self.tries = MAX_TRIES
         self.canvas = None
         self.score_label = None
+        self.game_screen = False
+        self.category_label = None
         self.username = ""
         self.player_names = []
-        self.history = []
-        self.current_category = ""
-
-        self.connU = sqlite3.connect('users.db')
-        self.connW = sqlite3.connect('words.db')
-        self.create_user_table()
-        self.create_word_table()
+        self.engine = HangmanEngine(self.get_random_word)
+        self.ignore_diacritics = tk.BooleanVar(root, value=False)
+
+        self.io = IOExecutor(root)
+        self.io.poll = self.metrics.wrap('io_poll', self.io.poll)
+        # Historia i statystyki: jeden wątek, więc zapisy i odczyty wykonują się w kolejności zlecenia.
+        self.store_io = IOExecutor(root, max_workers=1)
+        self.store_io.poll = self.metrics.wrap('store_poll', self.store_io.poll)
+        self.db = Database(USERS_DB, WORDS_DB, trace=self.metrics.sql_trace if metrics else None)
+        self.history = None
+        self.stats = None
+        self.replay = None
+        self.word_pool = None
+        self.word_bag = None
+        self.difficulty_index = None
+        self.difficulty_pending = False
+        self.pattern_index = None
+        self.hints_pending = False
+        self.bucket_pending = False
+        self.used_words = set()
+        self.next_word = None
         self.show_login_window()
 
-    def create_word_table(self):
-        """
-        Tworzy tablicę słów.
-        """
-        cursor = self.connW.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS words (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                text TEXT UNIQUE NOT NULL,
-                category TEXT NOT NULL
-            )
-        """)
-        self.connW.commit()
-
-    def create_user_table(self):
-        """
-        Tworzy tablicę użytkowników.
-        """
-        cursor = self.connU.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                username TEXT PRIMARY KEY,
-                password TEXT NOT NULL
-            )
-        ''')
-        self.connU.commit()
-
     def show_login_window(self):
         """
         Pokazuje okno logowania.
@@ -88,12 +96,13 @@ class HangmanGame:
         self.login_password_entry = tk.Entry(self.root, show="*")
         self.login_password_entry.pack(pady=5)
 
-        tk.Button(self.root, text="Login", command=self.login_user).pack(pady=10)
+        self.login_button = tk.Button(self.root, text="Login", command=self.login_user)
+        self.login_button.pack(pady=10)
         tk.Button(self.root, text="Register", command=self.show_register_window).pack()
 
     def login_user(self):
         """
-        System logowania.
+        System logowania; odczyt użytkownika i weryfikacja hasła działają w wątku roboczym.
         """
         username = self.login_username_entry.get().strip()
         password = self.login_password_entry.get().strip()
@@ -102,16 +111,216 @@ class HangmanGame:
             messagebox.showwarning("Input error", "Please enter username and password.")
             return
 
-        cursor = self.connU.cursor()
-        cursor.execute("SELECT password FROM users WHERE username=?", (username,))
-        row = cursor.fetchone()
+        self.login_button.config(state=tk.DISABLED, text="Logging in...")
+        task = self.io.submit(self.check_credentials, username, password,
+                              callback=lambda valid: self.finish_login(username, valid),
+                              on_error=lambda e: self.task_failed(e, self.login_button, "Login"))
+        if task is None:
+            self.show_busy(self.login_button, "Login")
+
+    def check_credentials(self, username, password):
+        """
+        Sprawdza hasło i w razie potrzeby zapisuje nowy skrót (wykonywane w wątku roboczym na jego połączeniu).
 
-        if row and row[0] == self.hash_password(password):
+        Returns:
+            bool: czy hasło jest poprawne.
+        """
+        import passwords
+        conn = self.db.conn
+        row = conn.execute("SELECT password FROM users WHERE username=?", (username,)).fetchone()
+        valid, new_hash = passwords.check_login(password, row[0] if row else None)
+        if new_hash:
+            with conn:
+                conn.execute("UPDATE users SET password=? WHERE username=?", (new_hash, username))
+        return valid
+
+    def task_failed(self, error, button=None, text=None):
+        """
+        Pokazuje błąd zadania z wątku roboczego i odblokowuje przycisk, który je uruchomił.
+        """
+        messagebox.showerror("Error", f"Operation failed: {error}")
+        if button is not None and button.winfo_exists():
+            button.config(state=tk.NORMAL, text=text)
+
+    def show_busy(self, button=None, text=None):
+        """
+        Informuje, że IOExecutor ma już komplet zadań (submit zwrócił None), i odblokowuje przycisk.
+        """
+        messagebox.showwarning("Busy", "Too many operations in progress, try again later.")
+        if button is not None and button.winfo_exists():
+            button.config(state=tk.NORMAL, text=text)
+
+    def submit_later(self, function, executor=None, **callbacks):
+        """
+        Zleca zadanie, którego nie można porzucić (np. wczytanie słów): gdy limit zadań IOExecutor jest
+        osiągnięty, ponawia próbę po RETRY_DELAY ms.
+
+        Args:
+            executor (IOExecutor): wykonawca zadania, domyślnie self.io.
+        """
+        executor = self.io if executor is None else executor
+        if executor.submit(function, **callbacks) is None:
+            self.root.after(RETRY_DELAY, lambda: self.submit_later(function, executor, **callbacks))
+
+    def finish_login(self, username, valid):
+        """
+        Kończy logowanie po weryfikacji hasła w wątku roboczym.
+
+        Args:
+            username (str): nazwa użytkownika.
+            valid (bool): czy hasło jest poprawne.
+        """
+        if valid:
             self.username = username
             messagebox.showinfo("Success", f"Welcome, {username}!")
-            self.setup_menu()
+            self.open_stores()
         else:
             messagebox.showerror("Error", "Invalid username or password.")
+            if self.login_button.winfo_exists():
+                self.login_button.config(state=tk.NORMAL, text="Login")
+
+    def open_stores(self):
+        """
+        Otwiera historię i statystyki oraz wczytuje pulę słów w wątku roboczym — dopiero po zalogowaniu,
+        nie przy starcie. Menu pojawia się, gdy słowa są wczytane.
+        """
+        if self.word_pool is not None:
+            self.setup_menu()
+            return
+        from wordpool import WordPool, ShuffleBag
+        from history import HistoryStore
+        from stats import StatsStore
+        from replay import ReplayLog
+        self.history = HistoryStore(self.db.conn, batch_size=0)
+        self.stats = StatsStore(self.db.conn)
+        self.replay = ReplayLog(REPLAY_FILE)
+        if self.corpus:
+            from corpus import Corpus
+            try:
+                self.word_pool = Corpus(self.corpus)
+            except (OSError, ValueError) as e:
+                messagebox.showerror("Error", f"Failed to open word corpus, using the database:\n{e}")
+                self.corpus = None
+            else:
+                self.word_bag = ShuffleBag(self.word_pool)
+                self.words_loaded([])
+                return
+        self.word_pool = WordPool(self.db.conn, load=False)
+        self.word_bag = ShuffleBag(self.word_pool)
+        if self.login_button.winfo_exists():
+            self.login_button.config(text="Loading words...")
+        self.submit_later(lambda: self.word_pool.fetch(self.db.conn), callback=self.words_loaded,
+                          on_error=self.words_failed)
+
+    def words_failed(self, error):
+        """
+        Pula słów nie została wczytana: pokazuje błąd i odblokowuje logowanie, które otworzy ją od nowa.
+        """
+        self.word_pool = None
+        self.task_failed(error, self.login_button, "Login")
+
+    def words_loaded(self, rows):
+        """
+        Dopisuje wczytane słowa do puli, pokazuje menu i zleca budowę indeksów trudności i podpowiedzi w tle.
+
+        Args:
+            rows (list): wiersze z WordPool.fetch.
+        """
+        self.word_pool.extend(rows)
+        self.setup_menu()
+        self.offer_resume()
+        self.refresh_difficulty()
+        self.refresh_hints()
+
+    def refresh_difficulty(self):
+        """
+        Buduje indeks trudności, gdy pula ma już słowa (np. dopiero po pierwszym imporcie), albo dopisuje do
+        niego nowe słowa — w wątku roboczym, jedno zadanie naraz; słowa dodane w jego trakcie są dopisywane
+        zaraz po nim. Do tego czasu losowanie korzysta z poprzedniego stanu indeksu (albo z word_bag).
+        Korpus ma ranking trudności zapisany w pliku (Corpus.difficulty_index) — indeksu nie budujemy wtedy na
+        stercie; korpus bez rankingu losuje słowa trybu czasowego bez pasm trudności.
+        """
+        if self.corpus:
+            self.difficulty_index = self.word_pool.difficulty_index()
+            return
+        index = self.difficulty_index
+        size = len(self.word_pool)
+        if self.difficulty_pending or not size or (index is not None and index.indexed == size):
+            return
+        self.difficulty_pending = True
+        if index is None:
+            from difficulty import DifficultyIndex
+            self.submit_later(lambda: DifficultyIndex(self.word_pool, self.db.conn),
+                              callback=self.index_built, on_error=self.difficulty_refreshed)
+        else:
+            self.submit_later(lambda: index.refresh(self.db.conn),
+                              callback=self.difficulty_refreshed, on_error=self.difficulty_refreshed)
+
+    def index_built(self, index):
+        """
+        Przyjmuje indeks trudności zbudowany w wątku roboczym (do tego czasu tryb czasowy losuje bez pasm).
+        """
+        index.conn = self.db.conn
+        self.difficulty_index = index
+        self.difficulty_refreshed(len(self.word_pool))
+
+    def difficulty_refreshed(self, result):
+        """
+        Kończy budowę lub odświeżanie indeksu trudności i dopisuje słowa dodane w międzyczasie.
+
+        Args:
+            result (int): liczba słów albo wyjątek z wątku roboczego (indeks zostaje wtedy bez zmian).
+        """
+        self.difficulty_pending = False
+        if isinstance(result, Exception):
+            messagebox.showerror("Error", f"Failed to update the difficulty index: {result}")
+            return
+        self.refresh_difficulty()
+
+    def refresh_hints(self):
+        """
+        Zleca budowę indeksu wzorców do podpowiedzi albo dopisanie do niego nowych słów puli — w wątku
+        roboczym, jedno zadanie naraz (jak refresh_difficulty); słowa dodane w jego trakcie są dopisywane zaraz
+        po nim. Grupy zmienione przez odświeżenie są przebudowywane przy następnym zapytaniu. Nad korpusem
+        indeks grupuje słowa kategorii dopiero przy pierwszej podpowiedzi w niej, zamiast przechodzić cały plik.
+        """
+        index = self.pattern_index
+        size = len(self.word_pool)
+        if self.hints_pending or not size or (index is not None and index.indexed == size):
+            return
+        self.hints_pending = True
+        if index is None:
+            from solver import PatternIndex
+            by_category = self.word_pool.by_category if self.corpus else None
+            self.submit_later(lambda: PatternIndex(self.word_pool.texts, self.word_pool.categories, by_category),
+                              callback=self.hints_built, on_error=self.hints_failed)
+        else:
+            self.submit_later(index.refresh, callback=self.hints_refreshed, on_error=self.hints_failed)
+
+    def hints_built(self, index):
+        """
+        Przyjmuje indeks wzorców do podpowiedzi zbudowany w wątku roboczym.
+        """
+        self.pattern_index = index
+        self.hints_refreshed(index.indexed)
+
+    def hints_refreshed(self, added):
+        """
+        Kończy budowę lub odświeżanie indeksu wzorców i dopisuje słowa dodane w międzyczasie.
+
+        Args:
+            added (int): liczba dopisanych słów.
+        """
+        self.hints_pending = False
+        self.refresh_hints()
+
+    def hints_failed(self, error):
+        """
+        Indeks podpowiedzi nie powstał albo nie został odświeżony: podpowiedzi pozostają niedostępne (albo bez
+        nowych słów) do następnego doczytania słów.
+        """
+        self.hints_pending = False
+        messagebox.showerror("Error", f"Failed to update the hint index: {error}")
 
     def show_register_window(self):
         """
@@ -132,7 +341,8 @@ class HangmanGame:
         self.reg_confirm_password_entry = tk.Entry(self.root, show="*")
         self.reg_confirm_password_entry.pack(pady=5)
 
-        tk.Button(self.root, text="Register", command=self.register_user).pack(pady=10)
+        self.register_button = tk.Button(self.root, text="Register", command=self.register_user)
+        self.register_button.pack(pady=10)
         tk.Button(self.root, text="Back to Login", command=self.show_login_window).pack()
 
     def register_user(self):
@@ -159,26 +369,55 @@ class HangmanGame:
             )
             return
 
-        cursor = self.connU.cursor()
-        cursor.execute("SELECT username FROM users WHERE username=?", (username,))
-        if cursor.fetchone():
-            messagebox.showerror("Error", "Username already exists.")
-            return
+        self.register_button.config(state=tk.DISABLED)
+        task = self.io.submit(self.create_user, username, password, callback=self.finish_register,
+                              on_error=lambda e: self.task_failed(e, self.register_button, "Register"))
+        if task is None:
+            self.show_busy(self.register_button, "Register")
 
+    def create_user(self, username, password):
+        """
+        Haszuje hasło i zapisuje nowego użytkownika (wykonywane w wątku roboczym na jego połączeniu).
+
+        Returns:
+            bool: False, jeśli nazwa użytkownika jest zajęta.
+        """
+        import sqlite3
+        conn = self.db.conn
+        if conn.execute("SELECT 1 FROM users WHERE username=?", (username,)).fetchone():
+            return False
         hashed = self.hash_password(password)
-        cursor.execute("INSERT INTO users (username, password) VALUES (?, ?)", (username, hashed))
-        self.connU.commit()
+        try:
+            with conn:
+                conn.execute("INSERT INTO users (username, password) VALUES (?, ?)", (username, hashed))
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def finish_register(self, created):
+        """
+        Kończy rejestrację po zapisie użytkownika w wątku roboczym.
+
+        Args:
+            created (bool): czy konto zostało utworzone.
+        """
+        if not created:
+            messagebox.showerror("Error", "Username already exists.")
+            if self.register_button.winfo_exists():
+                self.register_button.config(state=tk.NORMAL)
+            return
         messagebox.showinfo("Success", "Registration successful! Please log in.")
         self.show_login_window()
 
     def hash_password(self, password):
         """
-        Haszuje hasła.
+        Haszuje hasła scryptem z solą (patrz moduł passwords).
 
         Returns:
             str: zhaszowane hasło
         """
-        return hashlib.sha256(password.encode()).hexdigest()
+        import passwords
+        return passwords.hash_password(password)
 
 
     def validate_password(self, password):
@@ -191,6 +430,7 @@ class HangmanGame:
         Returns:
             bool: True/False.
         """
+        import re
         if len(password) < 5 :
             return False
         if not re.search(r"[A-Z]", password):
@@ -214,36 +454,109 @@ class HangmanGame:
             tk.Label(self.root, text="Not logged in", font=("Helvetica", 12), fg="red").pack(pady=5)
         tk.Button(self.root, text="Singleplayer", width=25, height=2, command=self.singleplayer_menu).pack(pady=5)
         tk.Button(self.root, text="Multiplayer", width=25, height=2, command=self.multiplayer_menu).pack(pady=5)
+        tk.Checkbutton(self.root, text="Easy: ignore Polish diacritics (l = ł)",
+                       variable=self.ignore_diacritics).pack()
         tk.Button(self.root, text="Import words from file", width=25, height=2, command=self.import_words).pack(pady=5)
-        tk.Button(self.root, text="View session history", width=25, height=2, command=self.show_history_window).pack(pady=5)
-        tk.Button(self.root, text="Export session history", width=25, height=2, command=self.export_history).pack(pady=5)
+        tk.Button(self.root, text="View game history", width=25, height=2, command=self.show_history_window).pack(pady=5)
+        tk.Button(self.root, text="Export game history", width=25, height=2, command=self.export_history).pack(pady=5)
+        tk.Button(self.root, text="Leaderboard", width=25, height=2, command=self.show_leaderboard).pack(pady=5)
         tk.Button(self.root, text="Exit", width=25, height=2, command=self.root.quit).pack(pady=5)
+        self.root.bind("<Control-Shift-D>", lambda event: self.show_debug_panel())
+
+    def show_debug_panel(self):
+        """
+        Ukryty panel diagnostyczny (Ctrl+Shift+D w menu głównym): metryki gorących ścieżek, włączanie pomiarów,
+        zrzut metryk do pliku i profilowanie.
+        """
+        metrics = self.metrics
+        panel = tk.Toplevel(self.root)
+        panel.title("Debug")
+        text = tk.Label(panel, font=("Courier", 9), justify=tk.LEFT, anchor='w')
+        text.pack(padx=10, pady=10, fill='x')
+        buttons = tk.Frame(panel)
+        buttons.pack(pady=5)
+
+        def refresh():
+            state = "on" if metrics.enabled else "off"
+            lines = [f"Metrics: {state}  Profiling: {'on' if metrics.profiling else 'off'}"] + metrics.summary()
+            text.config(text="\n".join(lines))
+
+        def toggle():
+            metrics.enabled = not metrics.enabled
+            refresh()
+
+        def profile():
+            if metrics.profiling:
+                metrics.stop_profile(PROFILE_FILE)
+                messagebox.showinfo("Profile", f"Profile saved to {PROFILE_FILE}", parent=panel)
+            else:
+                metrics.start_profile()
+            refresh()
+
+        def dump():
+            metrics.dump(METRICS_FILE)
+            messagebox.showinfo("Metrics", f"Metrics saved to {METRICS_FILE}", parent=panel)
+
+        tk.Button(buttons, text="Toggle metrics", command=toggle).pack(side='left', padx=2)
+        tk.Button(buttons, text="Refresh", command=refresh).pack(side='left', padx=2)
+        tk.Button(buttons, text="Reset", command=lambda: (metrics.reset(), refresh())).pack(side='left', padx=2)
+        tk.Button(buttons, text="Dump", command=dump).pack(side='left', padx=2)
+        tk.Button(buttons, text="Start/stop profile", command=profile).pack(side='left', padx=2)
+        refresh()
 
     def import_words(self):
         """
-        Wczytywanie słów wraz z kategoriami do bazy danych z pliku txt.
+        Wczytywanie słów wraz z kategoriami do bazy danych z plików txt (lub .gz) w wątku roboczym.
+        W trybie korpusu import jest wyłączony — słowa z bazy nie byłyby losowane, dopóki korpus nie zostanie
+        przebudowany.
         """
-        file_path = filedialog.askopenfilename(title="Select Word List File", filetypes=[("Text files", "*.txt")])
-        if file_path:
-            try:
-                cursor = self.connW.cursor()
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    added = 0
-                    for line in file:
-                        parts = line.strip().split(';')
-                        if len(parts) != 2:
-                            continue
-                        word, category = parts[0].strip().lower(), parts[1].strip().capitalize()
-                        if word.isalpha():
-                            try:
-                                cursor.execute("INSERT INTO words (text, category) VALUES (?, ?)", (word, category))
-                                added += 1
-                            except sqlite3.IntegrityError:
-                                continue
-                self.connW.commit()
-                messagebox.showinfo("Success", f"Added {added} new words with categories.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load words: {e}")
+        if self.corpus:
+            messagebox.showinfo("Import words", f"Words are read from the corpus file {self.corpus}.\n"
+                                                "Rebuild it with corpus.py to add new words.")
+            return
+        from tkinter import filedialog
+        from importer import import_files
+        file_paths = filedialog.askopenfilenames(title="Select Word List Files",
+                                                 filetypes=[("Text files", "*.txt"), ("Gzip files", "*.gz")])
+        if not file_paths:
+            return
+        progress_window = tk.Toplevel(self.root)
+        progress_window.title("Importing words")
+        progress_label = tk.Label(progress_window, text="Starting import...", font=("Helvetica", 12))
+        progress_label.pack(padx=20, pady=10)
+
+        def show_progress(stats):
+            progress_label.config(text=f"Lines: {stats.lines}  Added: {stats.added}  ({stats.rate:,.0f} rows/s)")
+
+        def failed(error):
+            progress_window.destroy()
+            messagebox.showerror("Error", f"Failed to load words: {error}")
+
+        def done(stats):
+            progress_window.destroy()
+            self.refresh_words(f"Added {stats.added} new words with categories.")
+
+        task = self.io.submit(import_files, self.db, file_paths, callback=done, on_error=failed,
+                              on_progress=show_progress, on_cancel=progress_window.destroy, cancellable=True)
+        if task is None:
+            progress_window.destroy()
+            self.show_busy()
+            return
+        tk.Button(progress_window, text="Cancel", command=task.cancel).pack(pady=5)
+        progress_window.protocol("WM_DELETE_WINDOW", task.cancel)
+
+    def refresh_words(self, message):
+        """
+        Doczytuje nowe słowa w wątku roboczym, dopisuje je do puli, zleca budowę lub odświeżenie indeksów
+        trudności i podpowiedzi i pokazuje message.
+        """
+        def loaded(rows):
+            self.word_pool.extend(rows)
+            self.refresh_difficulty()
+            self.refresh_hints()
+            messagebox.showinfo("Success", message)
+
+        self.submit_later(lambda: self.word_pool.fetch(self.db.conn), callback=loaded, on_error=self.task_failed)
 
     def singleplayer_menu(self):
         """
@@ -258,7 +571,9 @@ class HangmanGame:
     def multiplayer_menu(self):
         """
         Pozwala ustawić liczbę graczy i ich imiona, przygotowuje grę multiplayer przy zalożeniu ze pierwszy gracz jest tym, na którego koncie jesteśmy zalogowani.
+        Imiona muszą być różne; statystyki i ranking zapisywane są tylko dla zalogowanego gracza (miejsce 0).
         """
+        from tkinter import simpledialog
         self.players = simpledialog.askinteger("Multiplayer", "Enter number of players (2+):", minvalue=2)
         if not self.players:
             return
@@ -267,11 +582,13 @@ class HangmanGame:
             if i == 0:
                 self.player_names.append(self.username)
             else:
-                name = simpledialog.askstring("Player Name", f"Enter name for Player {i + 1}:")
-                self.player_names.append(name if name else f"Player {i + 1}")
-        self.scores = [0] * self.players
-        self.active_players = [True] * self.players
-        self.current_player = -1
+                while True:
+                    name = simpledialog.askstring("Player Name", f"Enter name for Player {i + 1}:")
+                    name = name.strip() if name and name.strip() else f"Player {i + 1}"
+                    if name not in self.player_names:
+                        break
+                    messagebox.showwarning("Input error", f"Name '{name}' is already taken, choose another one.")
+                self.player_names.append(name)
         self.start_multiplayer()
 
     def start_singleplayer(self, timed):
@@ -286,146 +603,392 @@ class HangmanGame:
             self.show_login_window()
             return
 
-        self.mode = 'timed' if timed else 'normal'
-        self.score = 0
         if timed:
+            from tkinter import simpledialog
             self.time_limit = simpledialog.askinteger("Timed Mode", "Enter time limit (seconds):", minvalue=10)
             if not self.time_limit:
                 return
-            self.end_time = time.time() + self.time_limit
-            self.timer_running = True
-            self.next_word_timed()
-        else:
-            self.next_word()
+        self.word_bag.reset()
+        self.used_words = set()
+        self.next_word = None
+        self.engine.fold = self.ignore_diacritics.get()
+        self.replay.start('timed' if timed else 'normal', self.engine.fold, self.engine.max_tries,
+                          self.time_limit if timed else 0, self.username)
+        self.engine.start_singleplayer(timed)
+        self.show_round()
+        if timed:
+            self.timer = DeadlineTimer(self.root, self.time_limit, self.update_timer, self.time_up, TICK_RESOLUTION)
+            self.timer.start()
 
 
-    def start_multiplayer(self):
+    def save_session(self):
         """
-        Rozpoczyna grę lub turę dla następnego gracza w trybie multiplayer.
+        Zapisuje przerwaną grę do SNAPSHOT_FILE (wywoływane przy zamykaniu okna w trakcie rundy).
         """
-        if all(not active for active in self.active_players):
-            self.show_multiplayer_scores()
+        import snapshot
+        remaining = self.timer.remaining() if self.timer is not None else 0.0
+        snapshot.save(SNAPSHOT_FILE, snapshot.encode(self.engine, self.username, remaining, self.time_limit))
+
+    def offer_resume(self):
+        """
+        Proponuje wznowienie gry przerwanej przez zalogowanego gracza; zapis jest usuwany po odpowiedzi.
+        """
+        import snapshot
+        saved = snapshot.load(SNAPSHOT_FILE)
+        if saved is None or saved.username != self.username:
             return
+        os.remove(SNAPSHOT_FILE)
+        if saved.mode == 'timed' and saved.remaining <= 0:
+            return
+        if messagebox.askyesno("Resume", f"Resume your unfinished {saved.mode} game?"):
+            self.resume_session(saved)
 
-        start_index = self.current_player
-        while True:
-            self.current_player = (self.current_player + 1) % self.players
-            if self.active_players[self.current_player]:
-                break
-            if self.current_player == start_index:
-                self.show_multiplayer_scores()
-                return
+    def resume_session(self, saved):
+        """
+        Przywraca grę z zapisu: słowo bierze z puli (po id), a gdy go tam nie ma — z samego zapisu.
 
-        self.mode = 'multiplayer'
-        self.word = self.get_random_word()
-        self.guessed = set()
-        self.tries = MAX_TRIES
-        self.display_game(f"{self.player_names[self.current_player]}'s Turn")
+        Args:
+            saved (snapshot.Snapshot): odczytany stan sesji.
+        """
+        import snapshot
+        index = None if saved.word_id is None else self.word_pool.index_of(saved.word_id)
+        if index is not None and self.word_pool.texts[index] == saved.word:
+            entry = self.word_pool.word(index)
+        else:
+            entry = Word(saved.word, saved.category, saved.word_id)
+        snapshot.restore(saved, self.engine, entry)
+        self.replay.resume(snapshot.encode(self.engine, self.username, saved.remaining, saved.time_limit))
+        self.word_bag.reset()
+        self.next_word = None
+        self.used_words = {index} if index is not None else set()
+        self.player_names = list(saved.player_names)
+        self.time_limit = saved.time_limit
+        self.show_round()
+        if saved.mode == 'timed':
+            self.timer = DeadlineTimer(self.root, saved.remaining, self.update_timer, self.time_up, TICK_RESOLUTION)
+            self.timer.start()
+
+    def start_multiplayer(self):
+        """
+        Rozpoczyna grę multiplayer dla graczy wybranych w multiplayer_menu.
+        """
+        self.word_bag.reset()
+        self.next_word = None
+        self.engine.fold = self.ignore_diacritics.get()
+        self.replay.start('multiplayer', self.engine.fold, self.engine.max_tries, 0, self.username, self.player_names)
+        if self.engine.start_multiplayer(self.player_names):
+            self.show_round()
+        else:
+            self.show_multiplayer_scores()
 
     def export_history(self):
         """
-        Eksportuje historię gier do pliku .txt, którego nazwę samemu podajemy.
+        Eksportuje historię gier zalogowanego gracza do pliku .txt, .csv lub .jsonl, którego nazwę samemu podajemy.
+        Liczba wpisów i eksport są wykonywane w wątku store_io.
+        """
+        username = self.username
+        self.submit_later(lambda: self.history.count(username, conn=self.flush_stores()), self.store_io,
+                          callback=self.choose_export_file, on_error=self.task_failed)
+
+    def choose_export_file(self, total):
         """
-        if not self.history:
+        Pyta o plik docelowy i zleca eksport historii (o ile jest co eksportować).
+
+        Args:
+            total (int): liczba wpisów historii zalogowanego gracza.
+        """
+        if not total:
             messagebox.showinfo("Export History", "No history to export.")
             return
+        from tkinter import filedialog
         file_path = filedialog.asksaveasfilename(defaultextension=".txt",
-                                                 filetypes=[("Text files", "*.txt")],
+                                                 filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv"),
+                                                            ("JSON Lines files", "*.jsonl")],
                                                  title="Save History As")
         if not file_path:
             return
-        try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write("\n".join(self.history))
-            messagebox.showinfo("Success", f"History saved to {file_path}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save history:\n{e}")
+        username = self.username
+        task = self.store_io.submit(lambda: self.history.export(file_path, username, conn=self.flush_stores()),
+                                    callback=lambda written: messagebox.showinfo("Success",
+                                                                                 f"History saved to {file_path}"),
+                                    on_error=lambda e: messagebox.showerror("Error", f"Failed to save history:\n{e}"))
+        if task is None:
+            self.show_busy()
 
     def show_history_window(self):
         """
-        Pokazuje nowe okno z historią rozegranych gier.
+        Pokazuje nowe okno z historią rozegranych gier, gdy liczba wpisów i pierwsza strona zostaną odczytane
+        w wątku store_io.
+        """
+        from history import PAGE_SIZE
+        username = self.username
+
+        def first_page():
+            conn = self.flush_stores()
+            return self.history.count(username, conn=conn), self.history.page(None, PAGE_SIZE, username, conn=conn)
+
+        self.submit_later(first_page, self.store_io, on_error=self.task_failed,
+                          callback=lambda result: self.open_history_window(username, *result))
+
+    def open_history_window(self, username, total, rows):
+        """
+        Okno historii; kolejne strony są doczytywane w wątku store_io podczas przewijania, jedna naraz.
+
+        Args:
+            username (str): gracz, którego historię pokazujemy.
+            total (int): liczba wpisów.
+            rows (list): pierwsza strona (HistoryStore.page).
         """
-        if not self.history:
+        from history import PAGE_SIZE
+        if not total:
             messagebox.showinfo("History", "No history to show.")
             return
         history_window = tk.Toplevel(self.root)
         history_window.title("Game History")
         history_window.geometry("500x500")
-        tk.Label(history_window, text="Game History", font=("Helvetica", 16)).pack(pady=10)
-        text_area = tk.Text(history_window, wrap=tk.WORD, font=("Courier", 10))
-        text_area.pack(expand=True, fill='both', padx=10, pady=10)
-        scrollbar = tk.Scrollbar(text_area)
+        tk.Label(history_window, text=f"Game History ({total})", font=("Helvetica", 16)).pack(pady=10)
+        tk.Button(history_window, text="Close", command=history_window.destroy).pack(side='bottom', pady=5)
+        frame = tk.Frame(history_window)
+        frame.pack(expand=True, fill='both', padx=10, pady=10)
+        scrollbar = tk.Scrollbar(frame)
         scrollbar.pack(side='right', fill='y')
-        text_area.config(yscrollcommand=scrollbar.set)
-        scrollbar.config(command=text_area.yview)
-        text_area.insert(tk.END, "\n".join(self.history))
-        text_area.config(state=tk.DISABLED)
-        tk.Button(history_window, text="Close", command=history_window.destroy).pack(pady=5)
+        list_box = tk.Listbox(frame, font=("Courier", 10), activestyle='none')
+        list_box.pack(side='left', expand=True, fill='both')
+        scrollbar.config(command=list_box.yview)
+
+        last = [None]
+        loading = [False]
+
+        def add_rows(rows):
+            loading[0] = False
+            if not list_box.winfo_exists():
+                return
+            if rows:
+                last[0] = (rows[-1][0], rows[-1][5])
+            for row in rows:
+                list_box.insert(tk.END, row[4])
+
+        def page_failed(error):
+            loading[0] = False
+            self.task_failed(error)
+
+        def load_page():
+            if loading[0] or list_box.size() >= total:
+                return
+            loading[0] = True
+            after = last[0]
+            self.submit_later(lambda: self.history.page(after, PAGE_SIZE, username, conn=self.db.conn),
+                              self.store_io, callback=add_rows, on_error=page_failed)
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            if float(last) > 0.9:
+                load_page()
+
+        list_box.config(yscrollcommand=on_scroll)
+        add_rows(rows)
+
+    def record_game(self, summary):
+        """
+        Zapisuje zakończoną rozgrywkę w historii i statystykach zalogowanego gracza (bufory magazynów są
+        zapisywane w wątku store_io) oraz w dzienniku rozgrywek. Pozostali gracze multiplayer to goście bez kont
+        (imiona wpisane przy jednym komputerze), więc ich wyniki nie trafiają do rankingu kont.
+
+        Args:
+            summary (str): opis rozgrywki.
+        """
+        engine = self.engine
+        score = engine.scores[0] if engine.mode == 'multiplayer' else engine.score
+        self.history.add(self.username, engine.mode, score, summary)
+        self.stats.record_game(engine.mode, {self.username: score})
+        self.submit_later(self.flush_stores, self.store_io, on_error=self.task_failed)
+        self.replay.end(engine)
+
+    def flush_stores(self):
+        """
+        Zapisuje bufory historii i statystyk połączeniem bieżącego wątku (zwykle wątku store_io); wpisy, których
+        nie udało się zapisać, zostają w buforach do następnej próby.
+
+        Returns:
+            sqlite3.Connection: połączenie bieżącego wątku, do odczytów po zapisie.
+        """
+        conn = self.db.conn
+        self.history.flush(conn)
+        self.stats.flush(conn)
+        return conn
+
+    def show_leaderboard(self, mode='normal'):
+        """
+        Pokazuje ranking najlepszych wyników w wybranym trybie oraz statystyki zalogowanego gracza; dane są
+        odczytywane w wątku store_io.
+
+        Args:
+            mode (str): 'normal', 'timed' albo 'multiplayer'.
+        """
+        self.clear_window()
+        tk.Label(self.root, text="Leaderboard", font=("Helvetica", 20)).pack(pady=10)
+        modes = tk.Frame(self.root)
+        modes.pack(pady=5)
+        for name in ('normal', 'timed', 'multiplayer'):
+            tk.Button(modes, text=name.capitalize(), width=10, relief=tk.SUNKEN if name == mode else tk.RAISED,
+                      command=lambda name=name: self.show_leaderboard(name)).pack(side='left', padx=2)
+        board = tk.Label(self.root, text="Loading...", font=("Courier", 10), justify=tk.LEFT)
+        board.pack(pady=10)
+        mine = tk.Label(self.root, font=("Courier", 9), justify=tk.LEFT)
+        if self.username:
+            mine.pack(pady=5)
+        tk.Button(self.root, text="Back", width=20, height=2, command=self.setup_menu).pack(pady=5)
+
+        username = self.username
+
+        def fetch():
+            conn = self.flush_stores()
+            if not username:
+                return self.stats.leaderboard(mode, conn=conn), [], []
+            return (self.stats.leaderboard(mode, conn=conn), self.stats.user_summary(username, conn),
+                    self.stats.category_accuracy(username, conn))
+
+        self.submit_later(fetch, self.store_io, on_error=self.task_failed,
+                          callback=lambda result: self.fill_leaderboard(board, mine, username, *result))
+
+    def fill_leaderboard(self, board, mine, username, leaders, summary, categories):
+        """
+        Wypełnia ekran rankingu odczytanymi danymi, chyba że użytkownik zdążył go już opuścić.
+        """
+        if not board.winfo_exists():
+            return
+        lines = [f"{'#':>2} {'Player':<16}{'Best':>5}{'Games':>6}{'Solved':>8}"]
+        for place, (player, best, games, solved) in enumerate(leaders, start=1):
+            lines.append(f"{place:>2} {player[:16]:<16}{best:>5}{games:>6}{solved:>7.0f}%")
+        if len(lines) == 1:
+            lines.append("No games played yet.")
+        board.config(text="\n".join(lines))
+
+        if username:
+            lines = [f"Your stats ({username})"]
+            for game_mode, games, best, solved, tries_left, streak in summary:
+                lines.append(f"{game_mode:<12} games {games}, best {best}, solved {solved:.0f}%, "
+                             f"tries left {tries_left:.1f}, streak {streak}")
+            for category, rounds, solved in categories:
+                lines.append(f"  {category[:20]:<20} {rounds:>5} words, {solved:.0f}% solved")
+            mine.config(text="\n".join(lines))
 
     def display_game(self, title):
         """
         Wyświetla główny ekran gry (pole do wpisu liter, wisielec, słowo).
+        Widgety są tworzone raz na sesję, a przy kolejnych słowach tylko aktualizowane.
         Args:
             title (str): Tytuł wyświetlany nad grą
         """
+        engine = self.engine
+        if not self.game_screen:
+            self.build_game_screen()
+        self.title_label.config(text=title)
+        if self.category_label is not None:
+            self.category_label.config(text=f"Category: {engine.round.category}")
+        self.word_label.config(text=self.get_display_word())
+        self.status_label.config(text=f"Tries left: {engine.round.tries}")
+        self.score_label.config(text=f"Score: {engine.score}" if engine.mode != 'multiplayer' else f"{engine.player_names[engine.current_player]}'s Score: {engine.scores[engine.current_player]}")
+        self.entry.delete(0, tk.END)
+        self.entry.focus_set()
+        self.hint_label.config(text="")
+        self.draw_hangman()
+
+    def build_game_screen(self):
+        """
+        Tworzy widgety ekranu gry; pozostają w oknie aż do następnego clear_window.
+        """
         self.clear_window()
-        tk.Label(self.root, text=title, font=("Helvetica", 16)).pack(pady=10)
-        if self.mode == 'timed':
+        self.title_label = tk.Label(self.root, text="", font=("Helvetica", 16))
+        self.title_label.pack(pady=10)
+        if self.engine.mode == 'timed':
             self.timer_label = tk.Label(self.root, text="", font=("Helvetica", 12))
             self.timer_label.pack()
-            self.category_label = tk.Label(self.root, text=f"Category: {self.current_category}", font=("Helvetica", 12),
-                                           fg="gray")
+            self.category_label = tk.Label(self.root, text="", font=("Helvetica", 12), fg="gray")
             self.category_label.pack(pady=5)
-            self.update_timer()
 
-        self.canvas = tk.Canvas(self.root, width=180, height=230, bg="white")
+        self.canvas = GallowsCanvas(self.root)
         self.canvas.pack(pady=10)
-        self.word_label = tk.Label(self.root, text=self.get_display_word(), font=("Courier", 20))
+        self.word_label = tk.Label(self.root, text="", font=("Courier", 20))
         self.word_label.pack(pady=10)
         self.entry = tk.Entry(self.root)
         self.entry.pack(pady=5)
         self.entry.bind("<Return>", self.make_guess)
-        self.status_label = tk.Label(self.root, text=f"Tries left: {self.tries}", font=("Helvetica", 12))
+        tk.Button(self.root, text="Hint", command=self.show_hint).pack(pady=5)
+        self.hint_label = tk.Label(self.root, text="", font=("Helvetica", 12), fg="gray")
+        self.hint_label.pack()
+        self.status_label = tk.Label(self.root, text="", font=("Helvetica", 12))
         self.status_label.pack(pady=5)
-        self.score_label = tk.Label(self.root, text=f"Score: {self.score}" if self.mode != 'multiplayer' else f"{self.player_names[self.current_player]}'s Score: {self.scores[self.current_player]}", font=("Helvetica", 12))
+        self.score_label = tk.Label(self.root, text="", font=("Helvetica", 12))
         self.score_label.pack(pady=5)
-        self.draw_hangman()
+        self.game_screen = True
 
-    def update_timer(self):
+    def update_timer(self, remaining):
         """
-        Aktualizuje licznik czasu i kończy grę po upływie limitu.
+        Aktualizuje licznik czasu; etykieta zmienia się tylko, gdy zmieni się liczba pełnych sekund.
+
+        Args:
+            remaining (float): pozostały czas w sekundach.
         """
-        if self.mode != 'timed' or not self.timer_running:
-            return
-        remaining = int(self.end_time - time.time())
-        if remaining <= 0:
+        text = f"Time left: {math.ceil(remaining)}"
+        if self.timer_label is not None and self.timer_label.cget("text") != text:
+            self.timer_label.config(text=text)
+
+    def time_up(self):
+        """
+        Kończy grę w trybie czasowym po upływie limitu.
+        """
+        self.timer = None
+        self.replay.time_up()
+        if self.timer_label is not None:
             self.timer_label.config(text="Time left: 0")
-            self.timer_running = False
-            messagebox.showinfo("Time's Up", f"Your score: {self.score}")
-            self.history.append(f"Mode: Singleplayer (Timed, {self.time_limit}s) | Player: {self.username} | Score: {self.score}")
-            self.setup_menu()
-        else:
-            self.timer_label.config(text=f"Time left: {remaining}")
-            self.root.after(1000, self.update_timer)
+        messagebox.showinfo("Time's Up", f"Your score: {self.engine.score}")
+        self.record_game(f"Mode: Singleplayer (Timed, {self.time_limit}s) | Player: {self.username} | Score: {self.engine.score}")
+        self.setup_menu()
 
-    def next_word(self):
+    def stop_timer(self):
         """
-        Losuje nowe słowo i resetuje licznik prób w trybie normalnym singleplayer.
+        Zatrzymuje odliczanie trybu czasowego, jeśli jest aktywne.
         """
-        self.word = self.get_random_word()
-        self.guessed = set()
-        self.tries = MAX_TRIES
-        self.display_game("Singleplayer - Normal Mode")
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
 
-    def next_word_timed(self):
+    def show_round(self):
         """
-        Losuje nowe słowo i resetuje licznik prób w trybie czasowym singleplayer.
+        Wyświetla ekran gry dla bieżącej rundy silnika z tytułem zależnym od trybu.
         """
-        self.word = self.get_random_word()
-        self.guessed = set()
-        self.tries = MAX_TRIES
-        self.display_game("Singleplayer - Timed Mode")
+        engine = self.engine
+        if engine.mode == 'normal':
+            self.display_game("Singleplayer - Normal Mode")
+        elif engine.mode == 'timed':
+            self.display_game("Singleplayer - Timed Mode")
+        else:
+            self.display_game(f"{engine.player_names[engine.current_player]}'s Turn")
+        self.next_word = None
+        self.root.after_idle(self.prefetch_word)
+        self.prefetch_bucket()
+
+    def prefetch_bucket(self):
+        """
+        Buduje w wątku roboczym grupę indeksu podpowiedzi dla słowa rundy, jeśli jeszcze jej nie ma —
+        najwyżej jedno takie zadanie naraz, żeby nie zajmować miejsc w IOExecutor potrzebnych bazie i plikom.
+        """
+        index = self.pattern_index
+        state = self.engine.round
+        if index is None or self.bucket_pending or index.cached(len(state.display), state.category):
+            return
+        self.bucket_pending = True
+        task = self.io.submit(index.bucket, len(state.display), state.category,
+                              callback=self.bucket_done, on_error=self.bucket_done)
+        if task is None:
+            self.bucket_pending = False
 
+    def bucket_done(self, result):
+        """
+        Kończy zadanie prefetch_bucket (błąd jest pomijany — grupa powstanie przy pierwszej podpowiedzi).
+        """
+        self.bucket_pending = False
 
     def get_display_word(self):
         """
@@ -433,56 +996,69 @@ class HangmanGame:
         Returns:
             str: np. "x _ x x _ x _ _"
         """
-        return ' '.join([letter if letter in self.guessed else '_' for letter in self.word])
+        return self.engine.round.display_word()
 
     def make_guess(self, event):
         """
-        Przetwarza literę wpisaną przez gracza, aktualizuje stan gry.
+        Przetwarza literę wpisaną przez gracza, aktualizuje stan gry. "?" zamiast litery pokazuje podpowiedź.
         Args:
             event: obiekt zdarzenia tkinter, przekazywany automatycznie po naciśnięciu Enter.
         """
         guess = self.entry.get().lower()
         self.entry.delete(0, tk.END)
-        if not guess.isalpha() or len(guess) != 1 or guess in self.guessed:
+        if guess == '?':
+            self.show_hint()
             return
-        self.guessed.add(guess)
-        if guess not in self.word:
-            self.tries -= 1
+        self.replay.guess(guess)
+        engine = self.engine
+        result = engine.guess(guess)
+        if result == INVALID or result == REPEATED:
+            return
+        self.metrics.count("guesses")
+        self.hint_label.config(text="")
         self.word_label.config(text=self.get_display_word())
-        self.status_label.config(text=f"Tries left: {self.tries}")
+        self.status_label.config(text=f"Tries left: {engine.round.tries}")
         self.draw_hangman()
-
-        if self.mode == 'timed' and self.tries == 0:
-            self.timer_running = False
-            messagebox.showinfo("Fail", f"You lost! The word was: {self.word}\nYour score: {self.score}")
-            self.history.append(f"Mode: Singleplayer (Timed, {self.time_limit}s) | Player: {self.username} | Score: {self.score}")
+        if result == WON or result == LOST:
+            if engine.mode != 'multiplayer' or engine.current_player == 0:
+                self.stats.record_round(self.username, engine.mode, engine.round.category, result == WON,
+                                        engine.round.tries)
+            self.metrics.count("rounds_won" if result == WON else "rounds_lost")
+
+        if result == LOST and engine.mode == 'timed':
+            self.stop_timer()
+            messagebox.showinfo("Fail", f"You lost! The word was: {engine.round.word}\nYour score: {engine.score}")
+            self.record_game(f"Mode: Singleplayer (Timed, {self.time_limit}s) | Player: {self.username} | Score: {engine.score}")
             self.setup_menu()
             return
 
-        if all(letter in self.guessed for letter in self.word):
+        if result == WON:
             self.after_round(True)
-        elif self.tries == 0:
-            messagebox.showinfo("Fail", f"You lost! The word was: {self.word}")
+        elif result == LOST:
+            messagebox.showinfo("Fail", f"You lost! The word was: {engine.round.word}")
             self.after_round(False)
 
+    def show_hint(self):
+        """
+        Pokazuje podpowiedź: najlepszą następną literę i liczbę słów pasujących do odkrytego wzorca.
+        """
+        if self.pattern_index is None:
+            self.hint_label.config(text="Hints are not ready yet.")
+            return
+        hint = self.engine.hint(self.pattern_index)
+        self.metrics.count("hints")
+        if hint.letter is None:
+            self.hint_label.config(text="No hint for this word.")
+        else:
+            self.hint_label.config(text=f"Try '{hint.letter}' ({hint.candidates} matching words)")
+
     def draw_hangman(self):
         """
-        Rysuje aktualny stan wisielca na Canvas.
+        Odkrywa na Canvas tyle części wisielca, ile prób zostało straconych.
         """
         if not self.canvas:
             return
-        self.canvas.delete("all")
-        self.canvas.create_line(20, 230, 160, 230)
-        self.canvas.create_line(40, 230, 40, 20)
-        self.canvas.create_line(40, 20, 110, 20)
-        self.canvas.create_line(110, 20, 110, 40)
-        parts = 6 - self.tries
-        if parts >= 1: self.canvas.create_oval(90, 40, 130, 80)
-        if parts >= 2: self.canvas.create_line(110, 80, 110, 140)
-        if parts >= 3: self.canvas.create_line(110, 90, 80, 110)
-        if parts >= 4: self.canvas.create_line(110, 90, 140, 110)
-        if parts >= 5: self.canvas.create_line(110, 140, 90, 180)
-        if parts >= 6: self.canvas.create_line(110, 140, 130, 180)
+        self.canvas.show_parts(MAX_TRIES - self.engine.round.tries)
 
     def after_round(self, won):
         """
@@ -491,76 +1067,131 @@ class HangmanGame:
         Args:
             won (bool): Czy gracz odgadł słowo.
         """
-        if self.mode == 'normal':
-            if won:
-                self.score += 1
-                self.next_word()
-            else:
-                self.history.append(f"Mode: Singleplayer (Normal) | Player: {self.username} | Score: {self.score}")
-                messagebox.showinfo("Game Over", f"Your score: {self.score}")
-                self.setup_menu()
-        elif self.mode == 'timed':
-            if won:
-                self.score += 1
-            self.next_word_timed()
-        elif self.mode == 'multiplayer':
-            if won:
-                self.scores[self.current_player] += self.tries
-            else:
-                self.active_players[self.current_player] = False
-            self.start_multiplayer()
+        engine = self.engine
+        if engine.after_round(won):
+            self.show_round()
+        elif engine.mode == 'multiplayer':
+            self.show_multiplayer_scores()
+        else:
+            self.record_game(f"Mode: Singleplayer (Normal) | Player: {self.username} | Score: {engine.score}")
+            messagebox.showinfo("Game Over", f"Your score: {engine.score}")
+            self.setup_menu()
 
     def show_multiplayer_scores(self):
         """
         Wyświetla końcowe wyniki graczy w trybie multiplayer i zapisuje je do historii.
         """
-        scores_text = "\n".join([f"{self.player_names[i]}: {score}" for i, score in enumerate(self.scores)])
+        scores = self.engine.scores
+        scores_text = "\n".join([f"{self.player_names[i]}: {score}" for i, score in enumerate(scores)])
         messagebox.showinfo("Final Scores", scores_text)
 
-        score_line = ", ".join([f"{self.player_names[i]}: {score}" for i, score in enumerate(self.scores)])
-        self.history.append(f"Mode: Multiplayer | {score_line}")
+        score_line = ", ".join([f"{self.player_names[i]}: {score}" for i, score in enumerate(scores)])
+        self.record_game(f"Mode: Multiplayer | {score_line}")
 
         self.setup_menu()
 
     def get_random_word(self):
         """
-        Dobiera losowe słowa z bazy danych.
+        Zwraca słowo przygotowane przez prefetch_word albo losuje je od razu.
+
+        Returns:
+            Word: słowo z bazy wraz z indeksem liter.
+        """
+        word, self.next_word = self.next_word, None
+        if word is None:
+            word = self.draw_word(self.engine.score)
+        self.replay.word(word)
+        return word
+
+    def prefetch_word(self):
+        """
+        W czasie bezczynności pętli Tk losuje słowo następnej rundy i buduje jego indeks liter, żeby after_round
+        pokazał je bez zwłoki. W singleplayer kolejna runda następuje tylko po wygranej, więc pasmo
+        trudności liczone jest dla wyniku o jeden większego.
+        """
+        engine = self.engine
+        if self.game_screen and self.next_word is None:
+            self.next_word = self.draw_word(engine.score + (engine.mode != 'multiplayer'))
+
+    def draw_word(self, score):
+        """
+        Dobiera losowe słowo z puli słów, bez powtórzeń w obrębie sesji (w trybie czasowym — adaptive_word).
+
+        Args:
+            score (int): wynik, dla którego dobierane jest pasmo trudności w trybie czasowym.
 
         Returns:
-            str: słowo z bazy.
-        """
-        cursor = self.connW.cursor()
-        cursor.execute("SELECT text, category FROM words ORDER BY RANDOM() LIMIT 1")
-        row = cursor.fetchone()
-        if row:
-            self.current_category = row[1]
-            return row[0]
+            Word: słowo z bazy wraz z indeksem liter.
+        """
+        if self.engine.mode == 'timed' and self.difficulty_index is not None and len(self.word_pool):
+            return self.adaptive_word(score)
+        if len(self.word_bag):
+            return self.word_bag.draw()
         else:
-            self.current_category = "Unknown"
-            return "juanpablo"
+            return Word("juanpablo", "Unknown")
+
+    def adaptive_word(self, score):
+        """
+        Dobiera słowo do trybu czasowego z pasma trudności rosnącego z wynikiem (co ADAPTIVE_STEP punktów),
+        unikając słów już użytych w sesji.
+
+        Args:
+            score (int): wynik gracza.
+
+        Returns:
+            Word: słowo z bazy wraz z indeksem liter.
+        """
+        bands = ('easy', 'medium', 'hard')
+        band = bands[min(score // ADAPTIVE_STEP, len(bands) - 1)]
+        for _ in range(ADAPTIVE_RETRIES):
+            index = self.difficulty_index.sample_band(band)
+            if index not in self.used_words:
+                break
+        self.used_words.add(index)
+        return self.word_pool.word(index)
 
     def clear_window(self):
         """
         Czyści zawartość głównego okna (self.root).
         """
+        self.game_screen = False
+        self.canvas = None
+        self.timer_label = None
+        self.category_label = None
+        self.root.unbind("<Control-Shift-D>")
         for widget in self.root.winfo_children():
             widget.destroy()
 
     def on_close(self):
         """
-        Zamykanie połączeń i usunięcie words.db.
+        Zapisuje przerwaną grę, zamyka połączenia i usuwa words.db (chyba że keep_words).
         """
-        self.connU.close()
-        self.connW.close()
-        if os.path.exists("words.db"):
-            os.remove("words.db")
+        if self.game_screen and self.engine.round is not None:
+            from replay import ABANDONED
+            self.save_session()
+            self.replay.end(self.engine, ABANDONED)
+        self.stop_timer()
+        self.io.shutdown()
+        self.store_io.shutdown(wait=True)
+        if self.history is not None:
+            self.flush_stores()
+        self.db.close()
+        if self.metrics.profiling:
+            self.metrics.stop_profile(PROFILE_FILE)
+        if self.metrics.enabled:
+            self.metrics.dump(METRICS_FILE)
+        if not self.keep_words and os.path.exists(WORDS_DB):
+            os.remove(WORDS_DB)
             print("words.db deleted.")
-        root.destroy()
+        self.root.destroy()
 
 
 
 if __name__ == '__main__':
     root = tk.Tk()
-    app = HangmanGame(root)
+    options = sys.argv[1:]
+    corpus = options[options.index('--corpus') + 1] if '--corpus' in options[:-1] else None
+    app = HangmanGame(root, keep_words='--keep-words' in options, metrics='--metrics' in options,
+                      profile='--profile' in options, corpus=corpus)
     root.protocol("WM_DELETE_WINDOW", app.on_close)
     root.mainloop()
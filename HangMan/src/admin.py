@@ -0,0 +1,247 @@
+"""
+Narzędzie administracyjne do masowych operacji na tabeli words (obok Game.py): liczba słów w kategoriach,
+strumieniowy eksport do plików słowo;kategoria, scalanie i zmiana nazw kategorii, usuwanie kategorii oraz
+wykrywanie prawie-duplikatów (słów różniących się tylko znakami diakrytycznymi, spacjami lub łącznikami)
+przez indeks znormalizowanego klucza. Zapytania idą po indeksach i kursorach, więc pamięć nie rośnie
+z liczbą słów.
+
+Użycie: python admin.py [--users users.db] [--words words.db] counts
+        python admin.py export words.txt[.gz] [--category Zwierzeta ...]
+        python admin.py rename Stara Nowa
+        python admin.py merge Zrodlo1 Zrodlo2 --into Cel
+        python admin.py delete Kategoria ...
+        python admin.py duplicates [--limit 50] [--prune]
+"""
+import argparse
+import gzip
+import itertools
+import sys
+import time
+import unicodedata
+
+from database import Database
+from engine import FOLD
+from importer import category_name
+
+USERS_DB = 'users.db'
+WORDS_DB = 'words.db'
+KEY_TABLE = str.maketrans({**FOLD, ' ': None, '-': None})
+KEY_BATCH = 50000
+FETCH_SIZE = 10000
+
+
+def word_key(text):
+    """
+    Klucz prawie-duplikatów: małe litery bez polskich (i innych) znaków diakrytycznych, spacji i łączników.
+
+    Returns:
+        str: np. "zolw" dla "żółw", "email" dla "e-mail".
+    """
+    key = text.lower().translate(KEY_TABLE)
+    if not key.isascii():
+        key = ''.join(letter for letter in unicodedata.normalize('NFKD', key) if not unicodedata.combining(letter))
+    return key
+
+
+def words_table(db):
+    """
+    Returns:
+        str: nazwa tabeli words z nazwą schematu (words leży w dołączonej bazie albo w main).
+    """
+    return f"{db.words_schema}.words"
+
+
+def ensure_category_index(db, conn):
+    """
+    Tworzy indeks na kolumnie category, jeśli jeszcze go nie ma (liczenie, eksport kategorii i scalanie
+    czytają wtedy tylko pasujące wiersze).
+    """
+    conn.execute(f"CREATE INDEX IF NOT EXISTS {db.words_schema}.words_category ON words (category)")
+    conn.commit()
+
+
+def ensure_keys(db, conn):
+    """
+    Dodaje kolumnę key z indeksem (jeśli jej nie ma) i uzupełnia klucze słów dodanych od ostatniego
+    uruchomienia — import nie liczy kluczy, więc robi to dopiero narzędzie. Przy ponad KEY_BATCH brakujących
+    kluczach indeks jest budowany od nowa po uzupełnieniu (sortowanie jest szybsze niż wstawianie po jednym).
+
+    Returns:
+        int: liczba uzupełnionych kluczy.
+    """
+    schema = db.words_schema
+    table = words_table(db)
+    columns = [row[1] for row in conn.execute(f"PRAGMA {schema}.table_info(words)")]
+    if 'key' not in columns:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN key TEXT")
+    missing = conn.execute(f"SELECT count(*) FROM {table} WHERE key IS NULL").fetchone()[0]
+    if missing:
+        conn.create_function("word_key", 1, word_key, deterministic=True)
+        with conn:
+            if missing > KEY_BATCH:
+                conn.execute(f"DROP INDEX IF EXISTS {schema}.words_key")
+            conn.execute(f"UPDATE {table} SET key = word_key(text) WHERE key IS NULL")
+    conn.execute(f"CREATE INDEX IF NOT EXISTS {schema}.words_key ON words (key)")
+    conn.commit()
+    return missing
+
+
+def category_counts(db, conn):
+    """
+    Returns:
+        list: krotki (kategoria, liczba słów) w kolejności nazw.
+    """
+    ensure_category_index(db, conn)
+    return conn.execute(f"SELECT category, count(*) FROM {words_table(db)} GROUP BY category "
+                        f"ORDER BY category").fetchall()
+
+
+def export_words(db, conn, path, categories=None):
+    """
+    Zapisuje słowa w formacie słowo;kategoria (.gz kompresowany), czytając je kursorem w kolejności id.
+
+    Args:
+        path (str): plik wynikowy.
+        categories (list): eksportowane kategorie albo None dla wszystkich.
+
+    Returns:
+        int: liczba zapisanych słów.
+    """
+    query = f"SELECT text, category FROM {words_table(db)}"
+    params = ()
+    if categories:
+        ensure_category_index(db, conn)
+        params = [category_name(category) for category in categories]
+        query += f" WHERE category IN ({','.join('?' * len(params))})"
+    rows = conn.execute(query + " ORDER BY id", params)
+    opener = gzip.open if path.endswith('.gz') else open
+    written = 0
+    with opener(path, 'wt', encoding='utf-8', newline='\n') as file:
+        while True:
+            batch = rows.fetchmany(FETCH_SIZE)
+            if not batch:
+                return written
+            file.writelines(f"{text};{category}\n" for text, category in batch)
+            written += len(batch)
+
+
+def merge_categories(db, conn, sources, target):
+    """
+    Przenosi słowa z kategorii sources do target w jednej transakcji (zmiana nazwy to scalenie
+    jednej kategorii). Nazwy są normalizowane tak jak przy imporcie.
+
+    Returns:
+        int: liczba przeniesionych słów.
+    """
+    ensure_category_index(db, conn)
+    target = category_name(target)
+    sources = [name for name in map(category_name, sources) if name != target]
+    if not sources:
+        return 0
+    with conn:
+        return conn.execute(f"UPDATE {words_table(db)} SET category = ? WHERE category IN "
+                            f"({','.join('?' * len(sources))})", (target, *sources)).rowcount
+
+
+def delete_categories(db, conn, categories):
+    """
+    Usuwa wszystkie słowa z podanych kategorii w jednej transakcji.
+
+    Returns:
+        int: liczba usuniętych słów.
+    """
+    ensure_category_index(db, conn)
+    names = [category_name(category) for category in categories]
+    with conn:
+        return conn.execute(f"DELETE FROM {words_table(db)} WHERE category IN ({','.join('?' * len(names))})",
+                            names).rowcount
+
+
+def duplicate_groups(db, conn):
+    """
+    Zwraca kolejne grupy prawie-duplikatów (słowa o tym samym kluczu word_key), czytane kursorem
+    po indeksie klucza.
+
+    Yields:
+        tuple: (klucz, lista krotek (id, słowo, kategoria) w kolejności id).
+    """
+    ensure_keys(db, conn)
+    table = words_table(db)
+    rows = conn.execute(f"SELECT key, id, text, category FROM {table} WHERE key IN "
+                        f"(SELECT key FROM {table} GROUP BY key HAVING count(*) > 1) ORDER BY key, id")
+    for key, group in itertools.groupby(rows, key=lambda row: row[0]):
+        yield key, [row[1:] for row in group]
+
+
+def prune_duplicates(db, conn):
+    """
+    Usuwa prawie-duplikaty w jednej transakcji, zostawiając w każdej grupie słowo o najniższym id
+    (dodane najwcześniej).
+
+    Returns:
+        int: liczba usuniętych słów.
+    """
+    ensure_keys(db, conn)
+    table = words_table(db)
+    with conn:
+        return conn.execute(f"DELETE FROM {table} WHERE id IN (SELECT id FROM {table} AS word WHERE id > "
+                            f"(SELECT min(id) FROM {table} WHERE key = word.key))").rowcount
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', default=USERS_DB, help="baza użytkowników (jak w Game.py)")
+    parser.add_argument('--words', default=WORDS_DB, help="baza słów (Game.py usuwa ją przy zamknięciu bez "
+                                                          "--keep-words)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('counts', help="liczba słów w każdej kategorii")
+    export = commands.add_parser('export', help="eksport do pliku słowo;kategoria (.txt lub .gz)")
+    export.add_argument('path')
+    export.add_argument('--category', action='append', help="tylko ta kategoria (można powtórzyć)")
+    rename = commands.add_parser('rename', help="zmiana nazwy kategorii")
+    rename.add_argument('old')
+    rename.add_argument('new')
+    merge = commands.add_parser('merge', help="scalenie kategorii w jedną")
+    merge.add_argument('sources', nargs='+')
+    merge.add_argument('--into', required=True)
+    delete = commands.add_parser('delete', help="usunięcie kategorii razem ze słowami")
+    delete.add_argument('categories', nargs='+')
+    duplicates = commands.add_parser('duplicates', help="prawie-duplikaty (diakrytyki, spacje, łączniki)")
+    duplicates.add_argument('--limit', type=int, default=50, help="liczba wypisanych grup (0 — wszystkie)")
+    duplicates.add_argument('--prune', action='store_true', help="usuń wszystkie poza najstarszym słowem grupy")
+    args = parser.parse_args(argv)
+
+    db = Database(args.users, args.words)
+    conn = db.conn
+    start = time.perf_counter()
+    try:
+        if args.command == 'counts':
+            rows = category_counts(db, conn)
+            for category, count in rows:
+                print(f"{category:<30} {count:>10}")
+            print(f"{'Total':<30} {sum(count for _, count in rows):>10}")
+        elif args.command == 'export':
+            print(f"Exported {export_words(db, conn, args.path, args.category)} words to {args.path}")
+        elif args.command == 'rename':
+            print(f"Moved {merge_categories(db, conn, [args.old], args.new)} words")
+        elif args.command == 'merge':
+            print(f"Moved {merge_categories(db, conn, args.sources, args.into)} words")
+        elif args.command == 'delete':
+            print(f"Deleted {delete_categories(db, conn, args.categories)} words")
+        elif args.prune:
+            print(f"Deleted {prune_duplicates(db, conn)} near-duplicate words")
+        else:
+            groups = 0
+            for key, words in duplicate_groups(db, conn):
+                if not args.limit or groups < args.limit:
+                    print(f"{key}: " + ", ".join(f"{text} ({category}, #{word_id})"
+                                                 for word_id, text, category in words))
+                groups += 1
+            print(f"{groups} near-duplicate groups")
+    finally:
+        db.close()
+    print(f"({time.perf_counter() - start:.2f} s)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
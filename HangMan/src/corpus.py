@@ -0,0 +1,398 @@
+"""
+Skompilowany korpus słów tylko do odczytu, otwierany przez mmap — alternatywa dla tabeli words przy bardzo
+dużych słownikach. Otwarcie pliku nie czyta słów (czas stały), dostęp idzie przez memoryview bez kopiowania,
+a strony pliku są współdzielone przez wszystkie procesy, które go otworzą.
+
+Układ pliku (little-endian, sekcje wyrównane do 8 bajtów):
+    nagłówek      HEADER: magic, wersja, flagi, liczba słów, liczba kategorii, położenie sekcji
+    kategorie     uint32[kategorie + 1] przesunięć nazw + nazwy w UTF-8
+                  uint32[kategorie + 1] indeksów pierwszego słowa (słowa są pogrupowane według kategorii)
+    słowa         uint32[słowa + 1] przesunięć + słowa w UTF-8, każde zakończone znakiem nowej linii
+                  (przejście wszystkich słów dekoduje duże fragmenty naraz)
+    category_ids  uint16[słowa]
+    maski         uint64[słowa] — bit i ustawiony, gdy w słowie jest litera strategies.ALPHABET[i] (opcjonalne)
+    ranking       float32[słowa] trudności (difficulty.word_score) rosnąco + uint32[słowa] pozycji tych słów,
+                  a potem to samo osobno w każdej kategorii (odcinki jak w indeksach pierwszego słowa) —
+                  gotowy indeks trudności czytany bez kopiowania (opcjonalny, flaga RANKS_FLAG)
+
+Użycie: python corpus.py words.corpus hasla.txt [inne.txt ...] [--no-masks] [--no-ranks]
+"""
+import mmap
+import random
+import struct
+import sys
+import time
+from array import array
+
+from difficulty import DifficultyIndex, SortedScores, word_score
+from engine import Word
+from fileutil import atomic_write
+from importer import ImportStats, iter_batches
+from strategies import ALPHABET, letter_frequencies
+
+MAGIC = b'HMC1'
+VERSION = 1
+HEADER = struct.Struct('<4sHHII8Q')
+MASKS_FLAG = 1
+RANKS_FLAG = 2
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ALPHABET)}
+ALIGNMENT = 8
+SCAN_CHUNK = 65536
+
+
+def letter_mask(text):
+    """
+    Returns:
+        int: maska bitowa liter słowa według LETTER_BITS (znaki spoza alfabetu są pomijane).
+    """
+    mask = 0
+    for letter in set(text):
+        mask |= LETTER_BITS.get(letter, 0)
+    return mask
+
+
+def pack_strings(strings):
+    """
+    Returns:
+        tuple: (array('I') przesunięć, bajty UTF-8 napisów zakończonych znakiem nowej linii).
+    """
+    encoded = [string.encode('utf-8') + b'\n' for string in strings]
+    offsets = array('I', [0])
+    position = 0
+    for data in encoded:
+        position += len(data)
+        offsets.append(position)
+    if position >= 1 << 32:
+        raise ValueError("corpus text exceeds 4 GiB")
+    return offsets, b''.join(encoded)
+
+
+def little_endian(values):
+    """
+    Returns:
+        bytes: zawartość tablicy array w kolejności little-endian.
+    """
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def rank(texts, starts):
+    """
+    Szereguje słowa według trudności (rzadkość liter liczona w całym korpusie, jak w DifficultyIndex) —
+    w całym korpusie i w każdej kategorii; równe trudności w kolejności pozycji.
+
+    Args:
+        texts (list): słowa pogrupowane według kategorii.
+        starts (array): indeksy pierwszego słowa kategorii (i koniec ostatniej).
+
+    Returns:
+        list: sekcje rankingu — [trudności, pozycje] dla całego korpusu, a potem dla kategorii.
+    """
+    total = max(len(texts), 1)
+    rarity = {letter: 1 - count / total for letter, count in letter_frequencies(texts).items()}
+    scores = [word_score(text, rarity) for text in texts]
+    order = sorted(range(len(texts)), key=scores.__getitem__)
+    by_category = []
+    for first, last in zip(starts, starts[1:]):
+        by_category += sorted(range(first, last), key=scores.__getitem__)
+    sections = []
+    for positions in (order, by_category):
+        sections += [little_endian(array('f', [scores[i] for i in positions])), little_endian(array('I', positions))]
+    return sections
+
+
+def build(paths, path, masks=True, ranks=True, progress=None):
+    """
+    Kompiluje pliki słów (format importer.parse_line, także .gz) do pliku korpusu. Powtórzone słowa są
+    pomijane tak jak przy imporcie do bazy — zostaje pierwsza kategoria.
+
+    Args:
+        paths (list): ścieżki do plików słów.
+        path (str): plik wynikowy (zapisywany atomowo).
+        masks (bool): czy zapisać maski liter słów.
+        ranks (bool): czy zapisać ranking trudności (bez niego gra nie dobiera słów według trudności).
+        progress (callable): wywoływana z importer.ImportStats po każdej paczce.
+
+    Returns:
+        importer.ImportStats: statystyki; added to liczba słów w korpusie.
+    """
+    stats = ImportStats()
+    words = {}
+    for batch in iter_batches(paths, stats):
+        for text, category in batch:
+            words.setdefault(text, category)
+        stats.elapsed = time.perf_counter() - stats.started
+        if progress:
+            progress(stats)
+    by_category = {}
+    for text, category in words.items():
+        by_category.setdefault(category, []).append(text)
+    categories = sorted(by_category)
+    if len(categories) > 0xFFFF:
+        raise ValueError("too many categories")
+    texts, category_ids, starts = [], array('H'), array('I', [0])
+    for category_id, category in enumerate(categories):
+        group = by_category[category]
+        texts += group
+        category_ids.extend([category_id] * len(group))
+        starts.append(len(texts))
+
+    name_offsets, name_data = pack_strings(categories)
+    offsets, data = pack_strings(texts)
+    sections = [little_endian(name_offsets), name_data, little_endian(starts), little_endian(offsets), data,
+                little_endian(category_ids)]
+    sections.append(little_endian(array('Q', map(letter_mask, texts))) if masks else b'')
+    sections.append(b''.join(rank(texts, starts)) if ranks else b'')
+    positions = []
+    position = HEADER.size
+    for section in sections:
+        position += -position % ALIGNMENT
+        positions.append(position if section else 0)
+        position += len(section)
+    flags = (MASKS_FLAG if masks else 0) | (RANKS_FLAG if ranks else 0)
+    chunks = [HEADER.pack(MAGIC, VERSION, flags, len(texts), len(categories), *positions)]
+    position = HEADER.size
+    for offset, section in zip(positions, sections):
+        if section:
+            chunks += [bytes(offset - position), section]
+            position = offset + len(section)
+    atomic_write(path, chunks)
+    stats.added = len(texts)
+    stats.elapsed = time.perf_counter() - stats.started
+    stats.done = True
+    return stats
+
+
+class Strings:
+    """
+    Sekwencja napisów z sekcji korpusu — dekodowane dopiero przy odczycie.
+    """
+    __slots__ = ("offsets", "data")
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        return str(self.data[self.offsets[index]:self.offsets[index + 1] - 1], 'utf-8')
+
+    def __iter__(self):
+        data = self.data
+        offsets = self.offsets
+        count = len(self)
+        for first in range(0, count, SCAN_CHUNK):
+            last = min(first + SCAN_CHUNK, count)
+            yield from str(data[offsets[first]:offsets[last] - 1], 'utf-8').split('\n')
+
+
+class Categories:
+    """
+    Sekwencja kategorii słów (przez category_ids) — widok zgodny z WordPool.categories.
+    """
+    __slots__ = ("ids", "names")
+
+    def __init__(self, ids, names):
+        self.ids = ids
+        self.names = names
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        return self.names[self.ids[index]]
+
+    def __iter__(self):
+        names = self.names
+        return (names[category_id] for category_id in self.ids)
+
+
+class Corpus:
+    """
+    Korpus otwarty przez mmap, z interfejsem WordPool (len, word, index_of, sample, texts, categories, ids,
+    by_category), więc może zastąpić pulę w ShuffleBag, DifficultyIndex i grze. Id słowa to jego pozycja + 1.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): plik zbudowany przez build.
+
+        Raises:
+            ValueError: gdy plik nie jest korpusem w obsługiwanej wersji.
+        """
+        with open(path, 'rb') as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = self.buffer = memoryview(self.mmap)
+        if len(buffer) < HEADER.size:
+            self.close()
+            raise ValueError("not a word corpus")
+        magic, version, flags, count, category_count, *positions = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("not a word corpus")
+        names_at, name_data_at, starts_at, offsets_at, data_at, ids_at, masks_at, ranks_at = positions
+        name_offsets = self.view(names_at, 'I', category_count + 1)
+        starts = self.view(starts_at, 'I', category_count + 1)
+        offsets = self.view(offsets_at, 'I', count + 1)
+        self.path = path
+        self.count = count
+        self.category_ids = self.view(ids_at, 'H', count)
+        self.masks = self.view(masks_at, 'Q', count) if flags & MASKS_FLAG else None
+        self.ranks = None
+        if flags & RANKS_FLAG:
+            self.ranks = [self.view(ranks_at + 4 * count * i, code, count) for i, code in enumerate('fIfI')]
+        self.texts = Strings(offsets, buffer[data_at:data_at + offsets[count]])
+        names = Strings(name_offsets, buffer[name_data_at:name_data_at + name_offsets[category_count]])
+        self.category_names = list(names)
+        self.categories = Categories(self.category_ids, self.category_names)
+        self.by_category = {name: range(starts[i], starts[i + 1]) for i, name in enumerate(self.category_names)}
+        for view in (starts, name_offsets, names.data):
+            if isinstance(view, memoryview):
+                view.release()
+        self.ids = range(1, count + 1)
+        self.entries = {}
+        self.difficulty = None
+
+    def view(self, position, code, length):
+        """
+        Returns:
+            memoryview: tablica liczb z pliku bez kopiowania (na maszynach big-endian — kopia w array).
+        """
+        size = struct.calcsize(code) * length
+        view = self.buffer[position:position + size]
+        if sys.byteorder == 'little':
+            return view.cast(code)
+        values = array(code, view)
+        values.byteswap()
+        return values
+
+    def close(self):
+        """
+        Zwalnia widoki i zamyka mmap.
+        """
+        texts = getattr(self, "texts", None)
+        views = [texts.offsets, texts.data] if texts is not None else []
+        difficulty = getattr(self, "difficulty", None)
+        if difficulty is not None:
+            for scores in (difficulty.all, *difficulty.by_category.values()):
+                views += [scores.keys, scores.indexes]
+        views += getattr(self, "ranks", None) or ()
+        for view in (*views, getattr(self, "category_ids", None), getattr(self, "masks", None), self.buffer):
+            if isinstance(view, memoryview):
+                view.release()
+        self.entries = {}
+        self.mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def refresh(self):
+        """
+        Korpus jest tylko do odczytu — nowe słowa trafiają wyłącznie do bazy.
+
+        Returns:
+            int: 0.
+        """
+        return 0
+
+    def fetch(self, conn=None):
+        """
+        Returns:
+            list: pusta lista — słowa importowane do bazy nie trafiają do korpusu (trzeba go przebudować).
+        """
+        return []
+
+    def extend(self, rows):
+        return 0
+
+    def word(self, index):
+        """
+        Zwraca słowo z indeksem pozycji liter (zapamiętywane tylko dla użytych słów).
+
+        Args:
+            index (int): pozycja słowa w korpusie.
+
+        Returns:
+            Word: słowo z indeksem liter.
+        """
+        entry = self.entries.get(index)
+        if entry is None:
+            entry = self.entries[index] = Word(self.texts[index], self.categories[index], index + 1)
+        return entry
+
+    def difficulty_index(self):
+        """
+        Zwraca indeks trudności na rankingu zapisanym w pliku: posortowane trudności są widokami mmap, więc
+        nic nie jest liczone ani kopiowane na stertę (w przeciwieństwie do DifficultyIndex nad pulą).
+
+        Returns:
+            difficulty.DifficultyIndex: indeks (ten sam przy kolejnych wywołaniach) albo None, gdy korpus
+                zbudowano bez rankingu.
+        """
+        if self.difficulty is None and self.ranks is not None:
+            keys, indexes, category_keys, category_indexes = self.ranks
+            by_category = {name: SortedScores.view(category_keys[words.start:words.stop],
+                                                   category_indexes[words.start:words.stop])
+                           for name, words in self.by_category.items()}
+            self.difficulty = DifficultyIndex.ranked(self, SortedScores.view(keys, indexes), by_category)
+        return self.difficulty
+
+    def index_of(self, word_id):
+        """
+        Returns:
+            int: pozycja słowa o danym id albo None, gdy słowa nie ma.
+        """
+        return word_id - 1 if 0 < word_id <= self.count else None
+
+    def mask(self, index):
+        """
+        Returns:
+            int: maska liter słowa (LETTER_BITS) — z pliku albo liczona, gdy korpus zbudowano bez masek.
+        """
+        if self.masks is not None:
+            return self.masks[index]
+        return letter_mask(self.texts[index])
+
+    def sample_index(self, category=None, rng=random):
+        """
+        Losuje jednostajnie pozycję słowa z całego korpusu lub z jednej kategorii.
+
+        Returns:
+            int: pozycja słowa w korpusie.
+        """
+        indexes = range(self.count) if category is None else self.by_category[category]
+        return indexes[rng.randrange(len(indexes))]
+
+    def sample(self, category=None, rng=random):
+        """
+        Losuje słowo (ze zwracaniem).
+
+        Returns:
+            Word: słowo z indeksem liter.
+        """
+        return self.word(self.sample_index(category, rng))
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description="Kompiluje pliki słów (słowo;kategoria) do korpusu mmap.")
+    parser.add_argument('output')
+    parser.add_argument('paths', nargs='+')
+    parser.add_argument('--no-masks', action='store_true', help="bez masek liter słów")
+    parser.add_argument('--no-ranks', action='store_true', help="bez rankingu trudności")
+    args = parser.parse_args()
+    result = build(args.paths, args.output, masks=not args.no_masks, ranks=not args.no_ranks)
+    print(f"{result.added} words from {result.lines} lines ({result.rejected} rejected) in {result.elapsed:.2f} s")
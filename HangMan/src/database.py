@@ -0,0 +1,150 @@
+"""
+Warstwa dostępu do danych — jedno miejsce zarządzające połączeniami SQLite, pragmami i schematem.
+"""
+import sqlite3
+import threading
+
+WORDS_SCHEMA = "wordsdb"
+CACHED_STATEMENTS = 256
+SCHEMA_VERSION = 3
+
+PRAGMAS = (
+    "PRAGMA {schema}.journal_mode=WAL",
+    "PRAGMA {schema}.synchronous=NORMAL",
+    "PRAGMA {schema}.cache_size=-8000",
+    "PRAGMA {schema}.mmap_size=67108864",
+)
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS main.users (
+        username TEXT PRIMARY KEY,
+        password TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS {words}.words (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        text TEXT UNIQUE NOT NULL,
+        category TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS main.history (
+        id INTEGER PRIMARY KEY,
+        username TEXT NOT NULL,
+        mode TEXT NOT NULL,
+        played_at REAL NOT NULL,
+        score INTEGER NOT NULL,
+        summary TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS main.history_user_time ON history (username, played_at);
+    CREATE INDEX IF NOT EXISTS main.history_mode_time ON history (mode, played_at);
+    CREATE INDEX IF NOT EXISTS main.history_user_mode_time ON history (username, mode, played_at, id);
+    CREATE INDEX IF NOT EXISTS main.history_time ON history (played_at);
+    CREATE TABLE IF NOT EXISTS main.user_stats (
+        username TEXT NOT NULL,
+        mode TEXT NOT NULL,
+        games INTEGER NOT NULL DEFAULT 0,
+        best_score INTEGER NOT NULL DEFAULT 0,
+        total_score INTEGER NOT NULL DEFAULT 0,
+        rounds INTEGER NOT NULL DEFAULT 0,
+        solved INTEGER NOT NULL DEFAULT 0,
+        tries_left_total INTEGER NOT NULL DEFAULT 0,
+        streak INTEGER NOT NULL DEFAULT 0,
+        best_streak INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (username, mode)
+    );
+    CREATE INDEX IF NOT EXISTS main.user_stats_leaderboard ON user_stats (mode, best_score DESC);
+    CREATE TABLE IF NOT EXISTS main.category_stats (
+        username TEXT NOT NULL,
+        category TEXT NOT NULL,
+        rounds INTEGER NOT NULL DEFAULT 0,
+        solved INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (username, category)
+    );
+"""
+
+
+class Database:
+    """
+    Połączenia z bazą użytkowników i (dołączoną przez ATTACH) bazą słów.
+
+    Każdy wątek dostaje własne połączenie (Database.conn), skonfigurowane tak samo: WAL, synchronous=NORMAL,
+    pamięć podręczna przygotowanych zapytań. Gdy words_path jest None, tabela words leży w tym samym pliku
+    co użytkownicy (tryb jednego pliku). Pliki są otwierane dopiero przy pierwszym połączeniu, a schemat
+    jest tworzony tylko wtedy, gdy PRAGMA user_version wskazuje starszą wersję.
+    """
+
+    def __init__(self, users_path, words_path=None, trace=None):
+        """
+        Args:
+            users_path (str): ścieżka do bazy użytkowników (baza główna).
+            words_path (str): ścieżka do bazy słów albo None dla trybu jednego pliku.
+            trace (callable): opcjonalny callback set_trace_callback dla każdego połączenia.
+        """
+        self.users_path = users_path
+        self.words_path = words_path
+        self.words_schema = WORDS_SCHEMA if words_path else "main"
+        self.trace = trace
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections = []
+        self.schema_ready = False
+
+    def connect(self):
+        """
+        Otwiera nowe, w pełni skonfigurowane połączenie (np. dla krótkotrwałego wątku roboczego).
+        Wywołujący odpowiada za jego zamknięcie.
+
+        Returns:
+            sqlite3.Connection: połączenie z dołączoną bazą słów.
+        """
+        conn = sqlite3.connect(self.users_path, cached_statements=CACHED_STATEMENTS, check_same_thread=False)
+        if self.words_path:
+            conn.execute(f"ATTACH DATABASE ? AS {WORDS_SCHEMA}", (self.words_path,))
+        schemas = ("main", WORDS_SCHEMA) if self.words_path else ("main",)
+        for schema in schemas:
+            for pragma in PRAGMAS:
+                conn.execute(pragma.format(schema=schema))
+        conn.execute("PRAGMA temp_store=MEMORY")
+        if self.trace is not None:
+            conn.set_trace_callback(self.trace)
+        if not self.schema_ready:
+            with self.lock:
+                if not self.schema_ready:
+                    self.create_schema(conn)
+        return conn
+
+    @property
+    def conn(self):
+        """
+        Returns:
+            sqlite3.Connection: połączenie przypisane do bieżącego wątku (tworzone przy pierwszym użyciu).
+        """
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = self.local.conn = self.connect()
+            with self.lock:
+                self.connections.append(conn)
+        return conn
+
+    def create_schema(self, conn):
+        """
+        Tworzy tabele users i words oraz historii i statystyk jednym skryptem, jeśli któraś z baz ma user_version niższe niż
+        SCHEMA_VERSION; przy zgodnej wersji kończy się na odczycie dwóch pragm.
+
+        Args:
+            conn (sqlite3.Connection): pierwsze otwarte połączenie.
+        """
+        schemas = ("main", WORDS_SCHEMA) if self.words_path else ("main",)
+        versions = [conn.execute(f"PRAGMA {schema}.user_version").fetchone()[0] for schema in schemas]
+        if min(versions) < SCHEMA_VERSION:
+            conn.executescript(SCHEMA.format(words=self.words_schema)
+                               + "".join(f"PRAGMA {schema}.user_version={SCHEMA_VERSION};" for schema in schemas))
+        self.schema_ready = True
+
+    def close(self):
+        """
+        Zamyka wszystkie połączenia otwarte przez Database.conn.
+        """
+        with self.lock:
+            connections, self.connections = self.connections, []
+        for conn in connections:
+            conn.close()
+        self.local = threading.local()
@@ -0,0 +1,216 @@
+"""
+Indeks trudności słów — losowanie słowa z zadanego pasma trudności i/lub kategorii w czasie O(log n).
+"""
+import bisect
+import itertools
+import random
+from engine import MAX_TRIES
+from strategies import letter_frequencies
+
+BANDS = {
+    'easy': (0.0, 1 / 3),
+    'medium': (1 / 3, 2 / 3),
+    'hard': (2 / 3, 1.0),
+}
+
+
+def word_score(text, rarity, evaluated=None):
+    """
+    Szacuje trudność słowa w skali 0-1.
+
+    Składniki: rzadkość liter (średnia po różnych literach), udział różnych liter w długości słowa
+    i krótkość słowa (krótkie słowa dają mniej trafień). Jeśli słowo ma wynik z evaluator.py
+    (liczba błędów strategii), wchodzi on do oceny z wagą 1/2.
+
+    Args:
+        text (str): słowo.
+        rarity (dict): litera -> rzadkość 0-1 (1 - udział słów zawierających literę).
+        evaluated (float): words.difficulty albo None.
+
+    Returns:
+        float: trudność 0-1.
+    """
+    letters = set(text) if text.isalpha() else {letter for letter in text if letter.isalpha()}
+    letter_rarity = sum(rarity.get(letter, 1.0) for letter in letters) / len(letters)
+    score = 0.5 * letter_rarity + 0.3 * len(letters) / len(text) + 0.2 * (1 - min(len(text), 12) / 12)
+    if evaluated is not None:
+        score = 0.5 * score + 0.5 * evaluated / MAX_TRIES
+    return score
+
+
+class SortedScores:
+    """
+    Posortowane pary (trudność, pozycja w puli) dla jednej kategorii albo całej puli.
+    """
+    __slots__ = ("keys", "indexes")
+
+    def __init__(self, pairs=()):
+        """
+        Args:
+            pairs (list): posortowane pary (trudność, pozycja).
+        """
+        self.keys = [score for score, _ in pairs]
+        self.indexes = [index for _, index in pairs]
+
+    @classmethod
+    def view(cls, keys, indexes):
+        """
+        Returns:
+            SortedScores: obiekt na gotowych posortowanych sekwencjach (np. widokach pliku korpusu) bez kopiowania.
+        """
+        scores = cls()
+        scores.keys = keys
+        scores.indexes = indexes
+        return scores
+
+    def merged(self, pairs):
+        """
+        Scala posortowane pary z bieżącymi w jednym sortowaniu (Timsort łączy dwa gotowe ciągi w czasie
+        liniowym) zamiast wstawiać je po jednej.
+
+        Returns:
+            SortedScores: nowy obiekt; bieżący pozostaje bez zmian, więc można z niego losować w trakcie scalania.
+        """
+        if self.keys:
+            pairs = sorted(itertools.chain(zip(self.keys, self.indexes), pairs))
+        return SortedScores(pairs)
+
+    def span(self, low, high):
+        """
+        Returns:
+            tuple: zakres pozycji [start, stop) słów o trudności w przedziale [low, high].
+        """
+        return bisect.bisect_left(self.keys, low), bisect.bisect_right(self.keys, high)
+
+
+class DifficultyIndex:
+    """
+    Trudności słów z WordPool posortowane globalnie i w każdej kategorii.
+    """
+
+    def __init__(self, pool, conn=None):
+        """
+        Args:
+            pool (wordpool.WordPool): pula słów.
+            conn (sqlite3.Connection): połączenie do odczytu words.difficulty (opcjonalne).
+        """
+        self.pool = pool
+        self.conn = conn
+        counts = letter_frequencies(pool.texts)
+        total = max(len(pool.texts), 1)
+        self.rarity = {letter: 1 - count / total for letter, count in counts.items()}
+        self.all = SortedScores()
+        self.by_category = {}
+        self.indexed = 0
+        self.refresh()
+
+    @classmethod
+    def ranked(cls, pool, all_scores, by_category):
+        """
+        Tworzy indeks z gotowych posortowanych trudności (Corpus.difficulty_index) zamiast liczyć je z puli.
+
+        Args:
+            pool (corpus.Corpus): pula tylko do odczytu — refresh nie ma czego dopisywać.
+            all_scores (SortedScores): trudności całej puli.
+            by_category (dict): kategoria -> SortedScores.
+
+        Returns:
+            DifficultyIndex: indeks.
+        """
+        index = cls.__new__(cls)
+        index.pool = pool
+        index.conn = None
+        index.rarity = None
+        index.all = all_scores
+        index.by_category = by_category
+        index.indexed = len(pool)
+        return index
+
+    def evaluated(self, since_id, conn=None):
+        """
+        Args:
+            conn (sqlite3.Connection): połączenie użyte zamiast self.conn (np. wątku roboczego).
+
+        Returns:
+            dict: id słowa -> words.difficulty dla słów o id > since_id (pusty, gdy kolumny nie ma).
+        """
+        if self.conn is None:
+            return {}
+        conn = conn or self.conn
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(words)")]
+        if 'difficulty' not in columns:
+            return {}
+        return dict(conn.execute(
+            "SELECT id, difficulty FROM words WHERE id > ? AND difficulty IS NOT NULL", (since_id,)))
+
+    def refresh(self, conn=None):
+        """
+        Dopisuje do indeksu słowa, które pojawiły się w puli od ostatniego odświeżenia.
+        Rzadkość liter pozostaje ta z momentu budowy indeksu. Posortowane trudności są scalane w nowe obiekty
+        podmieniane na końcu, więc odświeżanie może działać w wątku roboczym, gdy wątek Tk losuje słowa
+        (nie może jednak działać w dwóch wątkach naraz).
+
+        Args:
+            conn (sqlite3.Connection): połączenie bieżącego wątku do odczytu words.difficulty.
+
+        Returns:
+            int: liczba dodanych słów.
+        """
+        pool = self.pool
+        start = self.indexed
+        # WordPool.extend dopisuje ids, texts i categories po kolei w wątku Tk — bierzemy tylko słowa
+        # obecne już we wszystkich trzech listach.
+        end = min(len(pool.ids), len(pool.texts), len(pool.categories))
+        if start == end:
+            return 0
+        evaluated = self.evaluated(pool.ids[start - 1] if start else 0, conn)
+        scored = sorted((word_score(pool.texts[i], self.rarity, evaluated.get(pool.ids[i])), i)
+                        for i in range(start, end))
+        added = {}
+        categories = pool.categories
+        for pair in scored:
+            added.setdefault(categories[pair[1]], []).append(pair)
+        by_category = dict(self.by_category)
+        for category, pairs in added.items():
+            by_category[category] = by_category.get(category, SortedScores()).merged(pairs)
+        self.all = self.all.merged(scored)
+        self.by_category = by_category
+        self.indexed = end
+        return len(scored)
+
+    def scores(self, category=None):
+        """
+        Returns:
+            SortedScores: posortowane trudności dla kategorii albo całej puli.
+        """
+        return self.all if category is None else self.by_category.get(category, SortedScores())
+
+    def sample_range(self, low, high, category=None, rng=random):
+        """
+        Losuje słowo o trudności w przedziale [low, high] (dwa wyszukiwania binarne).
+
+        Returns:
+            int: pozycja słowa w puli albo None, gdy przedział jest pusty.
+        """
+        scores = self.scores(category)
+        start, stop = scores.span(low, high)
+        if start >= stop:
+            return None
+        return scores.indexes[rng.randrange(start, stop)]
+
+    def sample_band(self, band, category=None, rng=random):
+        """
+        Losuje słowo z pasma 'easy', 'medium' lub 'hard' — tercyle rankingu trudności, więc każde pasmo
+        zawiera tyle samo słów niezależnie od rozkładu ocen.
+
+        Returns:
+            int: pozycja słowa w puli albo None, gdy nie ma słów.
+        """
+        scores = self.scores(category)
+        size = len(scores.indexes)
+        if not size:
+            return None
+        low, high = BANDS[band]
+        start = min(int(low * size), size - 1)
+        stop = max(int(high * size), start + 1)
+        return scores.indexes[rng.randrange(start, stop)]
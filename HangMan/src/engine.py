@@ -0,0 +1,238 @@
+"""
+Silnik gry w wisielca niezależny od Tk — przechowuje stan rund i reguły gry.
+"""
+import unicodedata
+
+MAX_TRIES = 6
+
+FOLD = dict(zip("ąćęłńóśźż", "acelnoszz"))
+
+INVALID = 0
+REPEATED = 1
+HIT = 2
+MISS = 3
+WON = 4
+LOST = 5
+
+
+class Word:
+    """
+    Słowo (lub hasło z kilku słów) z gotowym indeksem pozycji liter, liczonym raz i przechowywanym w puli słów.
+
+    positions indeksuje litery dokładnie, folded — litery bez polskich znaków diakrytycznych (tryb łatwy,
+    w którym "l" odkrywa także "ł"); dla słów bez diakrytyków to ten sam słownik. Spacje i łączniki
+    są odkryte od początku (template).
+    """
+    __slots__ = ("text", "category", "positions", "folded", "template", "distinct", "id")
+
+    def __init__(self, text, category, word_id=None):
+        """
+        Args:
+            text (str): słowo lub hasło (litery, pojedyncze spacje i łączniki).
+            category (str): kategoria słowa.
+            word_id (int): id słowa w tabeli words albo None dla słów spoza bazy.
+        """
+        positions = {}
+        for index, letter in enumerate(text):
+            positions.setdefault(letter, []).append(index)
+        if text.isalpha():
+            template = ('_',) * len(text)
+        else:
+            template = tuple('_' if letter.isalpha() else letter for letter in text)
+            positions = {letter: indexes for letter, indexes in positions.items() if letter.isalpha()}
+        self.text = text
+        self.category = category
+        self.positions = {letter: tuple(indexes) for letter, indexes in positions.items()}
+        self.folded = self.positions
+        if any(letter in FOLD for letter in positions):
+            folded = {}
+            for letter, indexes in positions.items():
+                folded.setdefault(FOLD.get(letter, letter), []).extend(indexes)
+            self.folded = {letter: tuple(sorted(indexes)) for letter, indexes in folded.items()}
+        self.template = template
+        self.distinct = len(positions)
+        self.id = word_id
+
+
+class Round:
+    """
+    Stan pojedynczej rundy (jednego słowa do zgadnięcia).
+    """
+    __slots__ = ("word", "word_id", "category", "positions", "fold", "display", "guessed", "tries", "remaining")
+
+    def __init__(self, entry, tries=MAX_TRIES, fold=False):
+        """
+        Args:
+            entry (Word): słowo do zgadnięcia wraz z indeksem pozycji liter.
+            tries (int): liczba dostępnych prób.
+            fold (bool): tryb łatwy — litery z diakrytykami są równoważne literom bez nich.
+        """
+        self.word = entry.text
+        self.word_id = entry.id
+        self.category = entry.category
+        self.positions = entry.folded if fold else entry.positions
+        self.fold = fold
+        self.display = list(entry.template)
+        self.guessed = set()
+        self.tries = tries
+        self.remaining = len(self.positions)
+
+    def display_word(self):
+        """
+        Zwraca wersję słowa z podkreśleniami dla niezgadniętych liter.
+
+        Returns:
+            str: np. "x _ x x _ x _ _"
+        """
+        return ' '.join(self.display)
+
+
+class HangmanEngine:
+    """
+    Reguły gry (singleplayer normalny/czasowy, multiplayer) bez żadnych zależności od interfejsu.
+    """
+    __slots__ = ("word_source", "max_tries", "fold", "mode", "score", "scores", "active_players",
+                 "player_names", "current_player", "round")
+
+    def __init__(self, word_source, max_tries=MAX_TRIES, fold=False):
+        """
+        Args:
+            word_source (callable): funkcja bez argumentów zwracająca obiekt Word.
+            max_tries (int): liczba prób na jedno słowo.
+            fold (bool): tryb łatwy — zgadywanie bez rozróżniania polskich znaków diakrytycznych.
+        """
+        self.word_source = word_source
+        self.max_tries = max_tries
+        self.fold = fold
+        self.mode = None
+        self.score = 0
+        self.scores = []
+        self.active_players = []
+        self.player_names = []
+        self.current_player = 0
+        self.round = None
+
+    def new_round(self):
+        """
+        Losuje nowe słowo i resetuje licznik prób.
+
+        Returns:
+            Round: stan nowej rundy.
+        """
+        self.round = Round(self.word_source(), self.max_tries, self.fold)
+        return self.round
+
+    def start_singleplayer(self, timed):
+        """
+        Rozpoczyna grę singleplayer w trybie normalnym lub czasowym.
+
+        Args:
+            timed (bool): Czy gra jest w trybie czasowym (TRUE) czy normalnym (FALSE).
+        """
+        self.mode = 'timed' if timed else 'normal'
+        self.score = 0
+        self.new_round()
+
+    def start_multiplayer(self, player_names):
+        """
+        Rozpoczyna grę multiplayer dla podanych graczy.
+
+        Args:
+            player_names (list): imiona graczy w kolejności tur.
+
+        Returns:
+            bool: True jeśli rozpoczęto turę pierwszego gracza.
+        """
+        self.mode = 'multiplayer'
+        self.player_names = list(player_names)
+        self.scores = [0] * len(self.player_names)
+        self.active_players = [True] * len(self.player_names)
+        self.current_player = -1
+        return self.next_turn()
+
+    def next_turn(self):
+        """
+        Przekazuje turę następnemu aktywnemu graczowi i losuje dla niego słowo.
+
+        Returns:
+            bool: False jeśli nie ma już aktywnych graczy (koniec gry).
+        """
+        if not any(self.active_players):
+            return False
+        players = len(self.active_players)
+        start_index = self.current_player
+        while True:
+            self.current_player = (self.current_player + 1) % players
+            if self.active_players[self.current_player]:
+                break
+            if self.current_player == start_index:
+                return False
+        self.new_round()
+        return True
+
+    def guess(self, letter):
+        """
+        Przetwarza literę gracza i aktualizuje stan rundy.
+
+        Args:
+            letter (str): litera (już zamieniona na małą); litera z osobnym znakiem diakrytycznym
+                (np. "a" + ogonek) jest składana do jednego znaku.
+
+        Returns:
+            int: jeden z kodów INVALID, REPEATED, HIT, MISS, WON, LOST.
+        """
+        state = self.round
+        if len(letter) != 1:
+            letter = unicodedata.normalize('NFC', letter)
+        if len(letter) != 1 or not letter.isalpha():
+            return INVALID
+        if state.fold:
+            letter = FOLD.get(letter, letter)
+        if letter in state.guessed:
+            return REPEATED
+        state.guessed.add(letter)
+        positions = state.positions.get(letter)
+        if positions:
+            display = state.display
+            word = state.word
+            for index in positions:
+                display[index] = word[index]
+            state.remaining -= 1
+            return WON if state.remaining == 0 else HIT
+        state.tries -= 1
+        return LOST if state.tries == 0 else MISS
+
+    def hint(self, solver):
+        """
+        Podpowiedź dla bieżącej rundy (nie zmienia jej stanu).
+
+        Args:
+            solver (solver.PatternIndex): indeks wzorców słów.
+
+        Returns:
+            solver.Hint: najlepsza następna litera i liczba pasujących słów.
+        """
+        return solver.hint(self.round)
+
+    def after_round(self, won):
+        """
+        Obsługuje zakończenie rundy — aktualizuje wynik i przechodzi do kolejnego słowa.
+        Przegrana w singleplayer (normalnym i czasowym) kończy sesję, w multiplayer eliminuje gracza.
+
+        Args:
+            won (bool): Czy gracz odgadł słowo.
+
+        Returns:
+            bool: True jeśli gra toczy się dalej, False jeśli sesja się zakończyła.
+        """
+        if self.mode != 'multiplayer':
+            if not won:
+                return False
+            self.score += 1
+            self.new_round()
+            return True
+        if won:
+            self.scores[self.current_player] += self.round.tries
+        else:
+            self.active_players[self.current_player] = False
+        return self.next_turn()
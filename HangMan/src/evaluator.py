@@ -0,0 +1,277 @@
+"""
+Wsadowa ocena trudności słów: dla każdego słowa liczy, ile błędnych prób (z MAX_TRIES) popełni strategia,
+i zapisuje wynik w kolumnie words.difficulty.
+
+Strategie deterministyczne (frequency, optimal) tworzą drzewo decyzji: słowa dające te same odpowiedzi
+przechodzą tą samą ścieżką, więc grupa słów jednej długości jest oceniana jednym przejściem drzewa
+zamiast symulacji słowo po słowie. Słowa są dzielone na paczki (długość, zakres) rozdzielane na procesy;
+każda paczka jest zapisywana w osobnej transakcji, więc przerwane obliczenie można wznowić.
+
+Użycie: python evaluator.py words.db [--strategy optimal] [--workers N] [--shard-size 20000] [--reset]
+"""
+import argparse
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from engine import MAX_TRIES
+from strategies import letter_frequencies
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SHARD_SIZE = 20000
+NUMPY_CUTOFF = 4096
+EVALUATED_STRATEGIES = ('frequency', 'optimal')
+
+group_cache = {}
+
+
+def ensure_difficulty_column(conn):
+    """
+    Dodaje kolumnę difficulty do tabeli words, jeśli jeszcze jej nie ma.
+    """
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(words)")]
+    if 'difficulty' not in columns:
+        conn.execute("ALTER TABLE words ADD COLUMN difficulty REAL")
+        conn.commit()
+
+
+def corpus_order(conn):
+    """
+    Returns:
+        str: litery korpusu od najczęstszej (kolejność strategii frequency).
+    """
+    counts = letter_frequencies(text for text, in conn.execute("SELECT text FROM words"))
+    return ''.join(sorted(counts, key=lambda letter: (-counts[letter], letter)))
+
+
+def load_group(words_path, length):
+    """
+    Wczytuje (raz na proces) wszystkie słowa danej długości w kolejności id.
+
+    Returns:
+        tuple: (lista id, lista słów, lista trudności lub None).
+    """
+    group = group_cache.get((words_path, length))
+    if group is None:
+        conn = sqlite3.connect(f"file:{words_path}?mode=ro", uri=True)
+        rows = conn.execute("SELECT id, text, difficulty FROM words WHERE length(text) = ? ORDER BY id",
+                            (length,)).fetchall()
+        conn.close()
+        group = group_cache[(words_path, length)] = ([row[0] for row in rows], [row[1] for row in rows],
+                                                     [row[2] for row in rows])
+    return group
+
+
+def evaluate_python(words, targets, strategy, order, guessed_letters='', wrong=0):
+    """
+    Przejście drzewa decyzji na zwykłych listach i maskach bitowych int.
+
+    Args:
+        words (list): wszystkie słowa danej długości (zbiór kandydatów).
+        targets (set): indeksy słów, dla których liczony jest wynik.
+        strategy (str): 'frequency' albo 'optimal'.
+        order (str): litery od najczęstszej.
+        guessed_letters (str): litery już odgadnięte (gdy oceniane jest poddrzewo).
+        wrong (int): liczba błędów popełnionych przed poddrzewem.
+
+    Returns:
+        dict: indeks słowa -> liczba błędnych prób.
+    """
+    bits = {letter: 1 << index for index, letter in enumerate(order)}
+    masks = []
+    for word in words:
+        mask = 0
+        for letter in word:
+            mask |= bits.get(letter, 0)
+        masks.append(mask)
+    results = {}
+    stack = [(list(range(len(words))), sum(bits[letter] for letter in guessed_letters), wrong)]
+    while stack:
+        candidates, guessed, wrong = stack.pop()
+        active = []
+        for i in candidates:
+            if masks[i] & ~guessed:
+                active.append(i)
+            elif i in targets:
+                results[i] = wrong
+        if not active:
+            continue
+        if wrong >= MAX_TRIES:
+            for i in active:
+                if i in targets:
+                    results[i] = MAX_TRIES
+            continue
+        if strategy == 'optimal':
+            best, best_count = None, 0
+            for letter in order:
+                bit = bits[letter]
+                if guessed & bit:
+                    continue
+                count = sum(1 for i in active if masks[i] & bit)
+                if count > best_count:
+                    best, best_count = letter, count
+        else:
+            best = next(letter for letter in order if not guessed & bits[letter])
+        bit = bits[best]
+        groups = {}
+        for i in active:
+            if masks[i] & bit:
+                word = words[i]
+                pattern = tuple(index for index, letter in enumerate(word) if letter == best)
+            else:
+                pattern = ()
+            groups.setdefault(pattern, []).append(i)
+        for pattern, group in groups.items():
+            if any(i in targets for i in group):
+                stack.append((group, guessed | bit, wrong + (not pattern)))
+    return results
+
+
+def evaluate_numpy(words, targets, strategy, order):
+    """
+    To samo przejście drzewa co evaluate_python, ale wybór litery i podział kandydatów są wektorowe:
+    macierz obecności liter (bool) i kody liter na pozycjach (uint8). Poddrzewa mniejsze niż NUMPY_CUTOFF
+    kandydatów są oddawane do evaluate_python, bo tam narzut NumPy przeważa nad zyskiem. Spacje i łączniki
+    w hasłach mają wspólny kod len(order), oznaczony od początku jako odgadnięty.
+    """
+    index = {letter: i for i, letter in enumerate(order)}
+    length = len(words[0])
+    separator = len(order)
+    codes = np.array([[index.get(letter, separator) for letter in word] for word in words],
+                     dtype=np.uint8).reshape(len(words), length)
+    presence = np.zeros((len(words), separator + 1), dtype=bool)
+    presence[np.arange(len(words))[:, None], codes] = True
+    weights = np.left_shift(np.int64(1), np.arange(length, dtype=np.int64))
+    is_target = np.zeros(len(words), dtype=bool)
+    is_target[list(targets)] = True
+    results = {}
+    known = np.zeros(separator + 1, dtype=bool)
+    known[separator] = True
+    stack = [(np.arange(len(words)), known, 0)]
+    while stack:
+        candidates, guessed, wrong = stack.pop()
+        if len(candidates) < NUMPY_CUTOFF:
+            sub_targets = {k for k, i in enumerate(candidates) if is_target[i]}
+            guessed_letters = ''.join(order[j] for j in np.flatnonzero(guessed[:separator]))
+            found = evaluate_python([words[i] for i in candidates], sub_targets, strategy, order, guessed_letters, wrong)
+            for k, result in found.items():
+                results[int(candidates[k])] = result
+            continue
+        unfinished = (presence[candidates] & ~guessed).any(axis=1)
+        for i in candidates[~unfinished & is_target[candidates]]:
+            results[int(i)] = wrong
+        active = candidates[unfinished]
+        if not len(active):
+            continue
+        if wrong >= MAX_TRIES:
+            for i in active[is_target[active]]:
+                results[int(i)] = MAX_TRIES
+            continue
+        if strategy == 'optimal':
+            counts = presence[active].sum(axis=0)
+            counts[guessed] = -1
+            best = int(counts.argmax())
+        else:
+            best = int((~guessed).argmax())
+        patterns = (codes[active] == best) @ weights
+        next_guessed = guessed.copy()
+        next_guessed[best] = True
+        keys, inverse, sizes = np.unique(patterns, return_inverse=True, return_counts=True)
+        groups = np.split(active[np.argsort(inverse, kind='stable')], np.cumsum(sizes)[:-1])
+        for key, group in zip(keys, groups):
+            if is_target[group].any():
+                stack.append((group, next_guessed, wrong + int(key == 0)))
+    return results
+
+
+def evaluate_shard(words_path, length, start, stop, strategy, order):
+    """
+    Ocenia słowa o pozycjach [start, stop) w grupie danej długości (uruchamiane w procesie roboczym).
+    Pomija słowa, które mają już wynik, dzięki czemu wznowienie nie powtarza pracy.
+
+    Returns:
+        list: krotki (id słowa, liczba błędnych prób).
+    """
+    ids, words, difficulties = load_group(words_path, length)
+    targets = {i for i in range(start, min(stop, len(words))) if difficulties[i] is None}
+    if not targets:
+        return []
+    if np is not None and length < 63:
+        results = evaluate_numpy(words, targets, strategy, order)
+    else:
+        results = evaluate_python(words, targets, strategy, order)
+    return [(ids[i], wrong) for i, wrong in results.items()]
+
+
+def plan_shards(conn, shard_size=SHARD_SIZE):
+    """
+    Dzieli słowa bez wyniku na paczki (długość, początek, koniec).
+
+    Returns:
+        list: paczki posortowane od największej grupy.
+    """
+    shards = []
+    rows = conn.execute("""
+        SELECT length(text), COUNT(*), SUM(difficulty IS NULL) FROM words GROUP BY length(text)
+    """).fetchall()
+    for length, total, pending in sorted(rows, key=lambda row: -row[1]):
+        if pending:
+            shards.extend((length, start, start + shard_size) for start in range(0, total, shard_size))
+    return shards
+
+
+def evaluate(words_path, strategy='optimal', workers=None, shard_size=SHARD_SIZE, reset=False, progress=print):
+    """
+    Ocenia wszystkie słowa bez wyniku w bazie words_path i zapisuje words.difficulty.
+
+    Args:
+        words_path (str): plik bazy z tabelą words.
+        strategy (str): 'frequency' albo 'optimal'.
+        workers (int): liczba procesów (domyślnie liczba rdzeni).
+        shard_size (int): liczba słów w paczce.
+        reset (bool): czyści poprzednie wyniki zamiast je wznawiać.
+        progress (callable): otrzymuje komunikaty o postępie.
+
+    Returns:
+        int: liczba ocenionych słów.
+    """
+    if strategy not in EVALUATED_STRATEGIES:
+        raise ValueError(f"strategy must be one of {EVALUATED_STRATEGIES}")
+    conn = sqlite3.connect(words_path)
+    ensure_difficulty_column(conn)
+    if reset:
+        with conn:
+            conn.execute("UPDATE words SET difficulty = NULL")
+    order = corpus_order(conn)
+    shards = plan_shards(conn, shard_size)
+    evaluated = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(evaluate_shard, words_path, length, low, high, strategy, order)
+                   for length, low, high in shards]
+        for done, future in enumerate(as_completed(futures), start=1):
+            rows = future.result()
+            with conn:
+                conn.executemany("UPDATE words SET difficulty = ? WHERE id = ?",
+                                 [(float(wrong), word_id) for word_id, wrong in rows])
+            evaluated += len(rows)
+            progress(f"shard {done}/{len(futures)}: {evaluated} words, "
+                     f"{evaluated / (time.perf_counter() - start):,.0f} words/s")
+    conn.close()
+    return evaluated
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('words_path')
+    parser.add_argument('--strategy', choices=EVALUATED_STRATEGIES, default='optimal')
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--shard-size', type=int, default=SHARD_SIZE)
+    parser.add_argument('--reset', action='store_true')
+    args = parser.parse_args()
+    evaluate(args.words_path, args.strategy, args.workers, args.shard_size, args.reset)
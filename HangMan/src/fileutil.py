@@ -0,0 +1,21 @@
+"""
+Wspólne operacje na plikach.
+"""
+import os
+
+
+def atomic_write(path, chunks):
+    """
+    Zapisuje plik atomowo: fragmenty trafiają do pliku tymczasowego obok, po fsync zastępuje on path
+    (os.replace), więc przerwany zapis nie zostawia połowy pliku.
+
+    Args:
+        path (str): plik docelowy.
+        chunks (iterable): fragmenty danych (bytes), zapisywane kolejno bez łączenia w pamięci.
+    """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as file:
+        file.writelines(chunks)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
@@ -0,0 +1,184 @@
+"""
+Trwała historia gier w SQLite — zapis paczkami, stronicowany odczyt i strumieniowy eksport.
+"""
+import csv
+import json
+import threading
+import time
+
+PAGE_SIZE = 200
+EXPORT_CHUNK = 1000
+
+
+class HistoryStore:
+    """
+    Tabela history indeksowana po użytkowniku, trybie i czasie rozgrywki. Bufor wpisów jest chroniony blokadą,
+    więc wpisy można dodawać w wątku Tk, a zapisywać (flush) w wątku roboczym.
+    """
+
+    def __init__(self, conn, batch_size=20):
+        """
+        Args:
+            conn (sqlite3.Connection): połączenie z bazą użytkowników (Database.conn — tabelę tworzy schemat
+                bazy danych).
+            batch_size (int): liczba wpisów buforowanych przed zapisem do bazy; 0 — bufor zapisuje wywołujący
+                (flush), np. w wątku roboczym.
+        """
+        self.conn = conn
+        self.batch_size = batch_size
+        self.pending = []
+        self.lock = threading.Lock()
+
+    def add(self, username, mode, score, summary, played_at=None):
+        """
+        Dodaje wpis do bufora; bufor jest zapisywany po zebraniu batch_size wpisów (o ile batch_size > 0).
+
+        Args:
+            username (str): zalogowany użytkownik.
+            mode (str): 'normal', 'timed' albo 'multiplayer'.
+            score (int): wynik zalogowanego użytkownika.
+            summary (str): opis rozgrywki w formacie wyświetlanym w historii.
+            played_at (float): znacznik czasu, domyślnie teraz.
+        """
+        with self.lock:
+            self.pending.append((username, mode, time.time() if played_at is None else played_at, score, summary))
+            full = self.batch_size and len(self.pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self, conn=None):
+        """
+        Zapisuje zbuforowane wpisy w jednej transakcji; przy błędzie wracają do bufora.
+
+        Args:
+            conn (sqlite3.Connection): połączenie bieżącego wątku, domyślnie połączenie magazynu.
+        """
+        with self.lock:
+            rows, self.pending = self.pending, []
+        if not rows:
+            return
+        conn = self.conn if conn is None else conn
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO history (username, mode, played_at, score, summary) VALUES (?, ?, ?, ?, ?)", rows)
+        except Exception:
+            with self.lock:
+                self.pending[:0] = rows
+            raise
+
+    def where(self, username=None, mode=None):
+        """
+        Returns:
+            tuple: (fragment WHERE, parametry) dla podanych filtrów.
+        """
+        clauses = []
+        params = []
+        if username is not None:
+            clauses.append("username = ?")
+            params.append(username)
+        if mode is not None:
+            clauses.append("mode = ?")
+            params.append(mode)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count(self, username=None, mode=None, conn=None):
+        """
+        Args:
+            conn (sqlite3.Connection): połączenie do odczytu (patrz iter_rows).
+
+        Returns:
+            int: liczba wpisów spełniających filtry.
+        """
+        if conn is None:
+            self.flush()
+            conn = self.conn
+        where, params = self.where(username, mode)
+        return conn.execute(f"SELECT COUNT(*) FROM history{where}", params).fetchone()[0]
+
+    def page(self, after=None, limit=PAGE_SIZE, username=None, mode=None, conn=None):
+        """
+        Zwraca jedną stronę historii w kolejności chronologicznej. Strony są wyznaczane kluczem ostatniego
+        wiersza poprzedniej strony (keyset), więc zapytanie schodzi po indeksie od razu do właściwego miejsca —
+        koszt nie rośnie z numerem strony, jak przy OFFSET.
+
+        Args:
+            after (tuple): (played_at, id) ostatniego wiersza poprzedniej strony albo None dla pierwszej.
+            limit (int): maksymalna liczba wierszy.
+            conn (sqlite3.Connection): połączenie do odczytu (patrz iter_rows).
+
+        Returns:
+            list: krotki (played_at, username, mode, score, summary, id).
+        """
+        if conn is None:
+            self.flush()
+            conn = self.conn
+        where, params = self.where(username, mode)
+        if after is not None:
+            where += " AND (played_at, id) > (?, ?)" if where else " WHERE (played_at, id) > (?, ?)"
+            params += list(after)
+        return conn.execute(
+            f"SELECT played_at, username, mode, score, summary, id FROM history{where} "
+            f"ORDER BY played_at, id LIMIT ?", params + [limit]).fetchall()
+
+    def iter_rows(self, username=None, mode=None, conn=None):
+        """
+        Strumieniowo zwraca wszystkie wpisy, pobierając je z bazy porcjami.
+
+        Args:
+            conn (sqlite3.Connection): połączenie do odczytu (np. wątku roboczego); bufor jest wtedy
+                zapisywany wcześniej przez wywołującego. Domyślnie połączenie magazynu.
+        """
+        if conn is None:
+            self.flush()
+            conn = self.conn
+        where, params = self.where(username, mode)
+        cursor = conn.execute(
+            f"SELECT played_at, username, mode, score, summary FROM history{where} ORDER BY played_at, id", params)
+        while True:
+            rows = cursor.fetchmany(EXPORT_CHUNK)
+            if not rows:
+                return
+            yield from rows
+
+    def export(self, file_path, username=None, mode=None, conn=None):
+        """
+        Eksportuje historię do pliku; format wynika z rozszerzenia (.csv, .jsonl, w pozostałych przypadkach tekst).
+
+        Args:
+            file_path (str): ścieżka do pliku docelowego.
+            conn (sqlite3.Connection): połączenie do odczytu (patrz iter_rows).
+
+        Returns:
+            int: liczba zapisanych wpisów.
+        """
+        written = 0
+        rows = self.iter_rows(username, mode, conn)
+        with open(file_path, 'w', encoding='utf-8', newline='') as file:
+            if file_path.endswith('.csv'):
+                writer = csv.writer(file)
+                writer.writerow(("played_at", "username", "mode", "score", "summary"))
+                for row in rows:
+                    writer.writerow((format_time(row[0]),) + row[1:])
+                    written += 1
+            elif file_path.endswith('.jsonl'):
+                for played_at, user, game_mode, score, summary in rows:
+                    file.write(json.dumps({"played_at": format_time(played_at), "username": user, "mode": game_mode,
+                                           "score": score, "summary": summary}, ensure_ascii=False))
+                    file.write("\n")
+                    written += 1
+            else:
+                for row in rows:
+                    if written:
+                        file.write("\n")
+                    file.write(row[4])
+                    written += 1
+        return written
+
+
+def format_time(played_at):
+    """
+    Returns:
+        str: znacznik czasu w formacie RRRR-MM-DD GG:MM:SS.
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(played_at))
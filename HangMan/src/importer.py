@@ -0,0 +1,144 @@
+"""
+Strumieniowy import list słów (słowo;kategoria) do bazy — paczki INSERT OR IGNORE w transakcjach.
+"""
+import gzip
+import time
+import unicodedata
+
+BATCH_SIZE = 5000
+
+
+class ImportStats:
+    """
+    Postęp i wynik importu.
+    """
+    __slots__ = ("lines", "added", "rejected", "started", "elapsed", "done")
+
+    def __init__(self):
+        self.lines = 0
+        self.added = 0
+        self.rejected = 0
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self.done = False
+
+    @property
+    def rate(self):
+        """
+        Returns:
+            float: liczba przetworzonych wierszy na sekundę.
+        """
+        return self.lines / self.elapsed if self.elapsed else 0.0
+
+
+def is_phrase(text):
+    """
+    Returns:
+        bool: True dla hasła z kilku słów rozdzielonych pojedynczymi spacjami lub łącznikami.
+    """
+    return all(part.isalpha() for part in text.replace('-', ' ').split(' '))
+
+
+def category_name(text):
+    """
+    Returns:
+        str: nazwa kategorii w postaci zapisywanej w bazie (bez odstępów na brzegach, z wielkiej litery).
+    """
+    return text.strip().capitalize()
+
+
+def parse_line(line):
+    """
+    Rozbiera wiersz pliku: słowo zamieniane na małe litery i postać NFC (ą/ę/ł/ż zapisane jako litera
+    z osobnym znakiem diakrytycznym stają się jednym znakiem), kategoria z wielkiej litery. Przyjmowane
+    są też hasła z kilku słów ("sztuczna inteligencja"), z odstępami zredukowanymi do pojedynczych spacji.
+
+    Args:
+        line (str): wiersz w formacie słowo;kategoria.
+
+    Returns:
+        tuple: (słowo, kategoria) albo None jeśli wiersz jest odrzucony.
+    """
+    parts = line.strip().split(';')
+    if len(parts) != 2:
+        return None
+    word = parts[0].strip().lower()
+    if not word.isascii() and not unicodedata.is_normalized('NFC', word):
+        word = unicodedata.normalize('NFC', word)
+    if not word.isalpha():
+        word = ' '.join(word.split())
+        if not is_phrase(word):
+            return None
+    return word, category_name(parts[1])
+
+
+def open_word_file(path):
+    """
+    Otwiera plik tekstowy lub skompresowany gzipem (.gz).
+
+    Returns:
+        file: plik otwarty w trybie tekstowym UTF-8.
+    """
+    if str(path).endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def iter_batches(paths, stats, batch_size=BATCH_SIZE):
+    """
+    Czyta kolejne pliki i zwraca paczki poprawnych par (słowo, kategoria).
+
+    Args:
+        paths (list): ścieżki do plików.
+        stats (ImportStats): statystyki uzupełniane w trakcie czytania.
+        batch_size (int): maksymalny rozmiar paczki.
+    """
+    batch = []
+    for path in paths:
+        with open_word_file(path) as file:
+            for line in file:
+                stats.lines += 1
+                row = parse_line(line)
+                if row is None:
+                    stats.rejected += 1
+                    continue
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+    if batch:
+        yield batch
+
+
+def import_files(db, paths, batch_size=BATCH_SIZE, progress=None, cancel=None):
+    """
+    Importuje słowa z plików do tabeli words na osobnym połączeniu, więc może działać w wątku roboczym.
+
+    Args:
+        db (database.Database): baza z tabelą words.
+        paths (list): ścieżki do plików (.txt lub .gz).
+        batch_size (int): liczba wierszy na transakcję.
+        progress (callable): wywoływana z ImportStats po każdej paczce.
+        cancel (threading.Event): przerywa import po bieżącej paczce.
+
+    Returns:
+        ImportStats: podsumowanie importu.
+    """
+    stats = ImportStats()
+    conn = db.connect()
+    try:
+        for batch in iter_batches(paths, stats, batch_size):
+            before = conn.total_changes
+            with conn:
+                conn.executemany("INSERT OR IGNORE INTO words (text, category) VALUES (?, ?)", batch)
+            stats.added += conn.total_changes - before
+            stats.elapsed = time.perf_counter() - stats.started
+            if progress:
+                progress(stats)
+            if cancel is not None and cancel.is_set():
+                break
+    finally:
+        conn.close()
+    stats.elapsed = time.perf_counter() - stats.started
+    stats.done = True
+    return stats
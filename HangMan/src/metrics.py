@@ -0,0 +1,204 @@
+"""
+Lekka instrumentacja gorących ścieżek: liczniki, histogramy czasów wykonania, opcjonalne profilowanie
+(cProfile + tracemalloc) i zrzut metryk w formacie tekstowym Prometheusa albo JSONL.
+"""
+import bisect
+import functools
+import time
+
+BUCKETS = (1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 2_500_000,
+           5_000_000, 10_000_000, 25_000_000, 50_000_000, 100_000_000, 250_000_000, 1_000_000_000)
+PREFIX = "hangman_"
+PROFILE_LINES = 30
+
+
+class Histogram:
+    """
+    Rozkład czasów w stałych przedziałach (ns) — zapis to jedno wyszukiwanie binarne i trzy dodawania.
+    """
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, fraction):
+        """
+        Returns:
+            int: górna granica przedziału zawierającego zadany kwantyl (ns), nie większa niż maksimum.
+        """
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class Metrics:
+    """
+    Rejestr liczników i histogramów. Gdy enabled jest False, opakowane funkcje kosztują jedno sprawdzenie flagi.
+    """
+
+    def __init__(self, enabled=False, clock=time.perf_counter_ns):
+        """
+        Args:
+            enabled (bool): czy zbierać pomiary od startu.
+            clock (callable): zegar w nanosekundach.
+        """
+        self.enabled = enabled
+        self.clock = clock
+        self.counters = {}
+        self.histograms = {}
+        self.profiler = None
+
+    def count(self, name, value=1):
+        """
+        Zwiększa licznik name.
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, value):
+        """
+        Dopisuje czas value (ns) do histogramu name.
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.observe(value)
+
+    def wrap(self, name, function):
+        """
+        Returns:
+            callable: funkcja mierząca czas każdego wywołania function w histogramie name.
+        """
+        clock = self.clock
+        observe = self.observe
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            if not self.enabled:
+                return function(*args, **kwargs)
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                observe(name, clock() - start)
+        return timed
+
+    def instrument(self, target, names):
+        """
+        Podmienia metody obiektu target na wersje mierzone (przez atrybuty instancji). Trzeba to zrobić,
+        zanim metody zostaną przekazane jako callbacki.
+
+        Args:
+            target (object): obiekt z metodami.
+            names (iterable): nazwy metod.
+        """
+        for name in names:
+            setattr(target, name, self.wrap(name, getattr(target, name)))
+
+    def sql_trace(self, statement):
+        """
+        Callback dla sqlite3.Connection.set_trace_callback — zlicza wykonane zapytania.
+        """
+        self.count("sql_statements")
+
+    def reset(self):
+        self.counters = {}
+        self.histograms = {}
+
+    def summary(self):
+        """
+        Returns:
+            list: wiersze tekstu: liczniki oraz liczba wywołań, średnia i kwantyle czasu (ms) dla histogramów.
+        """
+        lines = [f"{name:<20} {value:>10}" for name, value in sorted(self.counters.items())]
+        for name, histogram in sorted(self.histograms.items()):
+            if histogram.count:
+                lines.append(f"{name:<20} {histogram.count:>6}x  mean {histogram.total / histogram.count / 1e6:7.3f}"
+                             f"  p50 {histogram.quantile(0.5) / 1e6:7.3f}  p99 {histogram.quantile(0.99) / 1e6:7.3f}"
+                             f"  max {histogram.max / 1e6:7.3f} ms")
+        return lines
+
+    def prometheus(self):
+        """
+        Returns:
+            str: metryki w formacie tekstowym Prometheusa (czasy w sekundach).
+        """
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            lines += [f"# TYPE {PREFIX}{name}_total counter", f"{PREFIX}{name}_total {value}"]
+        for name, histogram in sorted(self.histograms.items()):
+            metric = f"{PREFIX}{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            seen = 0
+            for bound, count in zip(BUCKETS, histogram.counts):
+                seen += count
+                lines.append(f'{metric}_bucket{{le="{bound / 1e9:g}"}} {seen}')
+            lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram.count}')
+            lines.append(f"{metric}_sum {histogram.total / 1e9:.9f}")
+            lines.append(f"{metric}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """
+        Zapisuje metryki do pliku: .jsonl dopisuje jeden wiersz z bieżącym stanem, inne rozszerzenia
+        nadpisują plik tekstem Prometheusa.
+        """
+        if not path.endswith('.jsonl'):
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(self.prometheus())
+            return
+        import json
+        record = {"time": time.time(), "counters": self.counters, "histograms": {
+            name: {"count": histogram.count, "sum_ms": histogram.total / 1e6, "max_ms": histogram.max / 1e6,
+                   "p50_ms": histogram.quantile(0.5) / 1e6, "p95_ms": histogram.quantile(0.95) / 1e6,
+                   "p99_ms": histogram.quantile(0.99) / 1e6}
+            for name, histogram in self.histograms.items()}}
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(record) + "\n")
+
+    @property
+    def profiling(self):
+        return self.profiler is not None
+
+    def start_profile(self):
+        """
+        Włącza cProfile i tracemalloc (oba spowalniają program — tylko do diagnozy).
+        """
+        import cProfile
+        import tracemalloc
+        tracemalloc.start()
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+
+    def stop_profile(self, path):
+        """
+        Zatrzymuje profilowanie i zapisuje profil (path, do otwarcia w pstats/snakeviz) oraz raport
+        tekstowy path + '.txt' z najdroższymi funkcjami i miejscami alokacji pamięci.
+        """
+        import pstats
+        import tracemalloc
+        profiler, self.profiler = self.profiler, None
+        profiler.disable()
+        allocations = tracemalloc.take_snapshot().statistics('lineno')
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        profiler.dump_stats(path)
+        with open(path + '.txt', 'w', encoding='utf-8') as file:
+            pstats.Stats(profiler, stream=file).sort_stats('cumulative').print_stats(PROFILE_LINES)
+            file.write(f"tracemalloc: current {current / 1024:,.0f} KiB, peak {peak / 1024:,.0f} KiB\n")
+            for stat in allocations[:PROFILE_LINES]:
+                file.write(f"{stat}\n")
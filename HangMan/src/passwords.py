@@ -0,0 +1,94 @@
+"""
+Haszowanie haseł scryptem z solą per użytkownik i zapisanymi parametrami; migracja starych skrótów SHA-256.
+"""
+import hashlib
+import hmac
+import os
+
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+
+def hash_password(password, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+    """
+    Haszuje hasło scryptem z losową solą.
+
+    Args:
+        password (str): hasło.
+        n (int): koszt CPU/pamięci (potęga dwójki).
+        r (int): rozmiar bloku.
+        p (int): współczynnik równoległości.
+
+    Returns:
+        str: zapis w formacie "scrypt$n$r$p$sól$skrót" (sól i skrót w hex).
+    """
+    salt = os.urandom(SALT_BYTES)
+    key = scrypt(password, salt, n, r, p)
+    return f"scrypt${n}${r}${p}${salt.hex()}${key.hex()}"
+
+
+def scrypt(password, salt, n, r, p):
+    """
+    Returns:
+        bytes: klucz wyprowadzony scryptem.
+    """
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p,
+                          maxmem=128 * n * r * p + 1024 * 1024 * 8, dklen=KEY_BYTES)
+
+
+def legacy_hash(password):
+    """
+    Niesolony skrót SHA-256 używany przez starsze wersje gry.
+
+    Returns:
+        str: skrót w hex.
+    """
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+def verify_password(password, stored):
+    """
+    Sprawdza hasło z zapisanym skrótem (scrypt albo stary SHA-256).
+
+    Args:
+        password (str): hasło podane przy logowaniu.
+        stored (str): zawartość kolumny users.password.
+
+    Returns:
+        bool: True jeśli hasło jest poprawne.
+    """
+    if stored.startswith("scrypt$"):
+        _, n, r, p, salt, key = stored.split("$")
+        computed = scrypt(password, bytes.fromhex(salt), int(n), int(r), int(p))
+        return hmac.compare_digest(computed, bytes.fromhex(key))
+    return hmac.compare_digest(legacy_hash(password), stored)
+
+
+def needs_rehash(stored, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+    """
+    Returns:
+        bool: True jeśli skrót jest w starym formacie albo ma inne parametry niż bieżące.
+    """
+    return not stored.startswith(f"scrypt${n}${r}${p}$")
+
+
+def check_login(password, stored):
+    """
+    Weryfikuje hasło i w razie potrzeby od razu liczy nowy skrót; przeznaczone do uruchamiania w wątku roboczym.
+
+    Args:
+        password (str): hasło podane przy logowaniu.
+        stored (str): zapisany skrót albo None, gdy użytkownik nie istnieje.
+
+    Returns:
+        tuple: (czy hasło poprawne, nowy skrót do zapisania albo None).
+    """
+    if stored is None:
+        hash_password(password)
+        return False, None
+    if not verify_password(password, stored):
+        return False, None
+    return True, hash_password(password) if needs_rehash(stored) else None
@@ -0,0 +1,59 @@
+"""
+Rysowanie wisielca w trybie "retained" — elementy Canvas tworzone raz, potem tylko ukrywane/pokazywane.
+"""
+import tkinter as tk
+
+GALLOWS = (
+    (20, 230, 160, 230),
+    (40, 230, 40, 20),
+    (40, 20, 110, 20),
+    (110, 20, 110, 40),
+)
+
+BODY_PARTS = (
+    ('oval', (90, 40, 130, 80)),
+    ('line', (110, 80, 110, 140)),
+    ('line', (110, 90, 80, 110)),
+    ('line', (110, 90, 140, 110)),
+    ('line', (110, 140, 90, 180)),
+    ('line', (110, 140, 130, 180)),
+)
+
+
+class GallowsCanvas(tk.Canvas):
+    """
+    Canvas z szubienicą i sześcioma ukrytymi częściami ciała, odkrywanymi wraz z utratą prób.
+    """
+
+    def __init__(self, master, **kwargs):
+        """
+        Args:
+            master (tk.Widget): rodzic widgetu.
+        """
+        kwargs.setdefault('width', 180)
+        kwargs.setdefault('height', 230)
+        kwargs.setdefault('bg', 'white')
+        super().__init__(master, **kwargs)
+        for coords in GALLOWS:
+            self.create_line(*coords)
+        self.parts = []
+        for kind, coords in BODY_PARTS:
+            create = self.create_oval if kind == 'oval' else self.create_line
+            self.parts.append(create(*coords, state=tk.HIDDEN))
+        self.visible = 0
+
+    def show_parts(self, count):
+        """
+        Pokazuje pierwsze count części ciała, zmieniając stan tylko tych elementów, które tego wymagają.
+
+        Args:
+            count (int): liczba widocznych części (0-6).
+        """
+        count = max(0, min(count, len(self.parts)))
+        if count == self.visible:
+            return
+        low, high = sorted((self.visible, count))
+        state = tk.NORMAL if count > self.visible else tk.HIDDEN
+        for item in self.parts[low:high]:
+            self.itemconfigure(item, state=state)
+        self.visible = count
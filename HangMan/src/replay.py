@@ -0,0 +1,340 @@
+"""
+Dziennik rozgrywek i ich deterministyczne odtwarzanie bez interfejsu.
+
+Gra dopisuje do pliku zwarte rekordy binarne (buforowane w pamięci i zapisywane raz na sesję): początek sesji
+(tryb, ustawienia, gracze) albo blok zapisu snapshot przy wznowieniu, kolejne wylosowane słowa, każdy wpis
+gracza, koniec czasu i wynik końcowy. Odtworzenie podaje te same słowa i wpisy do HangmanEngine tak samo jak
+Game.py, więc po zmianie reguł punktacji można sprawdzić, które zapisane sesje skończyłyby się inaczej.
+
+Format (little-endian): MAGIC na początku pliku, potem rekordy — bajt typu i dane:
+    S  SESSION + użytkownik + liczba graczy + imiona    nowa sesja
+    R  RESUMED + blok snapshot                           sesja wznowiona z zapisu
+    W  WORD + słowo + kategoria                          słowo kolejnej rundy
+    G  GUESS + wpis gracza (do 255 bajtów UTF-8)         próba (także niepoprawna)
+    T  TIME                                              koniec czasu w trybie czasowym
+    E  END + wyniki graczy                               koniec sesji (reason: FINISHED albo ABANDONED)
+Napisy są zapisane jak w snapshot (długość uint16 + UTF-8), czasy to ms od początku sesji.
+
+Użycie: python replay.py replay.log [--show 10]
+"""
+import struct
+import time
+
+import snapshot
+from engine import HangmanEngine, Word, WON, LOST
+
+MAGIC = b'HMR1'
+RECORD_SESSION, RECORD_RESUMED, RECORD_WORD, RECORD_GUESS, RECORD_TIME, RECORD_END = b'SRWGTE'
+SESSION = struct.Struct('<BBBId')
+RESUMED = struct.Struct('<dI')
+WORD = struct.Struct('<q')
+GUESS = struct.Struct('<IB')
+TIME = struct.Struct('<I')
+END = struct.Struct('<IBI')
+SCORE = struct.Struct('<I')
+FINISHED = 0
+ABANDONED = 1
+FLUSH_BYTES = 65536
+
+
+class ReplayLog:
+    """
+    Buforowany zapis dziennika rozgrywek. Rekord próby to kilka bajtów dopisanych do bytearray;
+    plik jest otwierany tylko przy flush (na końcu sesji albo po zebraniu flush_bytes bajtów).
+    """
+
+    def __init__(self, path, flush_bytes=FLUSH_BYTES, clock=time.monotonic):
+        """
+        Args:
+            path (str): plik dziennika (dopisywany).
+            flush_bytes (int): rozmiar bufora, po którym jest zapisywany w trakcie sesji.
+            clock (callable): zegar w sekundach.
+        """
+        self.path = path
+        self.flush_bytes = flush_bytes
+        self.clock = clock
+        self.buffer = bytearray()
+        self.started = None
+
+    def elapsed(self):
+        return int((self.clock() - self.started) * 1000)
+
+    def start(self, mode, fold, max_tries, time_limit, username, players=()):
+        """
+        Zaczyna nową sesję (przed pierwszym losowaniem słowa).
+        """
+        self.started = self.clock()
+        buffer = self.buffer
+        buffer.append(RECORD_SESSION)
+        buffer += SESSION.pack(snapshot.MODES.index(mode), fold, max_tries, time_limit, time.time())
+        buffer += snapshot.pack_text(username)
+        buffer += snapshot.LENGTH.pack(len(players))
+        for name in players:
+            buffer += snapshot.pack_text(name)
+
+    def resume(self, data):
+        """
+        Zaczyna sesję wznowioną z zapisu.
+
+        Args:
+            data (bytes): blok snapshot.encode stanu po wznowieniu.
+        """
+        self.started = self.clock()
+        self.buffer.append(RECORD_RESUMED)
+        self.buffer += RESUMED.pack(time.time(), len(data)) + data
+
+    def word(self, entry):
+        """
+        Zapisuje słowo pobrane do nowej rundy.
+        """
+        if self.started is not None:
+            buffer = self.buffer
+            buffer.append(RECORD_WORD)
+            buffer += WORD.pack(-1 if entry.id is None else entry.id)
+            buffer += snapshot.pack_text(entry.text) + snapshot.pack_text(entry.category)
+
+    def guess(self, text):
+        """
+        Zapisuje wpis gracza w postaci przekazanej do HangmanEngine.guess.
+        """
+        if self.started is not None:
+            data = text.encode('utf-8')[:255]
+            buffer = self.buffer
+            buffer.append(RECORD_GUESS)
+            buffer += GUESS.pack(self.elapsed(), len(data))
+            buffer += data
+            if len(buffer) >= self.flush_bytes:
+                self.flush()
+
+    def time_up(self):
+        if self.started is not None:
+            self.buffer.append(RECORD_TIME)
+            self.buffer += TIME.pack(self.elapsed())
+
+    def end(self, engine, reason=FINISHED):
+        """
+        Zamyka sesję wynikiem silnika i zapisuje bufor do pliku.
+
+        Args:
+            engine (engine.HangmanEngine): silnik po zakończonej sesji.
+            reason (int): FINISHED albo ABANDONED (zamknięcie okna w trakcie gry).
+        """
+        if self.started is None:
+            return
+        scores = engine.scores if engine.mode == 'multiplayer' else ()
+        self.buffer.append(RECORD_END)
+        self.buffer += END.pack(self.elapsed(), reason, engine.score) + snapshot.LENGTH.pack(len(scores))
+        for score in scores:
+            self.buffer += SCORE.pack(score)
+        self.started = None
+        self.flush()
+
+    def flush(self):
+        """
+        Dopisuje bufor do pliku (z MAGIC, jeśli plik jest nowy).
+        """
+        if not self.buffer:
+            return
+        with open(self.path, 'ab') as file:
+            if file.tell() == 0:
+                file.write(MAGIC)
+            file.write(self.buffer)
+        self.buffer = bytearray()
+
+
+class Session:
+    """
+    Sesja odczytana z dziennika.
+    """
+    __slots__ = ("mode", "fold", "max_tries", "time_limit", "username", "players", "started", "snapshot", "words",
+                 "actions", "reason", "score", "scores", "duration")
+
+    def __init__(self, mode, fold, max_tries, time_limit, username, players, started, data=None):
+        self.mode = mode
+        self.fold = fold
+        self.max_tries = max_tries
+        self.time_limit = time_limit
+        self.username = username
+        self.players = players
+        self.started = started
+        self.snapshot = data
+        self.words = []
+        self.actions = []
+        self.reason = None
+        self.score = 0
+        self.scores = []
+        self.duration = 0
+
+
+def read(data):
+    """
+    Odczytuje sesje z zawartości dziennika. Urwany ostatni rekord (np. po awarii) kończy odczyt; sesja bez
+    rekordu E ma reason None.
+
+    Yields:
+        Session: kolejne sesje.
+
+    Raises:
+        ValueError: gdy dane nie są dziennikiem rozgrywek.
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("not a replay log")
+    unpack_text = snapshot.unpack_text
+    offset = len(MAGIC)
+    session = None
+    try:
+        while offset < len(data):
+            kind = data[offset]
+            offset += 1
+            if session is None and kind != RECORD_SESSION and kind != RECORD_RESUMED:
+                raise ValueError("replay log does not start with a session")
+            if kind == RECORD_GUESS:
+                elapsed, size = GUESS.unpack_from(data, offset)
+                offset += GUESS.size
+                session.actions.append(data[offset:offset + size].decode('utf-8', 'replace'))
+                offset += size
+            elif kind == RECORD_WORD:
+                word_id, = WORD.unpack_from(data, offset)
+                text, offset = unpack_text(data, offset + WORD.size)
+                category, offset = unpack_text(data, offset)
+                session.words.append(Word(text, category, None if word_id < 0 else word_id))
+            elif kind == RECORD_SESSION or kind == RECORD_RESUMED:
+                if session is not None:
+                    yield session
+                if kind == RECORD_SESSION:
+                    mode, fold, max_tries, time_limit, started = SESSION.unpack_from(data, offset)
+                    username, offset = unpack_text(data, offset + SESSION.size)
+                    count, = snapshot.LENGTH.unpack_from(data, offset)
+                    offset += snapshot.LENGTH.size
+                    players = []
+                    for _ in range(count):
+                        name, offset = unpack_text(data, offset)
+                        players.append(name)
+                    session = Session(snapshot.MODES[mode], bool(fold), max_tries, time_limit, username, players,
+                                      started)
+                else:
+                    started, size = RESUMED.unpack_from(data, offset)
+                    offset += RESUMED.size
+                    saved = snapshot.decode(data[offset:offset + size])
+                    session = Session(saved.mode, saved.fold, saved.max_tries, saved.time_limit, saved.username,
+                                      saved.player_names, started, data[offset:offset + size])
+                    offset += size
+            elif kind == RECORD_TIME:
+                session.actions.append(None)
+                offset += TIME.size
+            elif kind == RECORD_END:
+                session.duration, session.reason, session.score = END.unpack_from(data, offset)
+                offset += END.size
+                count, = snapshot.LENGTH.unpack_from(data, offset)
+                offset += snapshot.LENGTH.size
+                session.scores = [SCORE.unpack_from(data, offset + i * SCORE.size)[0] for i in range(count)]
+                offset += count * SCORE.size
+            else:
+                raise ValueError(f"unknown replay record {kind:#x} at offset {offset - 1}")
+    except (struct.error, IndexError, UnicodeDecodeError):
+        pass
+    if session is not None:
+        yield session
+
+
+class ReplayError(Exception):
+    """
+    Sesja nie da się odtworzyć według bieżących reguł (np. potrzebuje więcej słów, niż zapisano).
+    """
+
+
+def replay(session):
+    """
+    Odtwarza sesję przez HangmanEngine, wykonując te same kroki co Game.py: start sesji, próby,
+    after_round po wygranej lub przegranej (przegrana w trybie czasowym i koniec czasu kończą sesję).
+
+    Args:
+        session (Session): odczytana sesja.
+
+    Returns:
+        tuple: (silnik po odtworzeniu, czy sesja się zakończyła).
+
+    Raises:
+        ReplayError: gdy zabraknie zapisanych słów.
+    """
+    words = iter(session.words)
+
+    def word_source():
+        entry = next(words, None)
+        if entry is None:
+            raise ReplayError("session needs more words than were recorded")
+        return entry
+
+    engine = HangmanEngine(word_source, session.max_tries, session.fold)
+    if session.snapshot is not None:
+        saved = snapshot.decode(session.snapshot)
+        snapshot.restore(saved, engine, Word(saved.word, saved.category, saved.word_id))
+        running = True
+    elif session.mode == 'multiplayer':
+        running = engine.start_multiplayer(session.players)
+    else:
+        engine.start_singleplayer(session.mode == 'timed')
+        running = True
+    guess = engine.guess
+    for action in session.actions:
+        if not running:
+            break
+        if action is None:
+            running = False
+            break
+        result = guess(action)
+        if result == WON or result == LOST:
+            if result == LOST and engine.mode == 'timed':
+                running = False
+            else:
+                running = engine.after_round(result == WON)
+    return engine, not running
+
+
+def verify(session):
+    """
+    Odtwarza zakończoną sesję i porównuje wynik z zapisanym.
+
+    Returns:
+        str: opis rozbieżności albo None, gdy wynik się zgadza (lub sesja nie została dokończona).
+    """
+    if session.reason != FINISHED:
+        return None
+    try:
+        engine, finished = replay(session)
+    except ReplayError as e:
+        return str(e)
+    if not finished:
+        return "session does not end where it was recorded"
+    if engine.mode == 'multiplayer':
+        if engine.scores != session.scores:
+            return f"scores {engine.scores} != recorded {session.scores}"
+    elif engine.score != session.score:
+        return f"score {engine.score} != recorded {session.score}"
+    return None
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path')
+    parser.add_argument('--show', type=int, default=10, help="liczba wypisanych rozbieżności")
+    args = parser.parse_args()
+    with open(args.path, 'rb') as file:
+        log = file.read()
+    start = time.perf_counter()
+    sessions = finished = guesses = mismatches = 0
+    for recorded in read(log):
+        sessions += 1
+        finished += recorded.reason == FINISHED
+        guesses += len(recorded.actions)
+        problem = verify(recorded)
+        if problem is not None:
+            mismatches += 1
+            if mismatches <= args.show:
+                players = ", ".join(recorded.players) or recorded.username
+                print(f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(recorded.started))} {recorded.mode} "
+                      f"({players}): {problem}")
+    elapsed = time.perf_counter() - start
+    print(f"{sessions} sessions ({finished} finished), {guesses} guesses, {mismatches} mismatches; "
+          f"{elapsed:.2f} s ({sessions / elapsed if elapsed else 0:,.0f} sessions/s)")
@@ -0,0 +1,79 @@
+"""
+Odliczanie czasu w trybie czasowym oparte na zegarze monotonicznym i jednym oczekującym wywołaniu after.
+"""
+import time
+
+TICK_RESOLUTION = 0.1
+
+
+class DeadlineTimer:
+    """
+    Timer z twardym terminem: zawsze ma co najwyżej jedno zaplanowane wywołanie i kończy się dokładnie w terminie.
+    """
+
+    def __init__(self, root, duration, on_tick, on_expire, resolution=TICK_RESOLUTION, clock=time.monotonic):
+        """
+        Args:
+            root (tkinter.Misc): obiekt z metodami after/after_cancel (np. tk.Tk).
+            duration (float): czas trwania w sekundach.
+            on_tick (callable): wywoływana z pozostałym czasem (float) przy każdym tyknięciu.
+            on_expire (callable): wywoływana raz po upływie terminu.
+            resolution (float): odstęp między tyknięciami w sekundach.
+            clock (callable): źródło czasu, domyślnie time.monotonic.
+        """
+        self.root = root
+        self.duration = duration
+        self.on_tick = on_tick
+        self.on_expire = on_expire
+        self.resolution = resolution
+        self.clock = clock
+        self.deadline = None
+        self.pending = None
+
+    @property
+    def running(self):
+        return self.deadline is not None
+
+    def start(self):
+        """
+        Ustala termin i planuje pierwsze tyknięcie (anuluje poprzednie odliczanie).
+        """
+        self.cancel()
+        self.deadline = self.clock() + self.duration
+        self.tick()
+
+    def remaining(self):
+        """
+        Returns:
+            float: pozostały czas w sekundach (0 po upływie terminu lub gdy timer nie działa).
+        """
+        if self.deadline is None:
+            return 0.0
+        return max(0.0, self.deadline - self.clock())
+
+    def cancel(self):
+        """
+        Zatrzymuje odliczanie i usuwa zaplanowane wywołanie.
+        """
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+            self.pending = None
+        self.deadline = None
+
+    def tick(self):
+        """
+        Wywołuje on_tick albo on_expire i planuje następne tyknięcie na granicy rozdzielczości lub w terminie.
+        """
+        self.pending = None
+        if self.deadline is None:
+            return
+        remaining = self.deadline - self.clock()
+        if remaining <= 0:
+            self.deadline = None
+            self.on_expire()
+            return
+        self.on_tick(remaining)
+        if self.deadline is None or self.pending is not None:
+            return
+        delay = remaining % self.resolution or self.resolution
+        self.pending = self.root.after(max(1, round(delay * 1000)), self.tick)
@@ -0,0 +1,339 @@
+"""
+Serwer multiplayer (asyncio) — wiele pokoi w jednym procesie, reguły gry z HangmanEngine.
+
+Protokół: jeden obiekt JSON na linię w obie strony.
+
+Klient wysyła:
+    {"op": "create"[, "fold": true]}                  -> {"event": "created", "room": 1}
+    {"op": "join", "room": 1, "name": "Ala"}          -> {"event": "joined", "room": 1, "players": [...]}
+    {"op": "start"}                                   -> do pokoju: {"event": "state", ...}
+    {"op": "guess", "letter": "a"}                    -> do pokoju: {"event": "state", ...} / {"event": "over", ...}
+
+Stan pokoju: {"event": "state", "room", "display", "tries", "turn", "scores", "active", "result", "letter"[, "word"]}
+("word" — odgadywane słowo, gdy poprzednia runda się skończyła; "display" dotyczy już nowej rundy).
+Błędy: {"event": "error", "message": "..."}. "fold" włącza tryb łatwy (litery bez polskich znaków
+diakrytycznych, np. "l" odkrywa "ł"). Pokoje, do których nikt nie dołączył, są zamykane po rozłączeniu twórcy.
+
+Użycie: python server.py [--host 127.0.0.1] [--port 8765] [--words ../../hasla.txt]
+"""
+import argparse
+import asyncio
+import json
+import random
+
+from engine import HangmanEngine, Word, INVALID, REPEATED, HIT, MISS, WON, LOST
+from importer import open_word_file, parse_line
+
+MAX_PLAYERS = 8
+MAX_ROOMS = 100_000
+MAX_WAITING_ROOMS = 4
+MAX_NAME = 32
+LINE_LIMIT = 1024
+WRITE_BUFFER_LIMIT = 64 * 1024
+
+RESULTS = {INVALID: 'invalid', REPEATED: 'repeated', HIT: 'hit', MISS: 'miss', WON: 'won', LOST: 'lost'}
+
+
+class Room:
+    """
+    Pokój gry: gracze (Client, None po rozłączeniu) w kolejności dołączenia i silnik gry multiplayer.
+    """
+    __slots__ = ("id", "engine", "names", "clients", "started")
+
+    def __init__(self, room_id, word_source, fold=False):
+        self.id = room_id
+        self.engine = HangmanEngine(word_source, fold=fold)
+        self.names = []
+        self.clients = []
+        self.started = False
+
+
+class Client:
+    """
+    Połączenie klienta, pokój, do którego dołączył, i numery pokoi, które utworzył.
+    """
+    __slots__ = ("writer", "room", "seat", "created")
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.room = None
+        self.seat = None
+        self.created = []
+
+
+class HangmanServer:
+    """
+    Obsługa połączeń i pokoi. Cała logika jest synchroniczna i działa w pętli zdarzeń, więc pokoje
+    nie wymagają blokad.
+    """
+
+    def __init__(self, word_source, max_rooms=MAX_ROOMS):
+        """
+        Args:
+            word_source (callable): funkcja zwracająca obiekt Word dla nowej rundy.
+            max_rooms (int): maksymalna liczba jednocześnie otwartych pokoi.
+        """
+        self.word_source = word_source
+        self.max_rooms = max_rooms
+        self.rooms = {}
+        self.next_room = 1
+        self.guesses = 0
+
+    async def handle(self, reader, writer):
+        """
+        Czyta komunikaty klienta linia po linii aż do rozłączenia.
+        """
+        client = Client(writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    self.send(writer, {"event": "error", "message": "invalid json"})
+                    continue
+                if isinstance(message, dict):
+                    self.dispatch(client, message)
+        finally:
+            self.leave(client)
+            writer.close()
+
+    def send(self, writer, payload):
+        """
+        Wysyła komunikat; klient, który nie odbiera danych (pełny bufor), jest rozłączany.
+        """
+        if writer.is_closing():
+            return
+        if writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+            writer.close()
+            return
+        writer.write(json.dumps(payload, separators=(',', ':')).encode() + b'\n')
+
+    def broadcast(self, room, payload):
+        data = json.dumps(payload, separators=(',', ':')).encode() + b'\n'
+        for client in room.clients:
+            if client is None or client.writer.is_closing():
+                continue
+            writer = client.writer
+            if writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+                writer.close()
+                continue
+            writer.write(data)
+
+    def error(self, client, message):
+        self.send(client.writer, {"event": "error", "message": message})
+
+    def dispatch(self, client, message):
+        """
+        Wykonuje polecenie klienta.
+        """
+        op = message.get("op")
+        if op == "guess":
+            self.guess(client, message.get("letter"))
+        elif op == "create":
+            self.create(client, message.get("fold") is True)
+        elif op == "join":
+            self.join(client, message.get("room"), message.get("name"))
+        elif op == "start":
+            self.start(client)
+        else:
+            self.error(client, "unknown op")
+
+    def waiting(self, room_id):
+        """
+        Returns:
+            bool: czy pokój istnieje, nie wystartował i nikt w nim nie siedzi.
+        """
+        room = self.rooms.get(room_id)
+        return room is not None and not room.started and all(client is None for client in room.clients)
+
+    def create(self, client, fold):
+        """
+        Tworzy pokój. Twórca nie musi do niego dołączać, więc każdy klient może mieć najwyżej
+        MAX_WAITING_ROOMS pustych pokoi, a przy rozłączeniu są one usuwane.
+        """
+        client.created = [room_id for room_id in client.created if self.waiting(room_id)]
+        if len(self.rooms) >= self.max_rooms or len(client.created) >= MAX_WAITING_ROOMS:
+            self.error(client, "too many rooms")
+            return
+        room = Room(self.next_room, self.word_source, fold)
+        self.rooms[room.id] = room
+        self.next_room += 1
+        client.created.append(room.id)
+        self.send(client.writer, {"event": "created", "room": room.id})
+
+    def join(self, client, room_id, name):
+        name = name.strip() if isinstance(name, str) else ""
+        room = self.rooms.get(room_id) if type(room_id) is int else None
+        if room is None:
+            self.error(client, "no such room")
+        elif client.room is not None:
+            self.error(client, "already in a room")
+        elif room.started or len(room.names) >= MAX_PLAYERS:
+            self.error(client, "room is closed")
+        elif not name or len(name) > MAX_NAME or name in room.names:
+            self.error(client, "invalid name")
+        else:
+            client.room = room
+            client.seat = len(room.names)
+            room.names.append(name)
+            room.clients.append(client)
+            self.broadcast(room, {"event": "joined", "room": room.id, "players": room.names})
+
+    def start(self, client):
+        room = client.room
+        if room is None or room.started:
+            self.error(client, "cannot start")
+            return
+        if sum(member is not None for member in room.clients) < 2:
+            self.error(client, "need at least 2 players")
+            return
+        room.started = True
+        engine = room.engine
+        engine.start_multiplayer(room.names)
+        for seat, member in enumerate(room.clients):
+            if member is None:
+                engine.active_players[seat] = False
+        if not engine.active_players[engine.current_player] and not engine.next_turn():
+            self.finish(room)
+            return
+        self.broadcast(room, self.state(room, None))
+
+    def guess(self, client, letter):
+        room = client.room
+        if room is None or not room.started:
+            self.error(client, "game not started")
+            return
+        engine = room.engine
+        if engine.current_player != client.seat:
+            self.error(client, "not your turn")
+            return
+        if not isinstance(letter, str):
+            self.error(client, "invalid letter")
+            return
+        letter = letter.lower()
+        result = engine.guess(letter)
+        if result == INVALID or result == REPEATED:
+            self.send(client.writer, {"event": "rejected", "result": RESULTS[result]})
+            return
+        self.guesses += 1
+        if result == WON or result == LOST:
+            word = engine.round.word
+            if engine.after_round(result == WON):
+                self.broadcast(room, self.state(room, result, letter, word))
+            else:
+                self.finish(room)
+        else:
+            self.broadcast(room, self.state(room, result, letter))
+
+    def state(self, room, result, letter=None, word=None):
+        """
+        Returns:
+            dict: stan pokoju do wysłania graczom.
+        """
+        engine = room.engine
+        payload = {
+            "event": "state",
+            "room": room.id,
+            "display": engine.round.display_word(),
+            "tries": engine.round.tries,
+            "turn": room.names[engine.current_player],
+            "scores": engine.scores,
+            "active": engine.active_players,
+            "result": RESULTS.get(result),
+            "letter": letter,
+        }
+        if word is not None:
+            payload["word"] = word
+        return payload
+
+    def finish(self, room):
+        """
+        Wysyła wyniki końcowe i zamyka pokój; gracze mogą potem dołączyć do innego pokoju.
+        """
+        self.broadcast(room, {"event": "over", "room": room.id,
+                              "scores": dict(zip(room.names, room.engine.scores))})
+        self.rooms.pop(room.id, None)
+        for client in room.clients:
+            if client is not None:
+                client.room = None
+                client.seat = None
+
+    def leave(self, client):
+        """
+        Usuwa rozłączonego gracza: przed startem zwalnia miejsce, w trakcie gry eliminuje go jak przegraną.
+        Pokoje utworzone przez klienta, do których nikt nie dołączył, są zamykane.
+        """
+        for room_id in client.created:
+            if self.waiting(room_id):
+                del self.rooms[room_id]
+        client.created = []
+        room = client.room
+        if room is None:
+            return
+        client.room = None
+        room.clients[client.seat] = None
+        if all(member is None for member in room.clients):
+            self.rooms.pop(room.id, None)
+            return
+        if not room.started:
+            return
+        engine = room.engine
+        engine.active_players[client.seat] = False
+        if engine.current_player == client.seat:
+            if engine.next_turn():
+                self.broadcast(room, self.state(room, None))
+            else:
+                self.finish(room)
+
+    async def serve(self, host, port):
+        """
+        Uruchamia serwer TCP.
+
+        Returns:
+            asyncio.Server: uruchomiony serwer.
+        """
+        return await asyncio.start_server(self.handle, host, port, limit=LINE_LIMIT)
+
+
+def file_word_source(path, rng=random):
+    """
+    Wczytuje listę słów (słowo;kategoria) i zwraca funkcję losującą słowa dla rund. Plik .corpus
+    (zbudowany przez corpus.py) jest otwierany przez mmap — kilka procesów serwera współdzieli wtedy słowa.
+
+    Returns:
+        callable: funkcja bez argumentów zwracająca Word.
+    """
+    if str(path).endswith('.corpus'):
+        from corpus import Corpus
+        words = Corpus(path)
+        if not len(words):
+            raise ValueError(f"no words in {path}")
+        return lambda: words.sample(rng=rng)
+    with open_word_file(path) as file:
+        rows = [row for row in map(parse_line, file) if row]
+    if not rows:
+        raise ValueError(f"no words in {path}")
+    return lambda: Word(*rows[rng.randrange(len(rows))])
+
+
+async def main(host, port, words):
+    server = HangmanServer(file_word_source(words))
+    tcp = await server.serve(host, port)
+    print(f"Hangman server listening on {host}:{port}")
+    async with tcp:
+        await tcp.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--words', default='../../hasla.txt')
+    args = parser.parse_args()
+    asyncio.run(main(args.host, args.port, args.words))
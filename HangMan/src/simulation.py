@@ -0,0 +1,91 @@
+"""
+Rozgrywanie pełnych sesji (singleplayer normalny/czasowy, multiplayer) bez interfejsu, przez HangmanEngine.
+"""
+import time
+
+from engine import WON, LOST
+
+DEFAULT_MAX_ROUNDS = 1000
+
+
+class SessionResult:
+    """
+    Podsumowanie symulowanej sesji.
+    """
+    __slots__ = ("mode", "rounds", "guesses", "score", "scores")
+
+    def __init__(self, mode, rounds, guesses, score, scores):
+        self.mode = mode
+        self.rounds = rounds
+        self.guesses = guesses
+        self.score = score
+        self.scores = scores
+
+
+def play_round(engine, strategy, latencies=None):
+    """
+    Zgaduje litery podane przez strategię, aż runda się zakończy.
+
+    Args:
+        engine (engine.HangmanEngine): silnik z rozpoczętą rundą.
+        strategy: obiekt z metodą next_letter(round).
+        latencies (list): jeśli podana, dopisywany jest czas każdego engine.guess w nanosekundach.
+
+    Returns:
+        tuple: (wynik WON/LOST, liczba prób zgadnięcia).
+    """
+    state = engine.round
+    guess = engine.guess
+    next_letter = strategy.next_letter
+    guesses = 0
+    while True:
+        letter = next_letter(state)
+        if latencies is None:
+            result = guess(letter)
+        else:
+            start = time.perf_counter_ns()
+            result = guess(letter)
+            latencies.append(time.perf_counter_ns() - start)
+        guesses += 1
+        if result == WON or result == LOST:
+            return result, guesses
+
+
+def play_session(engine, strategy, mode, players=None, time_limit=None, guess_time=1.0,
+                 max_rounds=DEFAULT_MAX_ROUNDS, latencies=None):
+    """
+    Rozgrywa całą sesję według reguł silnika.
+
+    Tryb czasowy używa zegara wirtualnego: każda próba kosztuje guess_time sekund, a sesja kończy się,
+    gdy suma przekroczy time_limit (albo po przegranej rundzie, jak w grze).
+
+    Args:
+        engine (engine.HangmanEngine): silnik.
+        strategy: strategia zgadywania.
+        mode (str): 'normal', 'timed' albo 'multiplayer'.
+        players (list): imiona graczy w trybie multiplayer.
+        time_limit (float): limit czasu w trybie czasowym (sekundy).
+        guess_time (float): wirtualny czas jednej próby.
+        max_rounds (int): górna granica liczby rund (dobra strategia w trybie normalnym mogłaby grać bez końca).
+        latencies (list): zbiera czasy pojedynczych prób (ns).
+
+    Returns:
+        SessionResult: podsumowanie sesji.
+    """
+    rounds = guesses = 0
+    if mode == 'multiplayer':
+        running = engine.start_multiplayer(players)
+    else:
+        engine.start_singleplayer(mode == 'timed')
+        running = True
+    elapsed = 0.0
+    while running and rounds < max_rounds:
+        result, count = play_round(engine, strategy, latencies)
+        rounds += 1
+        guesses += count
+        if mode == 'timed':
+            elapsed += count * guess_time
+            if elapsed >= time_limit:
+                break
+        running = engine.after_round(result == WON)
+    return SessionResult(mode, rounds, guesses, engine.score, list(engine.scores))
@@ -0,0 +1,180 @@
+"""
+Zapis i wznawianie przerwanej sesji — stan silnika w małym binarnym bloku zapisywanym atomowo.
+
+Format (little-endian): nagłówek HEADER, potem napisy UTF-8 poprzedzone długością (użytkownik, słowo,
+kategoria, litery spoza ALPHABET), a w multiplayer lista graczy (imię, wynik, aktywny). Odgadnięte litery
+alfabetu zajmują jedną 64-bitową maskę.
+"""
+import struct
+
+from engine import Round
+from fileutil import atomic_write
+from strategies import ALPHABET
+
+MAGIC = b'HMS2'
+MODES = ('normal', 'timed', 'multiplayer')
+HEADER = struct.Struct('<4sBBBBHIIqQd')
+LENGTH = struct.Struct('<H')
+PLAYER = struct.Struct('<IB')
+
+LETTER_BITS = {letter: 1 << index for index, letter in enumerate(ALPHABET)}
+FOLD_FLAG = 1
+
+
+class Snapshot:
+    """
+    Odczytany stan sesji.
+    """
+    __slots__ = ("username", "mode", "fold", "max_tries", "tries", "current_player", "score", "time_limit", "word_id",
+                 "guessed", "remaining", "word", "category", "player_names", "scores", "active_players")
+
+    def __init__(self, username, mode, fold, max_tries, tries, current_player, score, time_limit, word_id, guessed,
+                 remaining, word, category, player_names=(), scores=(), active_players=()):
+        self.username = username
+        self.mode = mode
+        self.fold = fold
+        self.max_tries = max_tries
+        self.tries = tries
+        self.current_player = current_player
+        self.score = score
+        self.time_limit = time_limit
+        self.word_id = word_id
+        self.guessed = guessed
+        self.remaining = remaining
+        self.word = word
+        self.category = category
+        self.player_names = list(player_names)
+        self.scores = list(scores)
+        self.active_players = list(active_players)
+
+
+def pack_text(text):
+    data = text.encode('utf-8')
+    return LENGTH.pack(len(data)) + data
+
+
+def unpack_text(data, offset):
+    size, = LENGTH.unpack_from(data, offset)
+    offset += LENGTH.size
+    return data[offset:offset + size].decode('utf-8'), offset + size
+
+
+def encode(engine, username, remaining=0.0, time_limit=0):
+    """
+    Serializuje bieżącą rundę i wyniki silnika.
+
+    Args:
+        engine (engine.HangmanEngine): silnik w trakcie gry.
+        username (str): zalogowany użytkownik.
+        remaining (float): pozostały czas trybu czasowego w sekundach.
+        time_limit (int): limit czasu trybu czasowego w sekundach.
+
+    Returns:
+        bytes: blok zapisu (kilkadziesiąt bajtów dla gry singleplayer).
+    """
+    state = engine.round
+    mask = 0
+    extra = []
+    for letter in sorted(state.guessed):
+        bit = LETTER_BITS.get(letter)
+        if bit is None:
+            extra.append(letter)
+        else:
+            mask |= bit
+    multiplayer = engine.mode == 'multiplayer'
+    parts = [
+        HEADER.pack(MAGIC, MODES.index(engine.mode), FOLD_FLAG if state.fold else 0, engine.max_tries, state.tries,
+                    engine.current_player if multiplayer else 0, engine.score, time_limit,
+                    -1 if state.word_id is None else state.word_id, mask, remaining),
+        pack_text(username), pack_text(state.word), pack_text(state.category), pack_text(''.join(extra)),
+    ]
+    if multiplayer:
+        parts.append(LENGTH.pack(len(engine.player_names)))
+        for name, score, active in zip(engine.player_names, engine.scores, engine.active_players):
+            parts.append(pack_text(name) + PLAYER.pack(score, active))
+    return b''.join(parts)
+
+
+def decode(data):
+    """
+    Odczytuje blok zapisany przez encode.
+
+    Returns:
+        Snapshot: stan sesji.
+
+    Raises:
+        ValueError: gdy dane są uszkodzone lub w innym formacie.
+    """
+    try:
+        magic, mode, flags, max_tries, tries, current, score, time_limit, word_id, mask, remaining = \
+            HEADER.unpack_from(data)
+        if magic != MAGIC or mode >= len(MODES):
+            raise ValueError("not a session snapshot")
+        offset = HEADER.size
+        username, offset = unpack_text(data, offset)
+        word, offset = unpack_text(data, offset)
+        category, offset = unpack_text(data, offset)
+        extra, offset = unpack_text(data, offset)
+        names, scores, active = [], [], []
+        if MODES[mode] == 'multiplayer':
+            count, = LENGTH.unpack_from(data, offset)
+            offset += LENGTH.size
+            for _ in range(count):
+                name, offset = unpack_text(data, offset)
+                player_score, player_active = PLAYER.unpack_from(data, offset)
+                offset += PLAYER.size
+                names.append(name)
+                scores.append(player_score)
+                active.append(bool(player_active))
+    except (struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f"corrupt session snapshot: {e}") from e
+    guessed = {letter for letter, bit in LETTER_BITS.items() if mask & bit}
+    guessed.update(extra)
+    return Snapshot(username, MODES[mode], bool(flags & FOLD_FLAG), max_tries, tries, current, score, time_limit,
+                    None if word_id < 0 else word_id, guessed, remaining, word, category, names, scores, active)
+
+
+def restore(snapshot, engine, entry):
+    """
+    Przywraca stan silnika: odtwarza rundę dla słowa entry i odgadnięte litery.
+
+    Args:
+        snapshot (Snapshot): odczytany stan.
+        engine (engine.HangmanEngine): silnik do nadpisania.
+        entry (engine.Word): słowo rundy (z puli albo odtworzone z zapisu).
+    """
+    engine.mode = snapshot.mode
+    engine.fold = snapshot.fold
+    engine.max_tries = snapshot.max_tries
+    engine.score = snapshot.score
+    engine.player_names = snapshot.player_names
+    engine.scores = snapshot.scores
+    engine.active_players = snapshot.active_players
+    engine.current_player = snapshot.current_player
+    state = engine.round = Round(entry, snapshot.tries, snapshot.fold)
+    for letter in snapshot.guessed:
+        state.guessed.add(letter)
+        positions = state.positions.get(letter)
+        if positions:
+            for index in positions:
+                state.display[index] = state.word[index]
+            state.remaining -= 1
+
+
+def save(path, data):
+    """
+    Zapisuje blok atomowo (fileutil.atomic_write).
+    """
+    atomic_write(path, (data,))
+
+
+def load(path):
+    """
+    Returns:
+        Snapshot: zapisany stan albo None, gdy pliku nie ma lub jest uszkodzony.
+    """
+    try:
+        with open(path, 'rb') as file:
+            return decode(file.read())
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,306 @@
+"""
+Podpowiedzi i solver: indeks wzorców słów pogrupowanych według (długość, kategoria) ze zbiorami bitowymi
+(int Pythona, bit i = i-te słowo grupy) dla każdej pozycji i litery oraz liczby wystąpień liter. Zawężenie
+kandydatów do stanu rundy to kilkadziesiąt operacji AND na liczbach całkowitych zamiast przeglądu słownika.
+"""
+import threading
+
+from engine import FOLD
+from strategies import ALPHABET, SEPARATORS, FrequencyStrategy
+
+GROUPS = {}
+for exact, folded in FOLD.items():
+    GROUPS.setdefault(folded, [folded]).append(exact)
+RANK = {letter: i for i, letter in enumerate(ALPHABET)}
+
+
+def bitset(indexes, size):
+    """
+    Returns:
+        int: liczba z ustawionymi bitami o podanych numerach (budowana przez bytearray w czasie liniowym).
+    """
+    data = bytearray((size + 7) >> 3)
+    for index in indexes:
+        data[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(data, 'little')
+
+
+def ranked(letters, totals):
+    """
+    Returns:
+        list: litery od występujących w największej liczbie słów (przy remisie w kolejności ALPHABET).
+    """
+    return sorted(letters, key=lambda letter: (-totals[letter], RANK.get(letter, len(RANK))))
+
+
+class Hint:
+    """
+    Podpowiedź: najlepsza następna litera i liczba słów zgodnych ze stanem rundy.
+    """
+    __slots__ = ("letter", "candidates")
+
+    def __init__(self, letter, candidates):
+        self.letter = letter
+        self.candidates = candidates
+
+
+class Bucket:
+    """
+    Słowa jednej długości i kategorii ze zbiorami bitowymi: positions[p][litera], counts[litera][k]
+    (słowa z dokładnie k wystąpieniami litery) i contains[litera], a także folded[litera] dla trybu łatwego.
+    order i folded_order to litery od występujących w największej liczbie słów grupy.
+    """
+    __slots__ = ("indexes", "all", "positions", "counts", "contains", "folded", "totals", "folded_totals", "order",
+                 "folded_order")
+
+    def __init__(self, indexes, texts, length):
+        """
+        Args:
+            indexes (list): pozycje słów w puli.
+            texts (sequence): słowa puli.
+            length (int): długość słów.
+        """
+        size = len(indexes)
+        positions = [{} for _ in range(length)]
+        counts = {}
+        for bit, index in enumerate(indexes):
+            text = texts[index]
+            seen = {}
+            for position, letter in enumerate(text):
+                positions[position].setdefault(letter, []).append(bit)
+                seen[letter] = seen.get(letter, 0) + 1
+            for letter, count in seen.items():
+                counts.setdefault(letter, {}).setdefault(count, []).append(bit)
+        self.indexes = indexes
+        self.all = (1 << size) - 1
+        self.positions = [{letter: bitset(bits, size) for letter, bits in letters.items()} for letters in positions]
+        self.counts = {letter: {count: bitset(bits, size) for count, bits in by_count.items()}
+                       for letter, by_count in counts.items()}
+        self.contains = {}
+        for letter, by_count in self.counts.items():
+            contains = 0
+            for bits in by_count.values():
+                contains |= bits
+            self.contains[letter] = contains
+        self.folded = {}
+        for letter, contains in self.contains.items():
+            if letter not in SEPARATORS:
+                folded = FOLD.get(letter, letter)
+                self.folded[folded] = self.folded.get(folded, 0) | contains
+        self.totals = {letter: contains.bit_count() for letter, contains in self.contains.items()}
+        self.folded_totals = {letter: contains.bit_count() for letter, contains in self.folded.items()}
+        self.order = ranked([letter for letter in self.contains if letter not in SEPARATORS], self.totals)
+        self.folded_order = ranked(self.folded, self.folded_totals)
+
+
+class PatternIndex:
+    """
+    Indeks wzorców nad pulą słów (WordPool, Corpus albo lista słów). Grupy słów są wyznaczane przy tworzeniu
+    indeksu (nad korpusem z by_category — dla całej kategorii przy pierwszym zapytaniu o nią), a zbiory bitowe
+    grupy — przy pierwszym zapytaniu o nią (albo z góry przez bucket w tle).
+    refresh działa w jednym wątku naraz (np. roboczym); bucket może działać równolegle w innym wątku — grupa
+    zbudowana przed odświeżeniem nie zostanie zapamiętana (licznik generation). Ma metodę next_letter, więc działa też jako strategia dla simulation i evaluator.
+    """
+
+    def __init__(self, texts, categories=None, by_category=None):
+        """
+        Args:
+            texts (sequence): słowa (np. WordPool.texts).
+            categories (sequence): kategorie słów (np. WordPool.categories) albo None — wtedy grupy
+                są tylko według długości.
+            by_category (dict): kategoria -> pozycje słów (Corpus.by_category) dla puli tylko do odczytu —
+                wtedy indeks nie przechodzi całej puli, tylko grupuje kategorię przy pierwszym zapytaniu o nią.
+        """
+        self.texts = texts
+        self.categories = categories
+        self.by_category = by_category
+        self.grouped = set()
+        self.groups = {}
+        self.buckets = {}
+        self.indexed = 0 if by_category is None else len(texts)
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.fallback = None
+        self.refresh()
+
+    def refresh(self):
+        """
+        Dopisuje do grup słowa dodane do puli od ostatniego odświeżenia; zmienione grupy są przebudowywane
+        przy następnym zapytaniu.
+
+        Returns:
+            int: liczba dodanych słów (0 dla puli tylko do odczytu z by_category).
+        """
+        if self.by_category is not None:
+            return 0
+        texts = self.texts
+        categories = self.categories
+        start = self.indexed
+        # Pula może rosnąć w trakcie (WordPool.extend w wątku Tk dopisuje texts przed categories) — bierzemy
+        # tylko słowa obecne w obu listach i indeksujemy je po pozycji, nie iteratorem żywej listy.
+        end = len(texts) if categories is None else min(len(texts), len(categories))
+        if start == end:
+            return 0
+        groups = self.groups
+        if start == 0:
+            if categories is None:
+                for index in range(end):
+                    groups.setdefault((len(texts[index]), None), []).append(index)
+            else:
+                for index in range(end):
+                    groups.setdefault((len(texts[index]), categories[index]), []).append(index)
+            changed = list(groups)
+        else:
+            changed = set()
+            for index in range(start, end):
+                key = (len(texts[index]), None if categories is None else categories[index])
+                groups.setdefault(key, []).append(index)
+                changed.add(key)
+        with self.lock:
+            self.generation += 1
+            for key in changed:
+                self.buckets.pop(key, None)
+        self.indexed = end
+        return end - start
+
+    def bucket(self, length, category=None):
+        """
+        Returns:
+            Bucket: grupa słów danej długości i kategorii (budowana przy pierwszym użyciu) albo None.
+        """
+        key = (length, category if self.categories is not None else None)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            generation = self.generation
+            indexes = self.groups.get(key)
+            if indexes is None:
+                if self.by_category is None or key[1] in self.grouped:
+                    return None
+                indexes = self.group(key[1]).get(length)
+                if indexes is None:
+                    return None
+            bucket = Bucket(list(indexes), self.texts, length)
+            with self.lock:
+                if self.generation == generation:
+                    self.buckets[key] = bucket
+        return bucket
+
+    def group(self, category):
+        """
+        Dzieli słowa kategorii z by_category na grupy według długości i dopisuje je do groups.
+
+        Returns:
+            dict: długość -> pozycje słów.
+        """
+        texts = self.texts
+        lengths = {}
+        for index in self.by_category.get(category, ()):
+            lengths.setdefault(len(texts[index]), []).append(index)
+        with self.lock:
+            for length, indexes in lengths.items():
+                self.groups.setdefault((length, category), indexes)
+            self.grouped.add(category)
+        return lengths
+
+    def cached(self, length, category=None):
+        """
+        Returns:
+            bool: czy grupa słów danej długości i kategorii jest już zbudowana.
+        """
+        return (length, category if self.categories is not None else None) in self.buckets
+
+    def matches(self, state):
+        """
+        Zawęża grupę słowa rundy do słów zgodnych z odkrytymi literami i zgadniętymi literami: odkryta
+        litera musi stać na swojej pozycji, a każda zgadnięta litera (i separator) musi wystąpić w słowie
+        dokładnie tyle razy, ile jest jej odkrytych — nietrafione zero razy.
+
+        Args:
+            state (engine.Round): bieżąca runda.
+
+        Returns:
+            tuple: (Bucket albo None, zbiór bitowy kandydatów).
+        """
+        display = state.display
+        bucket = self.bucket(len(display), state.category)
+        if bucket is None:
+            return None, 0
+        candidates = bucket.all
+        revealed = {}
+        positions = bucket.positions
+        for position, letter in enumerate(display):
+            if letter != '_':
+                candidates &= positions[position].get(letter, 0)
+                revealed[letter] = revealed.get(letter, 0) + 1
+        letters = set(SEPARATORS)
+        for letter in state.guessed:
+            letters.update(GROUPS.get(letter, letter) if state.fold else letter)
+        counts = bucket.counts
+        contains = bucket.contains
+        for letter in letters:
+            if not candidates:
+                break
+            count = revealed.get(letter, 0)
+            if count:
+                candidates &= counts.get(letter, {}).get(count, 0)
+            elif letter in contains:
+                candidates &= ~contains[letter]
+        return bucket, candidates
+
+    def hint(self, state):
+        """
+        Wybiera niezgadniętą literę obecną w największej liczbie kandydatów (w trybie łatwym litera bez
+        znaku diakrytycznego obejmuje też swój odpowiednik z nim).
+
+        Args:
+            state (engine.Round): bieżąca runda.
+
+        Returns:
+            Hint: litera (None, gdy żadne słowo z indeksu nie pasuje) i liczba kandydatów.
+        """
+        bucket, candidates = self.matches(state)
+        if not candidates:
+            return Hint(None, 0)
+        guessed = state.guessed
+        remaining = candidates.bit_count()
+        if state.fold:
+            contains, totals, order = bucket.folded, bucket.folded_totals, bucket.folded_order
+        else:
+            contains, totals, order = bucket.contains, bucket.totals, bucket.order
+        best, best_count = None, 0
+        for letter in order:
+            if totals[letter] <= best_count or best_count == remaining:
+                break
+            if letter in guessed:
+                continue
+            count = (candidates & contains[letter]).bit_count()
+            if count > best_count:
+                best, best_count = letter, count
+        return Hint(best, remaining)
+
+    def candidates(self, state, limit=10):
+        """
+        Returns:
+            list: do limit słów zgodnych ze stanem rundy.
+        """
+        bucket, candidates = self.matches(state)
+        words = []
+        while candidates and len(words) < limit:
+            lowest = candidates & -candidates
+            words.append(self.texts[bucket.indexes[lowest.bit_length() - 1]])
+            candidates ^= lowest
+        return words
+
+    def next_letter(self, state):
+        """
+        Strategia zgadywania: litera z hint, a gdy słowa nie ma w indeksie — według częstości w korpusie.
+
+        Returns:
+            str: następna litera do zgadnięcia.
+        """
+        letter = self.hint(state).letter
+        if letter is None:
+            if self.fallback is None:
+                self.fallback = FrequencyStrategy(self.texts)
+            letter = self.fallback.next_letter(state)
+        return letter
@@ -0,0 +1,157 @@
+"""
+Statystyki graczy i ranking — agregaty aktualizowane przyrostowo (UPSERT), bez przeliczania historii.
+"""
+import threading
+
+LEADERBOARD_SIZE = 10
+
+
+class StatsStore:
+    """
+    Zbiorcze statystyki: per gracz i tryb (wyniki, serie, średnia pozostałych prób) oraz per gracz i kategoria.
+    Rundy i wyniki gier są buforowane (pod blokadą — dodawane w wątku Tk) i zapisywane przez flush, także
+    w wątku roboczym; odczyty bez połączenia najpierw zapisują bufor.
+    """
+
+    def __init__(self, conn):
+        """
+        Args:
+            conn (sqlite3.Connection): połączenie z bazą użytkowników (Database.conn — tabele tworzy schemat
+                bazy danych).
+        """
+        self.conn = conn
+        self.pending_rounds = []
+        self.pending_games = []
+        self.lock = threading.Lock()
+
+    def record_round(self, username, mode, category, won, tries_left):
+        """
+        Buforuje wynik jednej rundy; zapis następuje przy flush.
+
+        Args:
+            username (str): gracz.
+            mode (str): 'normal', 'timed' albo 'multiplayer'.
+            category (str): kategoria słowa.
+            won (bool): czy słowo zostało odgadnięte.
+            tries_left (int): pozostałe próby.
+        """
+        solved = 1 if won else 0
+        with self.lock:
+            self.pending_rounds.append((username, mode, category, solved, tries_left if won else 0))
+
+    def record_game(self, mode, scores):
+        """
+        Buforuje wyniki zakończonej gry; zapis następuje przy flush, w jednej transakcji z rundami tej gry.
+
+        Args:
+            mode (str): 'normal', 'timed' albo 'multiplayer'.
+            scores (dict): wynik końcowy każdego gracza {gracz: wynik}.
+        """
+        with self.lock:
+            self.pending_games.extend((username, mode, score) for username, score in scores.items())
+
+    def flush(self, conn=None):
+        """
+        Zapisuje zbuforowane rundy i wyniki gier w jednej transakcji, w kolejności dodania (serie zależą od
+        kolejności rund); przy błędzie wracają do bufora.
+
+        Args:
+            conn (sqlite3.Connection): połączenie bieżącego wątku, domyślnie połączenie magazynu.
+        """
+        with self.lock:
+            rounds, self.pending_rounds = self.pending_rounds, []
+            games, self.pending_games = self.pending_games, []
+        if not rounds and not games:
+            return
+        conn = self.conn if conn is None else conn
+        try:
+            with conn:
+                self.write(conn, rounds, games)
+        except Exception:
+            with self.lock:
+                self.pending_rounds[:0] = rounds
+                self.pending_games[:0] = games
+            raise
+
+    def write(self, conn, rounds, games):
+        """
+        Wykonuje UPSERT-y rund i wyników gier w bieżącej transakcji połączenia conn.
+        """
+        conn.executemany("""
+            INSERT INTO user_stats (username, mode, rounds, solved, tries_left_total, streak, best_streak)
+            VALUES (?1, ?2, 1, ?4, ?5, ?4, ?4)
+            ON CONFLICT (username, mode) DO UPDATE SET
+                rounds = rounds + 1,
+                solved = solved + excluded.solved,
+                tries_left_total = tries_left_total + excluded.tries_left_total,
+                streak = CASE WHEN excluded.solved THEN streak + 1 ELSE 0 END,
+                best_streak = MAX(best_streak, CASE WHEN excluded.solved THEN streak + 1 ELSE 0 END)
+        """, rounds)
+        conn.executemany("""
+            INSERT INTO category_stats (username, category, rounds, solved) VALUES (?, ?, 1, ?)
+            ON CONFLICT (username, category) DO UPDATE SET
+                rounds = rounds + 1,
+                solved = solved + excluded.solved
+        """, [(username, category, solved) for username, mode, category, solved, tries in rounds])
+        conn.executemany("""
+            INSERT INTO user_stats (username, mode, games, best_score, total_score) VALUES (?1, ?2, 1, ?3, ?3)
+            ON CONFLICT (username, mode) DO UPDATE SET
+                games = games + 1,
+                best_score = MAX(best_score, excluded.best_score),
+                total_score = total_score + excluded.total_score
+        """, games)
+
+    def reader(self, conn):
+        """
+        Returns:
+            sqlite3.Connection: conn albo — po zapisaniu bufora — połączenie magazynu.
+        """
+        if conn is None:
+            self.flush()
+            conn = self.conn
+        return conn
+
+    def leaderboard(self, mode, limit=LEADERBOARD_SIZE, conn=None):
+        """
+        Zwraca najlepszych graczy z kontami w danym trybie (odczyt po indeksie user_stats_leaderboard; wpisy
+        gości multiplayer zapisane przez starsze wersje gry są pomijane).
+
+        Args:
+            conn (sqlite3.Connection): połączenie do odczytu (np. wątku roboczego); bufor jest wtedy zapisywany
+                wcześniej przez wywołującego. Domyślnie połączenie magazynu.
+
+        Returns:
+            list: krotki (gracz, najlepszy wynik, liczba gier, procent odgadniętych słów).
+        """
+        return self.reader(conn).execute("""
+            SELECT username, best_score, games, 100.0 * solved / MAX(rounds, 1)
+            FROM user_stats WHERE mode = ? AND games > 0 AND username IN (SELECT username FROM users)
+            ORDER BY best_score DESC LIMIT ?
+        """, (mode, limit)).fetchall()
+
+    def user_summary(self, username, conn=None):
+        """
+        Args:
+            conn (sqlite3.Connection): połączenie do odczytu (patrz leaderboard).
+
+        Returns:
+            list: krotki (tryb, gry, najlepszy wynik, procent odgadniętych, średnio pozostałych prób, najdłuższa seria).
+        """
+        return self.reader(conn).execute("""
+            SELECT mode, games, best_score, 100.0 * solved / MAX(rounds, 1),
+                   1.0 * tries_left_total / MAX(solved, 1), best_streak
+            FROM user_stats WHERE username = ? ORDER BY mode
+        """, (username,)).fetchall()
+
+    def category_accuracy(self, username, conn=None):
+        """
+        Args:
+            conn (sqlite3.Connection): połączenie do odczytu (patrz leaderboard).
+
+        Returns:
+            list: krotki (kategoria, rundy, procent odgadniętych) posortowane po kategorii.
+        """
+        return self.reader(conn).execute("""
+            SELECT category, rounds, 100.0 * solved / rounds
+            FROM category_stats WHERE username = ? ORDER BY category
+        """, (username,)).fetchall()
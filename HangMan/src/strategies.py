@@ -0,0 +1,124 @@
+"""
+Strategie zgadywania liter dla symulacji i benchmarków (losowa, według częstości, optymalna).
+"""
+import random
+from collections import Counter
+
+ALPHABET = "aąbcćdeęfghijklłmnńoóprsśtuwyzźżqvx"
+SEPARATORS = " -"
+
+
+def letter_frequencies(words):
+    """
+    Liczy, w ilu słowach występuje każda litera (spacje i łączniki w hasłach są pomijane).
+
+    Args:
+        words (iterable): słowa.
+
+    Returns:
+        collections.Counter: litera -> liczba słów, w których występuje.
+    """
+    counts = Counter()
+    for word in words:
+        counts.update(set(word))
+    for separator in SEPARATORS:
+        counts.pop(separator, None)
+    return counts
+
+
+class RandomStrategy:
+    """
+    Zgaduje niewykorzystane litery alfabetu w losowej kolejności.
+    """
+
+    def __init__(self, alphabet=ALPHABET, seed=None):
+        self.alphabet = list(alphabet)
+        self.rng = random.Random(seed)
+
+    def next_letter(self, state):
+        """
+        Args:
+            state (engine.Round): bieżąca runda.
+
+        Returns:
+            str: następna litera do zgadnięcia.
+        """
+        guessed = state.guessed
+        letters = [letter for letter in self.alphabet if letter not in guessed]
+        return self.rng.choice(letters)
+
+
+class FrequencyStrategy:
+    """
+    Zgaduje litery w stałej kolejności — od najczęściej występujących w korpusie.
+    """
+
+    def __init__(self, words):
+        """
+        Args:
+            words (iterable): korpus słów, z którego liczone są częstości.
+        """
+        counts = letter_frequencies(words)
+        self.order = sorted(counts, key=counts.__getitem__, reverse=True)
+        self.order += [letter for letter in ALPHABET if letter not in counts]
+
+    def next_letter(self, state):
+        guessed = state.guessed
+        for letter in self.order:
+            if letter not in guessed:
+                return letter
+        raise ValueError("no letters left to guess")
+
+
+class OptimalStrategy:
+    """
+    Zawęża zbiór kandydatów do słów zgodnych ze wzorcem i wybiera literę obecną w największej ich liczbie.
+    """
+
+    def __init__(self, words):
+        """
+        Args:
+            words (iterable): słowa, które mogą zostać wylosowane.
+        """
+        self.by_length = {}
+        for word in words:
+            self.by_length.setdefault(len(word), []).append(word)
+        self.fallback = FrequencyStrategy(words)
+        self.state = None
+        self.candidates = []
+        self.seen = 0
+
+    def next_letter(self, state):
+        if state is not self.state:
+            self.state = state
+            self.candidates = self.by_length.get(len(state.word), [])
+            self.seen = 0
+        guessed = state.guessed
+        if self.seen != len(guessed):
+            display = state.display
+            known = [(index, letter) for index, letter in enumerate(display) if letter != '_']
+            hidden = [index for index, letter in enumerate(display) if letter == '_']
+            self.candidates = [word for word in self.candidates
+                               if all(word[index] == letter for index, letter in known)
+                               and not any(word[index] in guessed for index in hidden)]
+            self.seen = len(guessed)
+        counts = letter_frequencies(self.candidates)
+        best = max((letter for letter in counts if letter not in guessed), key=counts.__getitem__, default=None)
+        return best if best is not None else self.fallback.next_letter(state)
+
+
+def pattern_strategy(words, seed=None):
+    """
+    Returns:
+        solver.PatternIndex: strategia optymalna liczona na indeksie wzorców (zbiory bitowe zamiast filtrowania list).
+    """
+    from solver import PatternIndex
+    return PatternIndex(words)
+
+
+STRATEGIES = {
+    'random': lambda words, seed=None: RandomStrategy(seed=seed),
+    'frequency': lambda words, seed=None: FrequencyStrategy(words),
+    'optimal': lambda words, seed=None: OptimalStrategy(words),
+    'pattern': pattern_strategy,
+}
@@ -0,0 +1,190 @@
+"""
+Pula słów wczytana jednorazowo z tabeli words — losowanie w czasie O(1) zamiast ORDER BY RANDOM().
+"""
+import bisect
+import random
+
+from engine import Word
+
+
+class WordPool:
+    """
+    Słowa z bazy trzymane w pamięci wraz z indeksem kategorii.
+    """
+
+    def __init__(self, conn, load=True):
+        """
+        Args:
+            conn (sqlite3.Connection): połączenie z bazą zawierającą tabelę words.
+            load (bool): wczytuje słowa od razu; False pozwala wczytać je później przez fetch/extend
+                (np. fetch w wątku roboczym).
+        """
+        self.conn = conn
+        self.ids = []
+        self.texts = []
+        self.categories = []
+        self.entries = []
+        self.by_category = {}
+        self.last_id = 0
+        if load:
+            self.refresh()
+
+    def __len__(self):
+        return len(self.texts)
+
+    def refresh(self):
+        """
+        Doczytuje tylko wiersze dodane od ostatniego odświeżenia (id rośnie dzięki AUTOINCREMENT).
+
+        Returns:
+            int: liczba nowych słów.
+        """
+        return self.extend(self.fetch())
+
+    def fetch(self, conn=None):
+        """
+        Pobiera z bazy wiersze dodane od ostatniego odświeżenia, nie zmieniając puli — może działać w wątku
+        roboczym, a wynik trafia do extend w wątku, który korzysta z puli.
+
+        Args:
+            conn (sqlite3.Connection): połączenie do odczytu, domyślnie połączenie puli.
+
+        Returns:
+            list: krotki (id, słowo, kategoria).
+        """
+        return (conn or self.conn).execute(
+            "SELECT id, text, category FROM words WHERE id > ? ORDER BY id", (self.last_id,)).fetchall()
+
+    def extend(self, rows):
+        """
+        Dopisuje do puli wiersze z fetch (pomija te, które już są).
+
+        Returns:
+            int: liczba nowych słów.
+        """
+        added = 0
+        for word_id, text, category in rows:
+            if word_id <= self.last_id:
+                continue
+            index = len(self.texts)
+            self.ids.append(word_id)
+            self.texts.append(text)
+            self.categories.append(category)
+            self.entries.append(None)
+            self.by_category.setdefault(category, []).append(index)
+            self.last_id = word_id
+            added += 1
+        return added
+
+    def word(self, index):
+        """
+        Zwraca słowo z indeksem pozycji liter, budowanym przy pierwszym użyciu i zapamiętywanym w puli.
+
+        Args:
+            index (int): pozycja słowa w puli.
+
+        Returns:
+            Word: słowo z indeksem liter.
+        """
+        entry = self.entries[index]
+        if entry is None:
+            entry = self.entries[index] = Word(self.texts[index], self.categories[index], self.ids[index])
+        return entry
+
+    def index_of(self, word_id):
+        """
+        Znajduje pozycję słowa po id (lista ids jest rosnąca, więc wystarcza wyszukiwanie binarne).
+
+        Returns:
+            int: pozycja słowa w puli albo None, gdy słowa nie ma.
+        """
+        index = bisect.bisect_left(self.ids, word_id)
+        if index < len(self.ids) and self.ids[index] == word_id:
+            return index
+        return None
+
+    def sample_index(self, category=None, rng=random):
+        """
+        Losuje jednostajnie pozycję słowa z całej puli lub z jednej kategorii.
+
+        Args:
+            category (str): kategoria albo None dla wszystkich słów.
+            rng (random.Random): źródło losowości.
+
+        Returns:
+            int: pozycja słowa w puli.
+        """
+        if category is None:
+            return rng.randrange(len(self.texts))
+        indexes = self.by_category[category]
+        return indexes[rng.randrange(len(indexes))]
+
+    def sample(self, category=None, rng=random):
+        """
+        Losuje słowo (ze zwracaniem).
+
+        Returns:
+            Word: słowo z indeksem liter.
+        """
+        return self.word(self.sample_index(category, rng))
+
+
+class ShuffleBag:
+    """
+    Losowanie bez powtórzeń w obrębie sesji — każde słowo wypada raz, zanim pula zacznie się od nowa.
+    Słowa dodane do puli w trakcie sesji trafiają do bieżącego cyklu. Permutacja jest rzadka: pamiętane są
+    tylko pozycje przestawione przez dotychczasowe losowania, więc pamięć rośnie z liczbą losowań, nie z pulą.
+    """
+
+    def __init__(self, pool, category=None, rng=random):
+        """
+        Args:
+            pool (WordPool): pula słów.
+            category (str): kategoria albo None dla wszystkich słów.
+            rng (random.Random): źródło losowości.
+        """
+        self.pool = pool
+        self.category = category
+        self.rng = rng
+        self.order = {}
+        self.position = 0
+
+    def __len__(self):
+        if self.category is None:
+            return len(self.pool)
+        return len(self.pool.by_category.get(self.category, ()))
+
+    def reset(self):
+        """
+        Zaczyna nowy cykl losowania (np. na początku kolejnej sesji).
+        """
+        self.order = {}
+        self.position = 0
+
+    def draw_index(self):
+        """
+        Losuje pozycję słowa w puli (krok tasowania Fishera-Yatesa).
+
+        Returns:
+            int: pozycja słowa w puli.
+        """
+        order = self.order
+        size = len(self)
+        if self.position >= size:
+            self.position = 0
+            order.clear()
+        position = self.position
+        pick = self.rng.randrange(position, size)
+        chosen = order.get(pick, pick)
+        current = order.pop(position, position)
+        if pick != position:
+            order[pick] = current
+        self.position = position + 1
+        return chosen if self.category is None else self.pool.by_category[self.category][chosen]
+
+    def draw(self):
+        """
+        Returns:
+            Word: słowo z indeksem liter.
+        """
+        return self.pool.word(self.draw_index())
@@ -0,0 +1,174 @@
+"""
+Wykonawca operacji wejścia-wyjścia dla interfejsu Tk: zadania działają w puli wątków, a wyniki, błędy
+i postęp wracają przez kolejkę odczytywaną w pętli Tk (root.after), więc callbacki zawsze działają w wątku Tk.
+"""
+import queue
+import threading
+
+MAX_WORKERS = 2
+MAX_PENDING = 16
+POLL_INTERVAL = 20
+
+DONE = 0
+FAILED = 1
+PROGRESS = 2
+
+
+class Task:
+    """
+    Zlecone zadanie: callbacki wyniku, błędu, postępu i anulowania oraz flaga anulowania.
+    """
+    __slots__ = ("callback", "on_error", "on_progress", "on_cancel", "cooperative", "cancelled", "future", "progress",
+                 "progress_queued", "lock")
+
+    def __init__(self, callback, on_error, on_progress, on_cancel=None, cooperative=False):
+        self.callback = callback
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+        self.cooperative = cooperative
+        self.cancelled = threading.Event()
+        self.future = None
+        self.progress = None
+        self.progress_queued = False
+        self.lock = threading.Lock()
+
+    def cancel(self):
+        """
+        Anuluje zadanie: jeśli jeszcze nie ruszyło, nie zostanie wykonane. Działające zadanie z cancellable=True
+        dostaje sygnał przez zdarzenie cancel i samo decyduje, co zwrócić (wynik trafia do callbacku);
+        wynik pozostałych jest pomijany. W każdym przypadku zadanie kończy dokładnie jeden callback — przy
+        pominiętym wyniku jest to on_cancel.
+        """
+        self.cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+
+class IOExecutor:
+    """
+    Pula wątków dla bazy danych i plików z kolejką wyników odczytywaną w pętli Tk.
+
+    Przeciwciśnienie: najwyżej max_pending zadań naraz (submit zwraca None, gdy limit jest osiągnięty), a postęp
+    zadania jest scalany — w kolejce czeka co najwyżej jedna, zawsze najnowsza, wiadomość o postępie.
+    """
+
+    def __init__(self, root, max_workers=MAX_WORKERS, max_pending=MAX_PENDING, poll_interval=POLL_INTERVAL):
+        """
+        Args:
+            root (tkinter.Misc): obiekt z metodą after (np. tk.Tk).
+            max_workers (int): liczba wątków.
+            max_pending (int): maksymalna liczba zadań zleconych i niezakończonych.
+            poll_interval (int): odstęp odczytu kolejki wyników w ms.
+        """
+        self.root = root
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.poll_interval = poll_interval
+        self.pool = None
+        self.results = queue.SimpleQueue()
+        self.pending = 0
+        self.polling = False
+
+    @property
+    def busy(self):
+        return self.pending >= self.max_pending
+
+    def submit(self, function, *args, callback=None, on_error=None, on_progress=None, on_cancel=None,
+               cancellable=False, **kwargs):
+        """
+        Zleca function(*args, **kwargs) w wątku roboczym.
+
+        Args:
+            function (callable): funkcja wykonywana poza wątkiem Tk.
+            callback (callable): wywoływana w wątku Tk z wynikiem.
+            on_error (callable): wywoływana w wątku Tk z wyjątkiem (domyślnie wyjątek jest pomijany).
+            on_progress (callable): wywoływana w wątku Tk z najnowszą wartością postępu; function dostaje
+                wtedy argument progress.
+            on_cancel (callable): wywoływana bez argumentów w wątku Tk, gdy zadanie anulowano, zanim ruszyło,
+                albo (bez cancellable) jego wynik został pominięty — np. żeby zamknąć okno postępu.
+            cancellable (bool): przekazuje function argument cancel (threading.Event ustawiany przez Task.cancel).
+
+        Returns:
+            Task: zadanie albo None, gdy limit zadań jest osiągnięty.
+        """
+        if self.busy:
+            return None
+        if self.pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="io")
+        task = Task(callback, on_error, on_progress, on_cancel, cancellable)
+        if on_progress is not None:
+            kwargs['progress'] = lambda value: self.report(task, value)
+        if cancellable:
+            kwargs['cancel'] = task.cancelled
+        self.pending += 1
+        task.future = self.pool.submit(self.run, task, function, args, kwargs)
+        task.future.add_done_callback(lambda future: future.cancelled() and self.results.put((task, DONE, None)))
+        if not self.polling:
+            self.polling = True
+            self.root.after(self.poll_interval, self.poll)
+        return task
+
+    def run(self, task, function, args, kwargs):
+        """
+        Wykonuje zadanie w wątku roboczym i odkłada wynik albo wyjątek do kolejki.
+        """
+        try:
+            self.results.put((task, DONE, function(*args, **kwargs)))
+        except Exception as e:
+            self.results.put((task, FAILED, e))
+
+    def report(self, task, value):
+        """
+        Zapisuje postęp zadania (wywoływane z wątku roboczego); do kolejki trafia tylko jedno powiadomienie naraz.
+        """
+        with task.lock:
+            task.progress = value
+            if task.progress_queued:
+                return
+            task.progress_queued = True
+        self.results.put((task, PROGRESS, None))
+
+    def poll(self):
+        """
+        Odbiera wyniki w wątku Tk i wywołuje callbacki; planuje kolejny odczyt, dopóki są zadania w toku.
+        """
+        try:
+            while True:
+                try:
+                    task, kind, value = self.results.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == PROGRESS:
+                    with task.lock:
+                        value, task.progress_queued = task.progress, False
+                    if task.on_progress is not None and not task.cancelled.is_set():
+                        task.on_progress(value)
+                    continue
+                self.pending -= 1
+                if task.cancelled.is_set() and (not task.cooperative or task.future.cancelled()):
+                    if task.on_cancel is not None:
+                        task.on_cancel()
+                    continue
+                if kind == DONE:
+                    if task.callback is not None:
+                        task.callback(value)
+                elif task.on_error is not None:
+                    task.on_error(value)
+        finally:
+            if self.pending:
+                self.root.after(self.poll_interval, self.poll)
+            else:
+                self.polling = False
+
+    def shutdown(self, wait=False):
+        """
+        Zatrzymuje pulę; zadania, które nie ruszyły, są porzucane.
+
+        Args:
+            wait (bool): czeka na zakończenie zadań już wykonywanych.
+        """
+        if self.pool is not None:
+            self.pool.shutdown(wait=wait, cancel_futures=True)
+            self.pool = None
@@ -0,0 +1,91 @@
+"""
+Testy korpusu mmap: ranking trudności zapisany w pliku i leniwy indeks podpowiedzi muszą dawać to samo,
+co indeksy budowane nad pulą na stercie.
+
+Uruchomienie: python -m unittest discover HangMan/tests (albo pytest).
+"""
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import corpus
+from difficulty import DifficultyIndex
+from engine import HangmanEngine
+from solver import PatternIndex
+
+LETTERS = "aąbcćdeęfghijklłmnńoóprsśtuwyzźż"
+CATEGORIES = ["Zwierzęta", "Rośliny", "Miasta"]
+
+
+class CorpusIndexesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        rng = random.Random(7)
+        words = {''.join(rng.choices(LETTERS, k=rng.randint(3, 9))) for _ in range(3000)}
+        cls.source = str(Path(cls.directory.name, 'words.txt'))
+        with open(cls.source, 'w', encoding='utf-8') as file:
+            for word in sorted(words):
+                file.write(f"{word};{rng.choice(CATEGORIES)}\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def open(self, **options):
+        path = str(Path(self.directory.name, 'words.corpus'))
+        corpus.build([self.source], path, **options)
+        return corpus.Corpus(path)
+
+    def test_ranking_matches_difficulty_index(self):
+        with self.open() as words:
+            expected = DifficultyIndex(words)
+            index = words.difficulty_index()
+            self.assertIs(words.difficulty_index(), index)
+            self.assertEqual(list(index.all.indexes), expected.all.indexes)
+            for category in CATEGORIES:
+                self.assertEqual(list(index.scores(category).indexes), expected.scores(category).indexes)
+                self.assertEqual(len(index.scores(category).keys), len(words.by_category[category]))
+            for band in ('easy', 'medium', 'hard'):
+                self.assertEqual(index.sample_band(band, rng=random.Random(1)),
+                                 expected.sample_band(band, rng=random.Random(1)))
+            self.assertEqual(index.sample_range(0.4, 0.6, "Miasta", random.Random(2)),
+                             expected.sample_range(0.4, 0.6, "Miasta", random.Random(2)))
+            self.assertEqual(index.refresh(), 0)
+
+    def test_lazy_hints_match_eager_index(self):
+        with self.open() as words:
+            eager = PatternIndex(list(words.texts), list(words.categories))
+            lazy = PatternIndex(words.texts, words.categories, words.by_category)
+            self.assertEqual(lazy.groups, {})
+            self.assertEqual(lazy.indexed, len(words))
+            rng = random.Random(3)
+            for _ in range(50):
+                entry = words.sample(rng=rng)
+                engine = HangmanEngine(lambda: entry)
+                engine.start_singleplayer(False)
+                for letter in rng.sample(sorted(set(entry.text)), 2) + [rng.choice(LETTERS)]:
+                    engine.guess(letter)
+                    if engine.round.remaining == 0:
+                        break
+                hint, expected = engine.hint(lazy), engine.hint(eager)
+                self.assertEqual((hint.letter, hint.candidates), (expected.letter, expected.candidates))
+            self.assertLessEqual(lazy.grouped, set(CATEGORIES))
+            self.assertIsNone(lazy.bucket(4, "Nieznana"))
+
+    def test_optional_sections(self):
+        with self.open(masks=False) as words:
+            self.assertIsNone(words.masks)
+            self.assertIsNotNone(words.difficulty_index())
+            self.assertEqual(words.mask(0), corpus.letter_mask(words.texts[0]))
+        with self.open(ranks=False) as words:
+            self.assertIsNotNone(words.masks)
+            self.assertIsNone(words.difficulty_index())
+
+
+if __name__ == '__main__':
+    unittest.main()
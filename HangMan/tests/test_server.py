@@ -0,0 +1,124 @@
+"""
+Testy serwera multiplayer: pełna gra przez TCP i zamykanie pokoi.
+
+Uruchomienie: python -m unittest discover HangMan/tests (albo pytest).
+"""
+import asyncio
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from engine import Word
+from server import HangmanServer
+
+MISSES = "abcdefghijlmnprsuwyz"
+
+
+class Player:
+    """
+    Połączenie testowe: wysyła polecenia i czeka na zdarzenia serwera.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, **message):
+        self.writer.write(json.dumps(message).encode() + b'\n')
+        await self.writer.drain()
+
+    async def receive(self, *events):
+        while True:
+            message = json.loads(await asyncio.wait_for(self.reader.readline(), 5))
+            if not events or message["event"] in events:
+                return message
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+class ServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = HangmanServer(lambda: Word("kot", "Zwierzeta", 1), max_rooms=5)
+        self.tcp = await self.server.serve('127.0.0.1', 0)
+        self.port = self.tcp.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.tcp.close()
+        await self.tcp.wait_closed()
+
+    async def connect(self):
+        return Player(*await asyncio.open_connection('127.0.0.1', self.port))
+
+    async def play_room(self, players):
+        """
+        Tworzy pokój, dołącza graczy i rozgrywa grę do końca samymi pudłami.
+
+        Returns:
+            dict: zdarzenie "over".
+        """
+        await players[0].send(op="create")
+        room = (await players[0].receive("created"))["room"]
+        for seat, player in enumerate(players):
+            await player.send(op="join", room=room, name=f"p{seat}")
+            await player.receive("joined")
+        await players[0].send(op="start")
+        state = await players[0].receive("state")
+        for player in players[1:]:
+            await player.receive("state")
+        misses = iter(MISSES)
+        while True:
+            seat = int(state["turn"][1:])
+            await players[seat].send(op="guess", letter=next(misses))
+            messages = [await player.receive("state", "over") for player in players]
+            state = messages[0]
+            if state["event"] == "over":
+                return state
+
+    async def test_players_can_join_again_after_game_over(self):
+        players = [await self.connect(), await self.connect()]
+        over = await self.play_room(players)
+        self.assertEqual(over["scores"], {"p0": 0, "p1": 0})
+        self.assertEqual(self.server.rooms, {})
+        await players[1].send(op="guess", letter="k")
+        self.assertEqual((await players[1].receive())["message"], "game not started")
+        over = await self.play_room(players)
+        self.assertEqual(over["event"], "over")
+        for player in players:
+            await player.close()
+
+    async def test_disconnect_after_game_over_sends_nothing(self):
+        players = [await self.connect(), await self.connect()]
+        await self.play_room(players)
+        await players[0].close()
+        await players[1].send(op="create")
+        self.assertEqual((await players[1].receive())["event"], "created")
+        await players[1].close()
+
+    async def test_unjoined_rooms_are_closed_on_disconnect(self):
+        player = await self.connect()
+        for _ in range(4):
+            await player.send(op="create")
+            self.assertEqual((await player.receive())["event"], "created")
+        await player.send(op="create")
+        self.assertEqual((await player.receive())["message"], "too many rooms")
+        await player.close()
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.server.rooms, {})
+
+    async def test_join_rejects_invalid_room_ids(self):
+        player = await self.connect()
+        await player.send(op="create")
+        await player.receive("created")
+        for room in ([1], True, "1", None):
+            await player.send(op="join", room=room, name="p0")
+            self.assertEqual((await player.receive())["message"], "no such room")
+        await player.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Testy PatternIndex: budowa i odświeżanie grup słów, także gdy pula rośnie w trakcie budowy.
+
+Uruchomienie: python -m unittest discover HangMan/tests (albo pytest).
+"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from solver import PatternIndex
+
+
+class GrowingList(list):
+    """
+    Lista, która zaraz po odczytaniu długości dopisuje kolejne elementy — jak WordPool.extend w wątku Tk
+    w trakcie budowy indeksu w wątku roboczym.
+    """
+
+    def __init__(self, items, extra):
+        super().__init__(items)
+        self.extra = list(extra)
+
+    def __len__(self):
+        size = super().__len__()
+        if self.extra:
+            self.extend(self.extra)
+            self.extra = []
+        return size
+
+
+WORDS = ["kot", "pies", "koza", "lis", "sowa", "mysz", "ryba", "kura"]
+CATEGORIES = ["A", "A", "B", "A", "B", "A", "B", "B"]
+
+
+class PatternIndexTest(unittest.TestCase):
+    def assertIndexedOnce(self, index, size):
+        indexes = sorted(i for group in index.groups.values() for i in group)
+        self.assertEqual(indexes, list(range(size)))
+        for (length, category), group in index.groups.items():
+            for i in group:
+                self.assertEqual(len(index.texts[i]), length)
+                if index.categories is not None:
+                    self.assertEqual(index.categories[i], category)
+
+    def test_pool_growing_during_build(self):
+        texts = GrowingList(WORDS[:5], WORDS[5:])
+        categories = GrowingList(CATEGORIES[:5], CATEGORIES[5:])
+        index = PatternIndex(texts, categories)
+        self.assertEqual(index.indexed, 5)
+        self.assertIndexedOnce(index, 5)
+        self.assertEqual(index.refresh(), 3)
+        self.assertIndexedOnce(index, len(WORDS))
+
+    def test_pool_growing_during_build_without_categories(self):
+        index = PatternIndex(GrowingList(WORDS[:2], WORDS[2:]))
+        self.assertEqual(index.indexed, 2)
+        self.assertEqual(index.refresh(), len(WORDS) - 2)
+        self.assertIndexedOnce(index, len(WORDS))
+
+    def test_texts_ahead_of_categories(self):
+        texts = list(WORDS)
+        categories = CATEGORIES[:6]
+        index = PatternIndex(texts, categories)
+        self.assertEqual(index.indexed, 6)
+        categories.extend(CATEGORIES[6:])
+        index.refresh()
+        self.assertIndexedOnce(index, len(WORDS))
+
+    def test_refresh_drops_changed_buckets(self):
+        texts = list(WORDS[:4])
+        categories = list(CATEGORIES[:4])
+        index = PatternIndex(texts, categories)
+        self.assertEqual(index.bucket(4, "A").indexes, [1])
+        self.assertTrue(index.cached(4, "A"))
+        self.assertTrue(index.bucket(3, "A") is not None and index.cached(3, "A"))
+        texts.append("mysz")
+        categories.append("A")
+        index.refresh()
+        self.assertFalse(index.cached(4, "A"))
+        self.assertTrue(index.cached(3, "A"))
+        self.assertEqual(index.bucket(4, "A").indexes, [1, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Testy HistoryStore i StatsStore: bufory wypełniane w jednym wątku, zapisywane i czytane w innym.
+
+Uruchomienie: python -m unittest discover HangMan/tests (albo pytest).
+"""
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from database import Database
+from history import HistoryStore
+from stats import StatsStore
+
+
+def in_thread(function):
+    """
+    Wykonuje function w osobnym wątku (jak wątek store_io) i zwraca jej wynik.
+    """
+    result = []
+    thread = threading.Thread(target=lambda: result.append(function()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+class StoresTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = Database(str(Path(self.directory.name, 'users.db')), str(Path(self.directory.name, 'words.db')))
+        with self.db.conn:
+            self.db.conn.execute("INSERT INTO users (username, password) VALUES ('ala', 'x')")
+        self.history = HistoryStore(self.db.conn, batch_size=0)
+        self.stats = StatsStore(self.db.conn)
+
+    def tearDown(self):
+        self.db.close()
+        self.directory.cleanup()
+
+    def flush(self):
+        conn = self.db.conn
+        self.history.flush(conn)
+        self.stats.flush(conn)
+        return conn
+
+    def test_buffers_written_by_another_thread(self):
+        for won in (True, True, False, True):
+            self.stats.record_round('ala', 'normal', 'Animals', won, 3)
+        self.stats.record_game('normal', {'ala': 3})
+        self.history.add('ala', 'normal', 3, "game 1", played_at=1.0)
+        self.assertEqual(self.history.pending[0][4], "game 1")
+
+        def read():
+            conn = self.flush()
+            return (self.history.count('ala', conn=conn), self.stats.leaderboard('normal', conn=conn),
+                    self.stats.user_summary('ala', conn))
+
+        count, leaders, summary = in_thread(read)
+        self.assertEqual(count, 1)
+        self.assertEqual(leaders, [('ala', 3, 1, 75.0)])
+        self.assertEqual(summary[0][5], 2)
+        self.assertEqual(self.history.pending, [])
+        self.assertEqual(self.stats.pending_rounds, [])
+
+    def test_failed_flush_keeps_buffer(self):
+        self.stats.record_round('ala', 'normal', 'Animals', True, 2)
+        self.stats.record_game('normal', {'ala': 1})
+        self.history.add('ala', 'normal', 1, "game 1")
+        broken = sqlite3.connect(':memory:')
+        with self.assertRaises(sqlite3.OperationalError):
+            self.history.flush(broken)
+        with self.assertRaises(sqlite3.OperationalError):
+            self.stats.flush(broken)
+        broken.close()
+        self.assertEqual(len(self.history.pending), 1)
+        self.assertEqual(len(self.stats.pending_rounds), 1)
+        self.assertEqual(self.history.count('ala'), 1)
+        self.assertEqual(self.stats.leaderboard('normal'), [('ala', 1, 1, 100.0)])
+
+    def test_pages_read_in_worker(self):
+        for number in range(5):
+            self.history.add('ala', 'normal', number, f"game {number}", played_at=float(number))
+        in_thread(self.flush)
+        first = in_thread(lambda: self.history.page(None, 2, 'ala', conn=self.db.conn))
+        second = in_thread(lambda: self.history.page((first[-1][0], first[-1][5]), 2, 'ala', conn=self.db.conn))
+        self.assertEqual([row[4] for row in first + second], ["game 0", "game 1", "game 2", "game 3"])
+
+
+if __name__ == '__main__':
+    unittest.main()
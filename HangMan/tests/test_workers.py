@@ -0,0 +1,115 @@
+"""
+Testy IOExecutor z atrapą pętli Tk (after wywoływane ręcznie).
+
+Uruchomienie: python -m unittest discover HangMan/tests (albo pytest).
+"""
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from workers import IOExecutor
+
+
+class FakeRoot:
+    """
+    Zamiast pętli Tk: after odkłada funkcje, run wykonuje je, dopóki executor ma zadania.
+    """
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, function):
+        self.scheduled.append(function)
+
+    def run(self, executor, timeout=5):
+        deadline = time.monotonic() + timeout
+        while executor.pending and time.monotonic() < deadline:
+            scheduled, self.scheduled = self.scheduled, []
+            for function in scheduled:
+                function()
+            time.sleep(0.001)
+
+
+class IOExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.executor = IOExecutor(self.root, max_workers=1)
+        self.release = threading.Event()
+        self.events = []
+
+    def tearDown(self):
+        self.release.set()
+        self.executor.shutdown()
+
+    def occupy_worker(self):
+        self.executor.submit(self.release.wait, callback=lambda result: self.events.append("blocker"))
+
+    def submit(self, function, **kwargs):
+        return self.executor.submit(function, callback=lambda result: self.events.append(("done", result)),
+                                    on_error=lambda error: self.events.append(("error", error)),
+                                    on_cancel=lambda: self.events.append("cancelled"), **kwargs)
+
+    def test_cancel_before_start_calls_on_cancel(self):
+        self.occupy_worker()
+        task = self.submit(lambda cancel: "finished", cancellable=True)
+        task.cancel()
+        self.release.set()
+        self.root.run(self.executor)
+        self.assertEqual(self.executor.pending, 0)
+        self.assertCountEqual(self.events, ["blocker", "cancelled"])
+
+    def test_cancel_of_running_cooperative_task_delivers_result(self):
+        started = threading.Event()
+
+        def work(cancel):
+            started.set()
+            cancel.wait(5)
+            return "partial"
+
+        task = self.submit(work, cancellable=True)
+        started.wait(5)
+        task.cancel()
+        self.root.run(self.executor)
+        self.assertEqual(self.events, [("done", "partial")])
+
+    def test_cancel_of_running_plain_task_calls_on_cancel(self):
+        started = threading.Event()
+
+        def work():
+            started.set()
+            self.release.wait(5)
+            return "ignored"
+
+        task = self.submit(work)
+        started.wait(5)
+        task.cancel()
+        self.release.set()
+        self.root.run(self.executor)
+        self.assertEqual(self.events, ["cancelled"])
+
+    def test_result_and_error_callbacks(self):
+        self.submit(lambda: 42)
+        self.submit(lambda: 1 / 0)
+        self.root.run(self.executor)
+        self.assertEqual(self.events[0], ("done", 42))
+        self.assertEqual(self.events[1][0], "error")
+        self.assertIsInstance(self.events[1][1], ZeroDivisionError)
+
+    def test_submit_returns_none_when_full(self):
+        executor = IOExecutor(self.root, max_workers=1, max_pending=2)
+        executor.submit(self.release.wait)
+        executor.submit(self.release.wait)
+        self.assertIsNone(executor.submit(lambda: None))
+        self.release.set()
+        self.root.run(executor)
+        self.assertIsNotNone(executor.submit(lambda: None))
+        self.root.run(executor)
+        executor.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()